@@ -0,0 +1 @@
+"""Benchmarks of performance-sensitive code."""
@@ -0,0 +1,82 @@
+"""Benchmark counting the edge crossings between two dense layers.
+
+Compares pairwise counting, which was used before, with the Fenwick tree and
+NumPy counters, checking they all agree.
+
+Run with `python -m benchmarks.crossing_count`.
+"""
+
+import functools
+import itertools
+import random
+import timeit
+from collections.abc import Callable, Sequence
+
+from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_ordering.utils import (
+    count_crossings,
+    count_crossings_numpy,
+)
+
+_LAYER_SIZES = [10, 30, 100, 300, 1000]
+# Fraction of possible edges between the two layers that are present
+_DENSITY = 0.2
+# Pairwise counting is quadratic, so is skipped above this many edges
+_MAX_PAIRWISE_NEDGES = 5000
+_SEED = 0
+
+
+def _count_crossings_pairwise(edges: Sequence[tuple[int, int]]) -> int:
+    return sum(
+        1
+        for (source1, target1), (source2, target2) in itertools.combinations(edges, 2)
+        if (source1 < source2 and target1 > target2)
+        or (source1 > source2 and target1 < target2)
+    )
+
+
+def _generate_edges(layer_size: int, rng: random.Random) -> list[tuple[int, int]]:
+    return [
+        (source, target)
+        for source in range(layer_size)
+        for target in range(layer_size)
+        if rng.random() < _DENSITY
+    ]
+
+
+def _time(count: Callable[[], int]) -> tuple[int, float]:
+    timer = timeit.Timer(count)
+    number, _ = timer.autorange()
+    return count(), min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main() -> None:
+    """Print the time taken by each counter for increasingly large layers."""
+    rng = random.Random(_SEED)
+    headings = ["layer size", "edges", "pairwise", "fenwick", "numpy"]
+    print(" ".join(f"{heading:>10}" for heading in headings))
+    for layer_size in _LAYER_SIZES:
+        edges = _generate_edges(layer_size, rng)
+
+        ncrossings, fenwick_time = _time(functools.partial(count_crossings, edges))
+        numpy_ncrossings, numpy_time = _time(
+            functools.partial(count_crossings_numpy, edges)
+        )
+        assert numpy_ncrossings == ncrossings
+
+        pairwise_time_text = "-"
+        if len(edges) <= _MAX_PAIRWISE_NEDGES:
+            pairwise_ncrossings, pairwise_time = _time(
+                functools.partial(_count_crossings_pairwise, edges)
+            )
+            assert pairwise_ncrossings == ncrossings
+            pairwise_time_text = f"{pairwise_time * 1000:.3f}"
+
+        print(
+            f"{layer_size:>10} {len(edges):>10} {pairwise_time_text:>10} "
+            f"{fenwick_time * 1000:>10.3f} {numpy_time * 1000:>10.3f}"
+        )
+    print("Times are in milliseconds")
+
+
+if __name__ == "__main__":
+    main()
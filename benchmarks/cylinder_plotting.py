@@ -0,0 +1,135 @@
+"""Benchmark plotting and drawing the task cylinders of a network graph.
+
+Compares plotting each cylinder as its own surface and end-cap patches, which
+was done before, with plotting them all as a single collection.
+
+Run with `python -m benchmarks.cylinder_plotting`.
+"""
+
+import random
+import time
+from collections.abc import Callable, Sequence
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib import patches
+from matplotlib import pyplot as plt
+from mpl_toolkits import mplot3d
+from mpl_toolkits.mplot3d import art3d
+
+from graft.layers.presentation.tkinter_gui.helpers.colour import BLACK, BLUE
+from graft.layers.presentation.tkinter_gui.helpers.static_task_network_graph.cylinder_plotting import (
+    CylinderDrawingProperties,
+    CylinderLabel,
+    CylinderLabelDrawingProperties,
+    XAxisCylinderPosition,
+    plot_x_axis_cylinders,
+)
+from graft.layers.presentation.tkinter_gui.task_network_graph_drawing import Radius
+
+_NCYLINDERS = [10, 100, 1000, 3000]
+_RADIUS = Radius(0.25)
+_SEED = 0
+
+
+def _plot_each_cylinder(
+    ax: mplot3d.Axes3D,
+    positions: Sequence[XAxisCylinderPosition],
+    properties: CylinderDrawingProperties,
+    label: CylinderLabel,
+) -> None:
+    for position in positions:
+        xs, thetas = np.meshgrid(
+            [position.x_min, position.x_max],
+            np.linspace(0, 2 * np.pi, properties.number_of_polygons),
+        )
+        ax.plot_surface(
+            xs,
+            position.y + float(_RADIUS) * np.sin(thetas),
+            position.z + float(_RADIUS) * np.cos(thetas),
+            color=str(properties.colour),
+        )
+        ax.text(position.x_center, position.y, position.z, label.text, zorder=100)
+        for x in [position.x_min, position.x_max]:
+            circle = patches.Circle(
+                xy=(position.y, position.z),
+                radius=float(_RADIUS),
+                facecolor=str(properties.colour),
+                edgecolor=str(properties.edge_colour),
+            )
+            ax.add_patch(circle)
+            art3d.pathpatch_2d_to_3d(circle, z=x, zdir="x")  # type: ignore[reportArgumentType]
+
+
+def _plot_all_cylinders(
+    ax: mplot3d.Axes3D,
+    positions: Sequence[XAxisCylinderPosition],
+    properties: CylinderDrawingProperties,
+    label: CylinderLabel,
+) -> None:
+    plot_x_axis_cylinders(
+        ax=ax,
+        radius=_RADIUS,
+        positions=positions,
+        properties=[properties] * len(positions),
+        labels=[label] * len(positions),
+    )
+
+
+def _time(
+    plot: Callable[
+        [
+            mplot3d.Axes3D,
+            Sequence[XAxisCylinderPosition],
+            CylinderDrawingProperties,
+            CylinderLabel,
+        ],
+        None,
+    ],
+    positions: Sequence[XAxisCylinderPosition],
+) -> float:
+    fig = plt.figure()
+    ax = fig.add_subplot(projection="3d")
+    properties = CylinderDrawingProperties(
+        colour=BLUE, edge_colour=BLACK, number_of_polygons=10
+    )
+    label = CylinderLabel(
+        text="task", properties=CylinderLabelDrawingProperties(colour=BLACK)
+    )
+
+    start = time.perf_counter()
+    plot(ax, positions, properties, label)
+    fig.canvas.draw()
+    duration = time.perf_counter() - start
+
+    plt.close(fig)
+    return duration
+
+
+def main() -> None:
+    """Print the time taken to plot and draw increasing numbers of cylinders."""
+    mpl.use("Agg")
+    rng = random.Random(_SEED)
+    headings = ["cylinders", "each", "all"]
+    print(" ".join(f"{heading:>10}" for heading in headings))
+    for ncylinders in _NCYLINDERS:
+        positions = list[XAxisCylinderPosition]()
+        for _ in range(ncylinders):
+            x_min = rng.randrange(100)
+            positions.append(
+                XAxisCylinderPosition(
+                    x_min=x_min,
+                    x_max=x_min + rng.randrange(5),
+                    y=rng.uniform(0, 100),
+                    z=rng.randrange(10),
+                )
+            )
+
+        each_time = _time(_plot_each_cylinder, positions)
+        all_time = _time(_plot_all_cylinders, positions)
+        print(f"{ncylinders:>10} {each_time:>10.3f} {all_time:>10.3f}")
+    print("Times are in seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,22 @@
 """Graft app."""
 
-from graft.gui_app import run as run_gui
+from typing import TYPE_CHECKING
+
 from graft.logging_configuration import configure_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    run_gui: Callable[[], None]
+
+
+def __getattr__(name: str) -> object:
+    # The GUI is only imported when it's needed, so the command-line interface
+    # doesn't have to wait for tkinter and matplotlib to load
+    if name == "run_gui":
+        from graft.gui_app import run  # noqa: PLC0415 (imported lazily, see above)
+
+        return run
+
+    msg = f"module [{__name__}] has no attribute [{name}]"
+    raise AttributeError(msg)
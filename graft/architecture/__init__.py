@@ -1,4 +1,4 @@
 """3 layered architecture interfaces."""
 
-from graft.architecture.data import DataLayer
-from graft.architecture.logic import LogicLayer
+from graft.architecture.data import DataLayer, StaleSystemError
+from graft.architecture.logic import LogicLayer, SystemSnapshot, Verdict
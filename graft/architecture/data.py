@@ -1,11 +1,20 @@
 """Data-layer interface and associated exceptions."""
 
 import abc
+from collections.abc import Sequence
 
 from graft import domain
 from graft.domain import tasks
 
 
+class StaleSystemError(Exception):
+    """Exception raised when saving a system that is out of date.
+
+    Raised when the saved system has been changed by someone else, such as
+    another process, since it was last loaded.
+    """
+
+
 class DataLayer(abc.ABC):
     """Data-layer interface."""
 
@@ -21,20 +30,52 @@ class DataLayer(abc.ABC):
         only change once a system containing the task uid is saved.
         """
 
+    @abc.abstractmethod
+    def load_next_unused_tasks(self, number: int) -> list[tasks.UID]:
+        """Load the next unused task UIDs, in the order they would be used.
+
+        The first UID is the one returned by load_next_unused_task. As with that
+        method, loading the UIDs will not add them to the system.
+        """
+
     @abc.abstractmethod
     def load_system(self) -> domain.System:
         """Load the state of the system."""
 
+    @abc.abstractmethod
+    def is_system_stale(self) -> bool:
+        """Check if the saved system has been changed by someone else.
+
+        That is, by anything other than this data layer, such as another
+        process, since the system was last loaded or saved. A stale system
+        can't be saved until it has been loaded again.
+        """
+
     @abc.abstractmethod
     def erase(self) -> None:
         """Erase all data."""
 
     @abc.abstractmethod
     def save_system(self, system: domain.ISystemView) -> None:
-        """Save the state of the system."""
+        """Save the state of the system.
+
+        The saved system must not be modified afterwards, so data layers can
+        keep hold of it without copying it. Callers that carry on modifying a
+        system should save a copy-on-write copy of it.
+        """
 
     @abc.abstractmethod
     def save_system_and_indicate_task_used(
         self, system: domain.ISystemView, used_task: tasks.UID
     ) -> None:
         """Save the state of the system and indicate that a new task has been added."""
+
+    @abc.abstractmethod
+    def save_system_and_indicate_tasks_used(
+        self, system: domain.ISystemView, used_tasks: Sequence[tasks.UID]
+    ) -> None:
+        """Save the state of the system and indicate that new tasks have been added.
+
+        The used tasks must be the next unused task UIDs, in order, so a block
+        of UIDs can be reserved in a single save.
+        """
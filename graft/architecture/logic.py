@@ -1,10 +1,41 @@
 """Logic-layer interface and associated exceptions."""
 
 import abc
+import contextlib
+import dataclasses
+from collections.abc import Callable, Iterable, Sequence
 
 from graft import domain
 from graft.architecture import data
-from graft.domain import tasks
+from graft.domain import changes, tasks
+
+
+@dataclasses.dataclass(frozen=True)
+class Verdict:
+    """Whether an operation is allowed, and if not, the error it would raise."""
+
+    error: Exception | None = None
+
+    @property
+    def is_allowed(self) -> bool:
+        """Check if the operation is allowed."""
+        return self.error is None
+
+    def __bool__(self) -> bool:
+        """Check if the operation is allowed."""
+        return self.is_allowed
+
+
+@dataclasses.dataclass(frozen=True)
+class SystemSnapshot:
+    """Immutable view of the system as it was after a committed operation.
+
+    The version goes up by one with each commit that changes the system, so
+    snapshots with the same version show the same system.
+    """
+
+    version: int
+    system: domain.SystemView
 
 
 class LogicLayer(abc.ABC):
@@ -18,6 +49,38 @@ class LogicLayer(abc.ABC):
     def erase(self) -> None:
         """Erase all data."""
 
+    @abc.abstractmethod
+    def reload_if_stale(self) -> bool:
+        """Reload the system if someone else has saved it since it was loaded.
+
+        Returns whether the system was reloaded. Unsaved changes and the undo
+        history are dropped when it is. Saves that fail as the system is stale
+        reload it too.
+        """
+
+    @abc.abstractmethod
+    def add_change_listener(
+        self, listener: Callable[[Sequence[changes.SystemChange]], None]
+    ) -> None:
+        """Add a listener, which is passed the changes made by each operation.
+
+        Listeners are called once the changes have been saved, so changes made in
+        a batch are passed together when the batch ends.
+        """
+
+    @abc.abstractmethod
+    def batch(self) -> contextlib.AbstractContextManager[None]:
+        """Group operations together, so they succeed or fail as one.
+
+        Operations made inside the context are applied to the system straight
+        away, but the system is only saved once the context exits. If an
+        exception is raised inside the context, every operation made inside it
+        is rolled back.
+
+        Batches can be nested, in which case the inner batch is part of the
+        outer batch.
+        """
+
     @abc.abstractmethod
     def create_task(
         self,
@@ -26,6 +89,18 @@ class LogicLayer(abc.ABC):
     ) -> tasks.UID:
         """Create a new task and return its UID."""
 
+    @abc.abstractmethod
+    def create_tasks(
+        self,
+        number: int,
+        names: Sequence[tasks.Name] | None = None,
+        descriptions: Sequence[tasks.Description] | None = None,
+    ) -> list[tasks.UID]:
+        """Create several new tasks at once and return their UIDs.
+
+        If given, there must be one name and one description per task.
+        """
+
     @abc.abstractmethod
     def get_next_unused_task(self) -> tasks.UID:
         """Return the next unused task ID."""
@@ -56,6 +131,21 @@ class LogicLayer(abc.ABC):
     ) -> None:
         """Update the specified task's importance."""
 
+    @abc.abstractmethod
+    def undo(self) -> bool:
+        """Undo the last operation, returning whether there was one to undo.
+
+        Operations made in a batch are undone together.
+        """
+
+    @abc.abstractmethod
+    def redo(self) -> bool:
+        """Redo the last undone operation, returning whether there was one to redo.
+
+        Any undone operations can no longer be redone once a new operation is
+        made.
+        """
+
     @abc.abstractmethod
     def get_task_system(self) -> tasks.SystemView:
         """Return a view of the task system."""
@@ -64,6 +154,29 @@ class LogicLayer(abc.ABC):
     def get_system(self) -> domain.SystemView:
         """Return a view of the system."""
 
+    @abc.abstractmethod
+    def get_snapshot(self) -> SystemSnapshot:
+        """Return a snapshot of the system as of the last commit.
+
+        Unlike the views returned by get_system, the snapshot never changes, so
+        it can be read from any thread while the system is being modified.
+        Getting a snapshot doesn't wait for any in-progress operation.
+        """
+
+    @abc.abstractmethod
+    def get_active_concrete_tasks_in_descending_priority_order(
+        self,
+    ) -> list[
+        tuple[
+            tasks.UID, tasks.Importance | None, tasks.Importance | None, tasks.Progress
+        ]
+    ]:
+        """Return the active concrete tasks in order of descending priority.
+
+        Each task is returned with its combined importance, which includes the
+        importance of its downstream tasks, its own importance and its progress.
+        """
+
     @abc.abstractmethod
     def create_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
         """Create a new hierarchy between the specified tasks."""
@@ -83,3 +196,51 @@ class LogicLayer(abc.ABC):
         self, dependee_task: tasks.UID, dependent_task: tasks.UID
     ) -> None:
         """Delete the specified dependency."""
+
+    @abc.abstractmethod
+    def check_delete_task(self, task: tasks.UID) -> Verdict:
+        """Check if the specified task can be deleted, without deleting it."""
+
+    @abc.abstractmethod
+    def check_update_concrete_task_progress(
+        self, task: tasks.UID, progress: tasks.Progress
+    ) -> Verdict:
+        """Check if the specified concrete task's progress can be updated."""
+
+    @abc.abstractmethod
+    def check_update_task_importance(
+        self, task: tasks.UID, importance: tasks.Importance | None = None
+    ) -> Verdict:
+        """Check if the specified task's importance can be updated."""
+
+    @abc.abstractmethod
+    def check_create_task_hierarchy(
+        self, supertask: tasks.UID, subtask: tasks.UID
+    ) -> Verdict:
+        """Check if a hierarchy can be created, without creating it."""
+
+    @abc.abstractmethod
+    def check_create_task_hierarchies(
+        self, hierarchies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[Verdict]:
+        """Check which of several (supertask, subtask) hierarchies can be created.
+
+        Each hierarchy is checked on its own against the current system, so the
+        verdicts say nothing about whether they can all be created together.
+        """
+
+    @abc.abstractmethod
+    def check_create_task_dependency(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> Verdict:
+        """Check if a dependency can be created, without creating it."""
+
+    @abc.abstractmethod
+    def check_create_task_dependencies(
+        self, dependencies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[Verdict]:
+        """Check which of several (dependee, dependent) dependencies can be created.
+
+        Each dependency is checked on its own against the current system, so the
+        verdicts say nothing about whether they can all be created together.
+        """
@@ -0,0 +1,129 @@
+"""Headless command-line interface, for scripting and automation.
+
+Every command writes its results to stdout as JSON, one object per line. Errors
+are written to stderr as a JSON object, with a non-zero exit code.
+
+The batch command reads commands from stdin as JSON lines, in the same form as
+the arguments of the other commands, e.g. {"command": "create", "name": "Foo"}.
+All commands in a batch are applied together and saved once, so nothing is
+saved if any of them fail.
+
+The serve command runs a local HTTP server instead, see graft.server. Undo and
+redo are only available through the server, as each other command runs in a
+new process, with no history of operations to undo.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from collections.abc import Generator, Iterable, Sequence
+from typing import IO, Final
+
+from graft import json_api, server
+from graft.layers import data, logic
+
+_DEFAULT_HOST: Final = "127.0.0.1"
+_DEFAULT_PORT: Final = 8080
+
+
+def _read_commands(file: IO[str]) -> Generator[json_api.Command, None, None]:
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _write_results(results: Iterable[json_api.Result], file: IO[str]) -> None:
+    for result in results:
+        file.write(json.dumps(result))
+        file.write("\n")
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="graft", description="Headless interface for scripting graft."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = subparsers.add_parser("create", help="create a new task")
+    create_parser.add_argument("--name", default=argparse.SUPPRESS)
+    create_parser.add_argument("--description", default=argparse.SUPPRESS)
+
+    delete_parser = subparsers.add_parser("delete", help="delete a task")
+    delete_parser.add_argument("task", type=int)
+
+    for name, help_text in [
+        ("link", "add a relationship between two tasks"),
+        ("unlink", "remove a relationship between two tasks"),
+    ]:
+        relationship_parser = subparsers.add_parser(name, help=help_text)
+        relationship_parser.add_argument(
+            "relationship", choices=[json_api.HIERARCHY, json_api.DEPENDENCY]
+        )
+        relationship_parser.add_argument(
+            "source", type=int, help="supertask or dependee task"
+        )
+        relationship_parser.add_argument(
+            "target", type=int, help="subtask or dependent task"
+        )
+
+    update_parser = subparsers.add_parser("update", help="update a task")
+    update_parser.add_argument("task", type=int)
+    update_parser.add_argument("--name", default=argparse.SUPPRESS)
+    update_parser.add_argument("--description", default=argparse.SUPPRESS)
+    update_parser.add_argument(
+        "--progress",
+        choices=json_api.PROGRESS_NAMES.values(),
+        default=argparse.SUPPRESS,
+    )
+    update_parser.add_argument(
+        "--importance",
+        choices=[*json_api.IMPORTANCE_NAMES.values(), json_api.NO_IMPORTANCE_NAME],
+        default=argparse.SUPPRESS,
+    )
+
+    query_parser = subparsers.add_parser("query", help="describe tasks")
+    query_parser.add_argument(
+        "tasks", type=int, nargs="*", help="tasks to describe, or all if none given"
+    )
+
+    subparsers.add_parser("priority", help="list active tasks by priority")
+    subparsers.add_parser("batch", help="run JSON-lines commands from stdin")
+
+    serve_parser = subparsers.add_parser("serve", help="run a local HTTP server")
+    serve_parser.add_argument("--host", default=_DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=_DEFAULT_PORT)
+
+    return parser
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    """Run the command-line interface, returning the exit code."""
+    command = vars(_create_parser().parse_args(args))
+
+    # Errors are reported as JSON, so stop unhandled log records being
+    # written to stderr alongside them
+    logging.getLogger().addHandler(logging.NullHandler())
+
+    try:
+        logic_layer = logic.StandardLogicLayer(data_layer=data.LocalFilesDataLayer())
+        if command["command"] == "serve":
+            server.serve(logic_layer, host=command["host"], port=command["port"])
+            return 0
+
+        if command["command"] == "batch":
+            with logic_layer.batch():
+                # Results are only written once the batch succeeds, so
+                # nothing is reported for commands that were rolled back
+                results = list(
+                    json_api.run_commands(logic_layer, _read_commands(sys.stdin))
+                )
+        else:
+            results = json_api.run_command(logic_layer, command)
+    except Exception as e:  # noqa: BLE001 (every error is reported as JSON)
+        json.dump({"error": e.__class__.__name__, "message": str(e)}, sys.stderr)
+        sys.stderr.write("\n")
+        return 1
+
+    _write_results(results, sys.stdout)
+    return 0
@@ -1,6 +1,6 @@
 """Domain-specific classes and exceptions."""
 
-from graft.domain import tasks
+from graft.domain import changes, tasks
 from graft.domain.priority_order import (
     get_active_concrete_tasks_in_descending_priority_order,
 )
@@ -0,0 +1,187 @@
+"""Changes made to a system, and the tasks they affect."""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from graft.domain import tasks
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SystemChange:
+    """Change made to a system.
+
+    The affected tasks are those whose attributes, relationships or inferred
+    values, such as inferred progress or importance, may have changed.
+    """
+
+    affected_tasks: frozenset[tasks.UID]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SystemReplaced(SystemChange):
+    """Any part of the system may have changed, such as after erasing it."""
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TaskCreated(SystemChange):
+    """Task has been created."""
+
+    task: tasks.UID
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TaskDeleted(SystemChange):
+    """Task has been deleted."""
+
+    task: tasks.UID
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class NameChanged(SystemChange):
+    """Name of a task has changed.
+
+    The tasks directly related to it are affected too, as they are shown along
+    with the names of the tasks they're related to.
+    """
+
+    task: tasks.UID
+    old: tasks.Name
+    new: tasks.Name
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DescriptionChanged(SystemChange):
+    """Description of a task has changed."""
+
+    task: tasks.UID
+    old: tasks.Description
+    new: tasks.Description
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ProgressChanged(SystemChange):
+    """Progress of a concrete task has changed."""
+
+    task: tasks.UID
+    old: tasks.Progress | None
+    new: tasks.Progress
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ImportanceChanged(SystemChange):
+    """Importance of a task has changed."""
+
+    task: tasks.UID
+    old: tasks.Importance | None
+    new: tasks.Importance | None
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class HierarchyAdded(SystemChange):
+    """Hierarchy has been added between two tasks."""
+
+    supertask: tasks.UID
+    subtask: tasks.UID
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class HierarchyRemoved(SystemChange):
+    """Hierarchy has been removed between two tasks."""
+
+    supertask: tasks.UID
+    subtask: tasks.UID
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DependencyAdded(SystemChange):
+    """Dependency has been added between two tasks."""
+
+    dependee_task: tasks.UID
+    dependent_task: tasks.UID
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DependencyRemoved(SystemChange):
+    """Dependency has been removed between two tasks."""
+
+    dependee_task: tasks.UID
+    dependent_task: tasks.UID
+
+
+def get_tasks_affected_by_name(
+    system: tasks.SystemView, task: tasks.UID
+) -> frozenset[tasks.UID]:
+    """Get the tasks affected by changing the name of a task.
+
+    Its subtasks, supertasks, dependee tasks and dependent tasks show its name.
+    """
+    network_graph = system.network_graph()
+    hierarchy_graph = network_graph.hierarchy_graph()
+    dependency_graph = network_graph.dependency_graph()
+    return frozenset(
+        itertools.chain(
+            [task],
+            hierarchy_graph.subtasks(task),
+            hierarchy_graph.supertasks(task),
+            dependency_graph.dependee_tasks(task),
+            dependency_graph.dependent_tasks(task),
+        )
+    )
+
+
+def get_tasks_affected_by_progress(
+    system: tasks.SystemView, task: tasks.UID
+) -> frozenset[tasks.UID]:
+    """Get the tasks affected by changing the progress of a task.
+
+    The inferred progress of its superior tasks may change, as may whether the
+    tasks downstream of it can be started.
+    """
+    network_graph = system.network_graph()
+    return frozenset(
+        itertools.chain(
+            [task],
+            network_graph.hierarchy_graph().superior_tasks([task]),
+            network_graph.downstream_tasks([task]),
+        )
+    )
+
+
+def get_tasks_affected_by_importance(
+    system: tasks.SystemView, task: tasks.UID
+) -> frozenset[tasks.UID]:
+    """Get the tasks affected by changing the importance of a task.
+
+    Its inferior tasks inherit its importance.
+    """
+    return frozenset(
+        itertools.chain(
+            [task], system.network_graph().hierarchy_graph().inferior_tasks([task])
+        )
+    )
+
+
+def get_tasks_affected_by_relationship(
+    system: tasks.SystemView, source_task: tasks.UID, target_task: tasks.UID
+) -> frozenset[tasks.UID]:
+    """Get the tasks affected by adding or removing a relationship.
+
+    The tasks at either end of the relationship are affected, along with
+    everything downstream of them. Superior tasks of the source may have their
+    inferred progress changed, and inferior tasks of the target may have their
+    inferred importance changed.
+    """
+    network_graph = system.network_graph()
+    hierarchy_graph = network_graph.hierarchy_graph()
+    return frozenset(
+        itertools.chain(
+            [source_task, target_task],
+            hierarchy_graph.superior_tasks([source_task]),
+            hierarchy_graph.inferior_tasks([target_task]),
+            network_graph.downstream_tasks([source_task, target_task]),
+        )
+    )
@@ -32,6 +32,7 @@ class System:
     ) -> None:
         """Initialise System."""
         self._task_system = task_system
+        self._is_task_system_shared = False
 
     def __eq__(self, other: object) -> bool:
         """Check if two systems are equal."""
@@ -44,46 +45,103 @@ class System:
         """Return a view of the task system."""
         return tasks.SystemView(self._task_system)
 
+    def copy_on_write(self) -> System:
+        """Return a copy of the system that shares state with the original.
+
+        Taking the copy is cheap, as nothing is cloned up front. Instead, each
+        of the two systems clones the shared state before it is first modified.
+        Views taken before then continue to show the shared state.
+        """
+        system = System(task_system=self._task_system)
+        system._is_task_system_shared = True
+        self._is_task_system_shared = True
+        return system
+
+    def _unshare_task_system(self) -> None:
+        """Clone the task system if it is shared, so it can be modified."""
+        if self._is_task_system_shared:
+            self._task_system = self._task_system.clone()
+            self._is_task_system_shared = False
+
+    def validate_task_can_be_removed(self, task: tasks.UID) -> None:
+        """Validate that a task can be removed, without removing it."""
+        self._task_system.validate_task_can_be_removed(task)
+
+    def validate_task_progress_can_be_set(
+        self, task: tasks.UID, progress: tasks.Progress
+    ) -> None:
+        """Validate that the progress of a task can be set, without setting it."""
+        self._task_system.validate_progress_can_be_set(task, progress)
+
+    def validate_task_importance_can_be_set(
+        self, task: tasks.UID, importance: tasks.Importance | None = None
+    ) -> None:
+        """Validate that the importance of a task can be set, without setting it."""
+        self._task_system.validate_importance_can_be_set(task, importance)
+
+    def validate_task_hierarchy_can_be_added(
+        self, supertask: tasks.UID, subtask: tasks.UID
+    ) -> None:
+        """Validate that a hierarchy can be added, without adding it."""
+        self._task_system.validate_hierarchy_can_be_added(supertask, subtask)
+
+    def validate_task_dependency_can_be_added(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> None:
+        """Validate that a dependency can be added, without adding it."""
+        self._task_system.validate_dependency_can_be_added(
+            dependee_task=dependee_task, dependent_task=dependent_task
+        )
+
     def add_task(self, task: tasks.UID) -> None:
         """Add a task."""
+        self._unshare_task_system()
         self._task_system.add_task(task)
 
     def remove_task(self, task: tasks.UID) -> None:
         """Remove a task."""
+        self._unshare_task_system()
         self._task_system.remove_task(task)
 
     def set_task_name(self, task: tasks.UID, name: tasks.Name) -> None:
         """Set the name of the specified task."""
+        self._unshare_task_system()
         self._task_system.set_name(task, name)
 
     def set_task_description(
         self, task: tasks.UID, description: tasks.Description
     ) -> None:
         """Set the description of the specified task."""
+        self._unshare_task_system()
         self._task_system.set_description(task, description)
 
     def set_task_progress(self, task: tasks.UID, progress: tasks.Progress) -> None:
         """Set the progress of the specified task."""
+        self._unshare_task_system()
         self._task_system.set_progress(task, progress)
 
     def set_task_importance(
         self, task: tasks.UID, importance: tasks.Importance | None = None
     ) -> None:
         """Set the importance of the specified task."""
+        self._unshare_task_system()
         self._task_system.set_importance(task, importance)
 
     def add_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
         """Add a hierarchy between the specified tasks."""
+        self._unshare_task_system()
         self._task_system.add_hierarchy(supertask, subtask)
 
     def remove_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
         """Remove a hierarchy between the specified tasks."""
+        self._unshare_task_system()
         self._task_system.remove_hierarchy(supertask=supertask, subtask=subtask)
 
     def add_task_dependency(
         self, dependee_task: tasks.UID, dependent_task: tasks.UID
     ) -> None:
         """Add a dependency between the specified tasks."""
+        self._unshare_task_system()
         self._task_system.add_dependency(
             dependee_task=dependee_task, dependent_task=dependent_task
         )
@@ -92,6 +150,7 @@ class System:
         self, dependee_task: tasks.UID, dependent_task: tasks.UID
     ) -> None:
         """Remove a dependency between the specified tasks."""
+        self._unshare_task_system()
         self._task_system.remove_dependency(
             dependee_task=dependee_task, dependent_task=dependent_task
         )
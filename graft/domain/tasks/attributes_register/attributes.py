@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import enum
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from graft.domain.tasks.description import Description
 from graft.domain.tasks.name import Name
@@ -118,6 +118,13 @@ class Attributes:
             else self.importance,
         )
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Attributes:
+        """Return self, as attributes are immutable.
+
+        Changes are made by replacing attributes with an updated copy.
+        """
+        return self
+
 
 class AttributesView:
     """Attributes view."""
@@ -1,5 +1,9 @@
 """Description and associated classes/exceptions."""
 
+from __future__ import annotations
+
+from typing import Any
+
 
 class Description:
     """Task description."""
@@ -27,3 +31,7 @@ class Description:
     def __repr__(self) -> str:
         """Return description as a string for developers."""
         return f"{self.__class__.__name__}({self._text!r})"
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Description:
+        """Return self, as descriptions are immutable."""
+        return self
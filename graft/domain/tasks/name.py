@@ -1,5 +1,9 @@
 """Name and associated classes/exceptions."""
 
+from __future__ import annotations
+
+from typing import Any
+
 
 class Name:
     """Task name."""
@@ -27,3 +31,7 @@ class Name:
     def __repr__(self) -> str:
         """Return name as a string for developers."""
         return f"{self.__class__.__name__}({self._text!r})"
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Name:
+        """Return self, as names are immutable."""
+        return self
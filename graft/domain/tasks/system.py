@@ -584,9 +584,13 @@ class System:
         self._attributes_register.add(task)
         self._network_graph.add_task(task)
 
+    def validate_task_can_be_removed(self, task: UID, /) -> None:
+        """Validate that a task can be removed, without removing it."""
+        self._network_graph.validate_task_can_be_removed(task)
+
     def remove_task(self, task: UID, /) -> None:
         """Remove a task."""
-        self._network_graph.validate_task_can_be_removed(task)
+        self.validate_task_can_be_removed(task)
 
         self._attributes_register.remove(task)
         self._network_graph.remove_task(task)
@@ -599,8 +603,8 @@ class System:
         """Set the description of the specified task."""
         self._attributes_register.set_description(task, description)
 
-    def set_progress(self, task: UID, progress: Progress) -> None:
-        """Set the progress of the specified task."""
+    def validate_progress_can_be_set(self, task: UID, progress: Progress) -> None:
+        """Validate that the progress of a task can be set, without setting it."""
         current_progress = self._get_progress_of_concrete_task(task)
 
         match current_progress:
@@ -758,12 +762,16 @@ class System:
             case Progress.IN_PROGRESS:
                 pass
 
+    def set_progress(self, task: UID, progress: Progress) -> None:
+        """Set the progress of the specified task."""
+        self.validate_progress_can_be_set(task, progress)
         self._attributes_register.set_progress(task, progress)
 
-    def set_importance(self, task: UID, importance: Importance | None = None) -> None:
-        """Set the importance of the specified task."""
+    def validate_importance_can_be_set(
+        self, task: UID, importance: Importance | None = None
+    ) -> None:
+        """Validate that the importance of a task can be set, without setting it."""
         if importance is None or self._attributes_register[task].importance is not None:
-            self._attributes_register.set_importance(task, importance)
             return
 
         if any(
@@ -813,10 +821,13 @@ class System:
                 task=task, importance=importance, subsystem=builder.build()
             )
 
+    def set_importance(self, task: UID, importance: Importance | None = None) -> None:
+        """Set the importance of the specified task."""
+        self.validate_importance_can_be_set(task, importance)
         self._attributes_register.set_importance(task, importance)
 
-    def add_hierarchy(self, supertask: UID, subtask: UID) -> None:
-        """Create a new hierarchy between the specified tasks."""
+    def validate_hierarchy_can_be_added(self, supertask: UID, subtask: UID) -> None:
+        """Validate that a hierarchy can be added, without adding it."""
         self._network_graph.validate_hierarchy_can_be_added(supertask, subtask)
 
         if any(
@@ -1048,17 +1059,21 @@ class System:
                 subsystem=builder.build(),
             )
 
-        if self._network_graph.hierarchy_graph().is_concrete(supertask):
-            if (
-                supertask_progress := self._get_progress_of_concrete_task(supertask)
-            ) is not (subtask_progress := self.get_progress(subtask)):
-                raise MismatchedProgressForNewSupertaskError(
-                    supertask=supertask,
-                    supertask_progress=supertask_progress,
-                    subtask=subtask,
-                    subtask_progress=subtask_progress,
-                )
+        if self._network_graph.hierarchy_graph().is_concrete(supertask) and (
+            supertask_progress := self._get_progress_of_concrete_task(supertask)
+        ) is not (subtask_progress := self.get_progress(subtask)):
+            raise MismatchedProgressForNewSupertaskError(
+                supertask=supertask,
+                supertask_progress=supertask_progress,
+                subtask=subtask,
+                subtask_progress=subtask_progress,
+            )
+
+    def add_hierarchy(self, supertask: UID, subtask: UID) -> None:
+        """Create a new hierarchy between the specified tasks."""
+        self.validate_hierarchy_can_be_added(supertask, subtask)
 
+        if self._network_graph.hierarchy_graph().is_concrete(supertask):
             self._attributes_register.set_progress(task=supertask, progress=None)
 
         self._network_graph.add_hierarchy(supertask, subtask)
@@ -1071,8 +1086,10 @@ class System:
 
         self._network_graph.remove_hierarchy(supertask, subtask)
 
-    def add_dependency(self, dependee_task: UID, dependent_task: UID) -> None:
-        """Add a dependency between the specified tasks."""
+    def validate_dependency_can_be_added(
+        self, dependee_task: UID, dependent_task: UID
+    ) -> None:
+        """Validate that a dependency can be added, without adding it."""
         self._network_graph.validate_dependency_can_be_added(
             dependee_task, dependent_task
         )
@@ -1089,6 +1106,9 @@ class System:
                 dependent_progress=dependent_progress,
             )
 
+    def add_dependency(self, dependee_task: UID, dependent_task: UID) -> None:
+        """Add a dependency between the specified tasks."""
+        self.validate_dependency_can_be_added(dependee_task, dependent_task)
         self._network_graph.add_dependency(dependee_task, dependent_task)
 
     def remove_dependency(self, dependee_task: UID, dependent_task: UID) -> None:
@@ -59,6 +59,10 @@ class UID:
         """Return string representation of UID."""
         return f"uid({self._number!r})"
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> UID:
+        """Return self, as UIDs are immutable."""
+        return self
+
 
 class TasksView(Set[UID]):
     """View of a set of tasks."""
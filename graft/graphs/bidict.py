@@ -323,6 +323,18 @@ class BiDirectionalSetDict[T: Hashable](MutableMapping[T, SetView[T]]):
         """Return number of keys in bidict."""
         return len(self._forward)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> BiDirectionalSetDict[T]:
+        """Return a deep copy of the bidict.
+
+        Keys and values are hashable, and so are treated as immutable and shared
+        with the copy. Only the dictionaries and sets holding them are copied.
+        """
+        clone = BiDirectionalSetDict[T]()
+        memo[id(self)] = clone
+        clone._forward = {key: set(values) for key, values in self._forward.items()}
+        clone._backward = {key: set(values) for key, values in self._backward.items()}
+        return clone
+
     def keys(self) -> KeysView[T]:
         """Return KeysView of bidict."""
         return self._forward.keys()
@@ -660,27 +660,31 @@ class DirectedGraph[T: Hashable]:
 
     def has_cycle(self) -> bool:
         """Check if the graph has a cycle."""
-
-        def process_node(
-            node: T, visited_nodes: set[T], current_subgraph_nodes: set[T]
-        ) -> bool:
-            visited_nodes.add(node)
-            current_subgraph_nodes.add(node)
-
-            for successor in self.successors(node):
-                if successor in current_subgraph_nodes or (
-                    successor not in visited_nodes
-                    and process_node(successor, visited_nodes, current_subgraph_nodes)
-                ):
-                    return True
-
-            current_subgraph_nodes.remove(node)
-            return False
-
         visited_nodes = set[T]()
         current_subgraph_nodes = set[T]()
-        return any(
-            node not in visited_nodes
-            and process_node(node, visited_nodes, current_subgraph_nodes)
-            for node in self.nodes()
-        )
+
+        for root in self.nodes():
+            if root in visited_nodes:
+                continue
+
+            # Depth-first search with an explicit stack rather than recursion,
+            # so long chains of nodes don't exceed the recursion limit
+            visited_nodes.add(root)
+            current_subgraph_nodes.add(root)
+            stack = [(root, iter(self.successors(root)))]
+            while stack:
+                node, successors = stack[-1]
+                for successor in successors:
+                    if successor in current_subgraph_nodes:
+                        return True
+
+                    if successor not in visited_nodes:
+                        visited_nodes.add(successor)
+                        current_subgraph_nodes.add(successor)
+                        stack.append((successor, iter(self.successors(successor))))
+                        break
+                else:
+                    stack.pop()
+                    current_subgraph_nodes.remove(node)
+
+        return False
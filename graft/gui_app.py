@@ -1,20 +1,36 @@
 """Functions for starting the graft application."""
 
 import logging
+from typing import Final
 
 from graft.layers import data, logic, presentation
 
 logger = logging.getLogger(__name__)
 
+_LAYOUT_CACHE_FILENAME: Final = "layouts.pickle"
+
 
 def run() -> None:
     """Run the application."""
     logger.info("Starting graft application")
     data_layer = data.LoggingDecoratorDataLayer(
-        handler=data.CachingDecoratorDataLayer(handler=data.LocalFilesDataLayer())
+        handler=data.CachingDecoratorDataLayer(
+            # Saves are only deferred here, so a burst of edits is coalesced
+            # by the writer dropping superseded saves, and failures are only
+            # reported from its thread
+            handler=data.AsyncWriteBehindDecoratorDataLayer(
+                handler=data.LocalFilesDataLayer(),
+                on_save_error=presentation.report_save_error,
+            )
+        )
     )
     logic_layer = logic.LoggingDecoratorLogicLayer(
-        handler=logic.StandardLogicLayer(data_layer=data_layer)
+        handler=logic.CachingDecoratorLogicLayer(
+            handler=logic.StandardLogicLayer(data_layer=data_layer)
+        )
+    )
+    presentation.run_gui(
+        logic_layer=logic_layer,
+        layout_cache_file=data.get_cache_directory() / _LAYOUT_CACHE_FILENAME,
     )
-    presentation.run_gui(logic_layer=logic_layer)
     logger.info("Shutting down graft application")
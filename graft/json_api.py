@@ -0,0 +1,231 @@
+"""JSON representations of tasks, and commands to run on a logic layer.
+
+Shared by the command-line interface and the server, so both accept the same
+commands and describe tasks in the same way. A command is a JSON object, such
+as {"command": "link", "relationship": "dependency", "source": 1, "target": 2}.
+"""
+
+import itertools
+from collections.abc import Generator, Iterable, Mapping
+from typing import Any, Final
+
+from graft import architecture, domain
+from graft.domain import tasks
+
+PROGRESS_NAMES: Final = {
+    tasks.Progress.NOT_STARTED: "not_started",
+    tasks.Progress.IN_PROGRESS: "in_progress",
+    tasks.Progress.COMPLETED: "completed",
+}
+IMPORTANCE_NAMES: Final = {
+    tasks.Importance.LOW: "low",
+    tasks.Importance.MEDIUM: "medium",
+    tasks.Importance.HIGH: "high",
+}
+NO_IMPORTANCE_NAME: Final = "none"
+
+HIERARCHY: Final = "hierarchy"
+DEPENDENCY: Final = "dependency"
+
+type Command = Mapping[str, Any]
+type Result = dict[str, Any]
+type _PriorityOrder = Iterable[
+    tuple[tasks.UID, tasks.Importance | None, tasks.Importance | None, tasks.Progress]
+]
+
+
+def _parse_progress(name: str) -> tasks.Progress:
+    for progress, progress_name in PROGRESS_NAMES.items():
+        if name == progress_name:
+            return progress
+
+    msg = f"Unknown progress [{name}]"
+    raise ValueError(msg)
+
+
+def _parse_importance(name: str | None) -> tasks.Importance | None:
+    if name is None or name == NO_IMPORTANCE_NAME:
+        return None
+
+    for importance, importance_name in IMPORTANCE_NAMES.items():
+        if name == importance_name:
+            return importance
+
+    msg = f"Unknown importance [{name}]"
+    raise ValueError(msg)
+
+
+def _format_importance(importance: tasks.Importance | None) -> str | None:
+    return IMPORTANCE_NAMES[importance] if importance is not None else None
+
+
+def _format_tasks(tasks_: Iterable[tasks.UID]) -> list[int]:
+    return sorted(map(int, tasks_))
+
+
+def describe_task(system: tasks.SystemView, task: tasks.UID) -> Result:
+    """Describe a task, with its attributes and relationships."""
+    attributes = system.attributes_register()[task]
+    hierarchy_graph = system.network_graph().hierarchy_graph()
+    dependency_graph = system.network_graph().dependency_graph()
+    return {
+        "task": int(task),
+        "name": str(attributes.name),
+        "description": str(attributes.description),
+        "progress": PROGRESS_NAMES[system.get_progress(task)],
+        "importance": _format_importance(system.get_importance(task)),
+        "supertasks": _format_tasks(hierarchy_graph.supertasks(task)),
+        "subtasks": _format_tasks(hierarchy_graph.subtasks(task)),
+        "dependee_tasks": _format_tasks(dependency_graph.dependee_tasks(task)),
+        "dependent_tasks": _format_tasks(dependency_graph.dependent_tasks(task)),
+    }
+
+
+def describe_tasks(
+    system: tasks.SystemView, tasks_: Iterable[tasks.UID] | None = None
+) -> list[Result]:
+    """Describe tasks, or every task in the system if none are given."""
+    return [
+        describe_task(system, task)
+        for task in (tasks_ if tasks_ is not None else sorted(system.tasks()))
+    ]
+
+
+def describe_priority_order(priority_order: _PriorityOrder) -> list[Result]:
+    """Describe active concrete tasks in descending priority order."""
+    return [
+        {
+            "rank": rank,
+            "task": int(task),
+            "combined_importance": _format_importance(combined_importance),
+            "importance": _format_importance(importance),
+            "progress": PROGRESS_NAMES[progress],
+        }
+        for rank, (task, combined_importance, importance, progress) in enumerate(
+            priority_order, start=1
+        )
+    ]
+
+
+def get_priority_order(system: domain.SystemView) -> list[Result]:
+    """Describe the active concrete tasks of a system by priority."""
+    return describe_priority_order(
+        domain.get_active_concrete_tasks_in_descending_priority_order(system)
+    )
+
+
+def _link(logic_layer: architecture.LogicLayer, command: Command) -> None:
+    source = tasks.UID(command["source"])
+    target = tasks.UID(command["target"])
+    match command["relationship"]:
+        case "hierarchy":
+            logic_layer.create_task_hierarchy(supertask=source, subtask=target)
+        case "dependency":
+            logic_layer.create_task_dependency(
+                dependee_task=source, dependent_task=target
+            )
+        case relationship:
+            msg = f"Unknown relationship [{relationship}]"
+            raise ValueError(msg)
+
+
+def _unlink(logic_layer: architecture.LogicLayer, command: Command) -> None:
+    source = tasks.UID(command["source"])
+    target = tasks.UID(command["target"])
+    match command["relationship"]:
+        case "hierarchy":
+            logic_layer.delete_task_hierarchy(supertask=source, subtask=target)
+        case "dependency":
+            logic_layer.delete_task_dependency(
+                dependee_task=source, dependent_task=target
+            )
+        case relationship:
+            msg = f"Unknown relationship [{relationship}]"
+            raise ValueError(msg)
+
+
+def _update(logic_layer: architecture.LogicLayer, command: Command) -> None:
+    task = tasks.UID(command["task"])
+    with logic_layer.batch():
+        if "name" in command:
+            logic_layer.update_task_name(task=task, name=tasks.Name(command["name"]))
+        if "description" in command:
+            logic_layer.update_task_description(
+                task=task, description=tasks.Description(command["description"])
+            )
+        if "importance" in command:
+            logic_layer.update_task_importance(
+                task=task, importance=_parse_importance(command["importance"])
+            )
+        if "progress" in command:
+            logic_layer.update_concrete_task_progress(
+                task=task, progress=_parse_progress(command["progress"])
+            )
+
+
+def run_command(logic_layer: architecture.LogicLayer, command: Command) -> list[Result]:
+    """Run a single command, returning its results."""
+    match command["command"]:
+        case "create":
+            task = logic_layer.create_task(
+                name=tasks.Name(command.get("name") or ""),
+                description=tasks.Description(command.get("description") or ""),
+            )
+            return [{"task": int(task)}]
+        case "delete":
+            logic_layer.delete_task(tasks.UID(command["task"]))
+        case "link":
+            _link(logic_layer, command)
+        case "unlink":
+            _unlink(logic_layer, command)
+        case "update":
+            _update(logic_layer, command)
+        case "query":
+            return describe_tasks(
+                logic_layer.get_task_system(),
+                [tasks.UID(task) for task in command["tasks"]]
+                if command.get("tasks")
+                else None,
+            )
+        case "priority":
+            return describe_priority_order(
+                logic_layer.get_active_concrete_tasks_in_descending_priority_order()
+            )
+        case "undo":
+            return [{"undone": logic_layer.undo()}]
+        case "redo":
+            return [{"redone": logic_layer.redo()}]
+        case name:
+            msg = f"Unknown command [{name}]"
+            raise ValueError(msg)
+
+    return [{"ok": True}]
+
+
+def run_commands(
+    logic_layer: architecture.LogicLayer, commands: Iterable[Command]
+) -> Generator[Result, None, None]:
+    """Run commands in order, yielding their results.
+
+    Consecutive create commands are run together, so a block of task UIDs is
+    reserved at once rather than one at a time.
+    """
+    for is_create, group in itertools.groupby(
+        commands, key=lambda command: command["command"] == "create"
+    ):
+        if not is_create:
+            for command in group:
+                yield from run_command(logic_layer, command)
+            continue
+
+        creates = list(group)
+        created_tasks = logic_layer.create_tasks(
+            number=len(creates),
+            names=[tasks.Name(command.get("name") or "") for command in creates],
+            descriptions=[
+                tasks.Description(command.get("description") or "")
+                for command in creates
+            ],
+        )
+        for task in created_tasks:
+            yield {"task": int(task)}
@@ -1,3 +1,6 @@
+from graft.layers.data.async_write_behind_decorator import (
+    AsyncWriteBehindDecoratorDataLayer,
+)
 from graft.layers.data.caching_decorator import CachingDecoratorDataLayer
-from graft.layers.data.local_files import LocalFilesDataLayer
+from graft.layers.data.local_files import LocalFilesDataLayer, get_cache_directory
 from graft.layers.data.logging_decorator import LoggingDecoratorDataLayer
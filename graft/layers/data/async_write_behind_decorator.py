@@ -0,0 +1,165 @@
+import collections
+import dataclasses
+import logging
+import threading
+from collections.abc import Callable, Sequence
+from typing import Final, override
+
+from graft import architecture, domain
+from graft.domain import tasks
+from graft.layers.data.save_errors import log_save_error
+
+logger: Final = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedSave:
+    """Save waiting to be written by the background writer."""
+
+    system: domain.ISystemView
+    used_tasks: tuple[tasks.UID, ...] | None
+
+
+class AsyncWriteBehindDecoratorDataLayer(architecture.DataLayer):
+    """Data layer that saves in the background.
+
+    When a save method is called, queue the system to be saved by the handler on
+    a background writer thread, and return immediately. Saved systems aren't
+    modified, so they are queued without being copied. A queued save that hasn't
+    started yet is dropped if a newer save comes in behind it, as long as it
+    doesn't need to indicate a task has been used.
+
+    Load and erase methods wait for all queued saves to be written first, so
+    they always reflect the latest save.
+
+    The writer thread is not a daemon, so any queued saves are still written if
+    the app exits. Exceptions raised by the handler while saving are passed to
+    the error callback, which logs them by default.
+    """
+
+    def __init__(
+        self,
+        handler: architecture.DataLayer,
+        on_save_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Initialise AsyncWriteBehindDecoratorDataLayer."""
+        self._handler = handler
+        self._on_save_error = (
+            on_save_error if on_save_error is not None else log_save_error
+        )
+        self._queued_saves = collections.deque[_QueuedSave]()
+        self._writer: threading.Thread | None = None
+        self._condition = threading.Condition()
+
+    @override
+    def load_next_unused_task(self) -> tasks.UID:
+        """Load the next unused task UID.
+
+        "Unused" means that the UID has never been used in the system before,
+        regardless of whether the task had subsequently been deleted.
+
+        Loading an unused task UID will not add it to the system, and will
+        return the same value if called multiple times. The returned value will
+        only change once a system containing the task uid is saved.
+        """
+        self.flush()
+        return self._handler.load_next_unused_task()
+
+    @override
+    def load_next_unused_tasks(self, number: int) -> list[tasks.UID]:
+        """Load the next unused task UIDs, in the order they would be used."""
+        self.flush()
+        return self._handler.load_next_unused_tasks(number)
+
+    @override
+    def load_system(self) -> domain.System:
+        """Load the state of the system."""
+        self.flush()
+        return self._handler.load_system()
+
+    @override
+    def is_system_stale(self) -> bool:
+        """Check if the saved system has been changed by someone else.
+
+        Queued saves are made by this data layer, so there's no need to wait
+        for them to be written.
+        """
+        return self._handler.is_system_stale()
+
+    @override
+    def erase(self) -> None:
+        """Erase all data."""
+        self.flush()
+        self._handler.erase()
+
+    @override
+    def save_system(self, system: domain.ISystemView) -> None:
+        """Save the state of the system."""
+        self._queue_save(_QueuedSave(system=system, used_tasks=None))
+
+    @override
+    def save_system_and_indicate_task_used(
+        self, system: domain.ISystemView, used_task: tasks.UID
+    ) -> None:
+        """Save the state of the system and indicate that a new task has been added."""
+        self.save_system_and_indicate_tasks_used(system, [used_task])
+
+    @override
+    def save_system_and_indicate_tasks_used(
+        self, system: domain.ISystemView, used_tasks: Sequence[tasks.UID]
+    ) -> None:
+        """Save the state of the system and indicate that new tasks have been added."""
+        self._queue_save(_QueuedSave(system=system, used_tasks=tuple(used_tasks)))
+
+    def flush(self) -> None:
+        """Wait until all queued saves have been written."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._writer is None)
+
+    def _queue_save(self, save: _QueuedSave) -> None:
+        with self._condition:
+            if self._queued_saves and self._queued_saves[-1].used_tasks is None:
+                logger.debug("Dropping superseded queued save")
+                self._queued_saves.pop()
+            self._queued_saves.append(save)
+
+            if self._writer is not None:
+                return
+
+            self._writer = threading.Thread(
+                target=self._write_queued_saves, name="graft-data-writer"
+            )
+            try:
+                self._writer.start()
+            except RuntimeError:
+                # New threads can't be started while the interpreter is
+                # shutting down, so fall through to writing on this thread
+                logger.warning("Failed to start background writer, writing now")
+            else:
+                return
+
+        self._write_queued_saves()
+
+    def _write_queued_saves(self) -> None:
+        """Write queued saves until there are none left, then stop."""
+        while True:
+            with self._condition:
+                if not self._queued_saves:
+                    self._writer = None
+                    self._condition.notify_all()
+                    return
+                save = self._queued_saves.popleft()
+
+            try:
+                if save.used_tasks is None:
+                    self._handler.save_system(save.system)
+                elif len(save.used_tasks) == 1:
+                    self._handler.save_system_and_indicate_task_used(
+                        save.system, save.used_tasks[0]
+                    )
+                else:
+                    self._handler.save_system_and_indicate_tasks_used(
+                        save.system, save.used_tasks
+                    )
+            except Exception as e:  # noqa: BLE001 (reported, so the writer carries on)
+                self._on_save_error(e)
@@ -1,5 +1,7 @@
-import copy
+import contextlib
+import dataclasses
 import logging
+from collections.abc import Generator, Sequence
 from typing import Final, override
 
 from graft import architecture, domain
@@ -8,6 +10,16 @@ from graft.domain import tasks
 logger: Final = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class CacheStatistics:
+    """Number of cache hits and misses for each load method."""
+
+    next_unused_task_hits: int = 0
+    next_unused_task_misses: int = 0
+    system_hits: int = 0
+    system_misses: int = 0
+
+
 class CachingDecoratorDataLayer(architecture.DataLayer):
     """Data layer that returns cached values where possible.
 
@@ -15,7 +27,17 @@ class CachingDecoratorDataLayer(architecture.DataLayer):
     value in the cache. The next time the load method is called, return the
     cached value immediately.
 
-    When a save method is called, delegate to the handler and clear the cache.
+    When a save method is called, delegate to the handler and keep a copy-on-write
+    copy of the saved system as the cached system, so it doesn't need to be loaded
+    again. The cached next unused task is cleared if a task has been used.
+
+    The cached system is handed out as a copy-on-write copy, so a cache hit
+    doesn't clone anything until the returned system is modified.
+
+    Loads never check whether the saved system has been changed by someone
+    else, such as another process, as that would read from disk on every cache
+    hit. Instead, the cache is cleared when is_system_stale finds it has been,
+    or when a save fails, as what was saved is then unknown.
     """
 
     def __init__(self, handler: architecture.DataLayer) -> None:
@@ -23,6 +45,12 @@ class CachingDecoratorDataLayer(architecture.DataLayer):
         self._handler = handler
         self._cached_next_unused_task: tasks.UID | None = None
         self._cached_system: domain.System | None = None
+        self._statistics = CacheStatistics()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Return the cache hit and miss counts so far."""
+        return self._statistics
 
     @override
     def load_next_unused_task(self) -> tasks.UID:
@@ -37,24 +65,53 @@ class CachingDecoratorDataLayer(architecture.DataLayer):
         """
         if self._cached_next_unused_task is not None:
             logger.debug("Next unused task cache hit")
+            self._statistics = dataclasses.replace(
+                self._statistics,
+                next_unused_task_hits=self._statistics.next_unused_task_hits + 1,
+            )
             return self._cached_next_unused_task
 
         logger.debug("Next unused task cache miss")
+        self._statistics = dataclasses.replace(
+            self._statistics,
+            next_unused_task_misses=self._statistics.next_unused_task_misses + 1,
+        )
         self._cached_next_unused_task = self._handler.load_next_unused_task()
         return self._cached_next_unused_task
 
+    @override
+    def load_next_unused_tasks(self, number: int) -> list[tasks.UID]:
+        """Load the next unused task UIDs, in the order they would be used."""
+        return self._handler.load_next_unused_tasks(number)
+
     @override
     def load_system(self) -> domain.System:
         """Load the state of the system."""
-        # TODO: Improve deep copy performance by implementing deep-copy dunder
-        # for record-style classes (Name, Description, etc)
         if self._cached_system is not None:
             logger.debug("System cache hit")
-            return copy.deepcopy(self._cached_system)
+            self._statistics = dataclasses.replace(
+                self._statistics, system_hits=self._statistics.system_hits + 1
+            )
+            return self._cached_system.copy_on_write()
 
         logger.debug("System cache miss")
+        self._statistics = dataclasses.replace(
+            self._statistics, system_misses=self._statistics.system_misses + 1
+        )
         self._cached_system = self._handler.load_system()
-        return copy.deepcopy(self._cached_system)
+        return self._cached_system.copy_on_write()
+
+    @override
+    def is_system_stale(self) -> bool:
+        """Check if the saved system has been changed by someone else.
+
+        If it has, the cache is cleared, so the latest system is loaded next.
+        """
+        is_stale = self._handler.is_system_stale()
+        if is_stale:
+            logger.debug("System is stale, clearing cache")
+            self._clear_cache()
+        return is_stale
 
     @override
     def erase(self) -> None:
@@ -65,16 +122,50 @@ class CachingDecoratorDataLayer(architecture.DataLayer):
     @override
     def save_system(self, system: domain.ISystemView) -> None:
         """Save the state of the system."""
-        self._handler.save_system(system)
-        self._clear_cache()
+        with self._clearing_cache_on_error():
+            self._handler.save_system(system)
+        self._cache_saved_system(system)
 
     @override
     def save_system_and_indicate_task_used(
         self, system: domain.ISystemView, used_task: tasks.UID
     ) -> None:
         """Save the state of the system and indicate that a new task has been added."""
-        self._handler.save_system_and_indicate_task_used(system, used_task)
-        self._clear_cache()
+        with self._clearing_cache_on_error():
+            self._handler.save_system_and_indicate_task_used(system, used_task)
+        self._cached_next_unused_task = None
+        self._cache_saved_system(system)
+
+    @override
+    def save_system_and_indicate_tasks_used(
+        self, system: domain.ISystemView, used_tasks: Sequence[tasks.UID]
+    ) -> None:
+        """Save the state of the system and indicate that new tasks have been added."""
+        with self._clearing_cache_on_error():
+            self._handler.save_system_and_indicate_tasks_used(system, used_tasks)
+        self._cached_next_unused_task = None
+        self._cache_saved_system(system)
+
+    def _cache_saved_system(self, system: domain.ISystemView) -> None:
+        """Replace the cached system with the saved system.
+
+        Saved systems aren't modified, so a copy-on-write copy is enough, and
+        only views of other kinds of system have to be cloned.
+        """
+        self._cached_system = (
+            system.copy_on_write()
+            if isinstance(system, domain.System)
+            else domain.System(task_system=system.task_system().clone())
+        )
+
+    @contextlib.contextmanager
+    def _clearing_cache_on_error(self) -> Generator[None, None, None]:
+        """Clear the cache if a save fails, as it may or may not have been made."""
+        try:
+            yield
+        except:
+            self._clear_cache()
+            raise
 
     def _clear_cache(self) -> None:
         """Clear the cache."""
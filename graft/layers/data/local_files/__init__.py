@@ -1,3 +1,6 @@
 """Implementation of data layer using local files."""
 
-from graft.layers.data.local_files.local_files import LocalFilesDataLayer
+from graft.layers.data.local_files.local_files import (
+    LocalFilesDataLayer,
+    get_cache_directory,
+)
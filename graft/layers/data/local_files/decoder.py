@@ -1,19 +1,25 @@
 from typing import Protocol
 
 from graft.domain import tasks
+from graft.layers.data.local_files.text_io import TextReader
+from graft.layers.data.local_files.versioning import SystemVersion
 
 
 class DecodeAttributesRegisterFn(Protocol):
-    def __call__(self, text: str) -> tasks.AttributesRegister: ...
+    def __call__(self, file: TextReader) -> tasks.AttributesRegister: ...
 
 
 class DecodeHierarchyGraphFn(Protocol):
-    def __call__(self, text: str) -> tasks.HierarchyGraph: ...
+    def __call__(self, file: TextReader) -> tasks.HierarchyGraph: ...
 
 
 class DecodeDependencyGraphFn(Protocol):
-    def __call__(self, text: str) -> tasks.DependencyGraph: ...
+    def __call__(self, file: TextReader) -> tasks.DependencyGraph: ...
 
 
 class DecodeNextUnusedTaskFn(Protocol):
-    def __call__(self, text: str) -> tasks.UID: ...
+    def __call__(self, file: TextReader) -> tasks.UID: ...
+
+
+class DecodeSystemVersionFn(Protocol):
+    def __call__(self, file: TextReader) -> SystemVersion: ...
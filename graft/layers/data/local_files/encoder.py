@@ -1,19 +1,27 @@
 from typing import Protocol
 
 from graft.domain import tasks
+from graft.layers.data.local_files.text_io import TextWriter
+from graft.layers.data.local_files.versioning import SystemVersion
 
 
 class EncodeAttributesRegisterFn(Protocol):
-    def __call__(self, register: tasks.IAttributesRegisterView) -> str: ...
+    def __call__(
+        self, register: tasks.IAttributesRegisterView, file: TextWriter
+    ) -> None: ...
 
 
 class EncodeHierarchyGraphFn(Protocol):
-    def __call__(self, graph: tasks.IHierarchyGraphView) -> str: ...
+    def __call__(self, graph: tasks.IHierarchyGraphView, file: TextWriter) -> None: ...
 
 
 class EncodeDependencyGraphFn(Protocol):
-    def __call__(self, graph: tasks.IDependencyGraphView) -> str: ...
+    def __call__(self, graph: tasks.IDependencyGraphView, file: TextWriter) -> None: ...
 
 
 class EncodeNextUnusedTaskFn(Protocol):
-    def __call__(self, task: tasks.UID) -> str: ...
+    def __call__(self, task: tasks.UID, file: TextWriter) -> None: ...
+
+
+class EncodeSystemVersionFn(Protocol):
+    def __call__(self, system_version: SystemVersion, file: TextWriter) -> None: ...
@@ -0,0 +1,173 @@
+"""Incremental reading and writing of top-level JSON objects.
+
+The standard json module only works on whole documents, so the entire document
+has to be held in memory as a single string. These functions instead work on
+one top-level key-value pair at a time.
+"""
+
+import json
+from collections.abc import Generator, Iterable
+from typing import Any, Final
+
+from graft.layers.data.local_files.text_io import TextReader, TextWriter
+
+_READ_CHUNK_SIZE_CHARACTERS: Final = 64 * 1024
+
+_WHITESPACE: Final = frozenset(" \t\n\r")
+
+_OBJECT_START: Final = "{"
+_OBJECT_END: Final = "}"
+_KEY_SEPARATOR: Final = ":"
+_ITEM_SEPARATOR: Final = ","
+
+# Characters that can appear in a number, so a number is only complete once a
+# different character or the end of the file follows it
+_NUMBER_START_CHARACTERS: Final = frozenset("-0123456789")
+_NUMBER_CHARACTERS: Final = frozenset("+-.0123456789eE")
+
+# Match the default separators used by json.dumps, so the output is identical
+_ENCODED_KEY_SEPARATOR: Final = ": "
+_ENCODED_ITEM_SEPARATOR: Final = ", "
+
+_decoder: Final = json.JSONDecoder()
+
+
+def dump_object_items(items: Iterable[tuple[str, Any]], file: TextWriter) -> None:
+    """Write key-value pairs to a file as a single JSON object.
+
+    Each pair is encoded and written as it is produced, rather than building up
+    the whole document first. The text written is the same as json.dump would
+    write for the equivalent dictionary.
+    """
+    file.write(_OBJECT_START)
+    for index, (key, value) in enumerate(items):
+        if index != 0:
+            file.write(_ENCODED_ITEM_SEPARATOR)
+        file.write(json.dumps(key))
+        file.write(_ENCODED_KEY_SEPARATOR)
+        file.write(json.dumps(value))
+    file.write(_OBJECT_END)
+
+
+class _JSONReader:
+    """Reads JSON tokens and values from a file a chunk at a time.
+
+    Only the unconsumed part of the current chunk is kept in the buffer, so a
+    value larger than a single chunk is the most that is ever held in memory.
+    """
+
+    def __init__(self, file: TextReader) -> None:
+        self._file = file
+        self._buffer = ""
+        self._position = 0
+        self._is_file_exhausted = False
+
+    def _read_chunk(self) -> bool:
+        """Append the next chunk of the file to the buffer.
+
+        Returns False if there is nothing left to read.
+        """
+        if self._is_file_exhausted:
+            return False
+
+        chunk = self._file.read(_READ_CHUNK_SIZE_CHARACTERS)
+        if not chunk:
+            self._is_file_exhausted = True
+            return False
+
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _end_of_data_error(self) -> json.JSONDecodeError:
+        return json.JSONDecodeError(
+            "Unexpected end of data", self._buffer, self._position
+        )
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self._position < len(self._buffer):
+                if self._buffer[self._position] not in _WHITESPACE:
+                    return
+                self._position += 1
+
+            if not self._read_chunk():
+                raise self._end_of_data_error()
+
+    def peek_character(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        self._skip_whitespace()
+        return self._buffer[self._position]
+
+    def consume_character(self, expected: str) -> None:
+        """Consume the next non-whitespace character, which must be as expected."""
+        character = self.peek_character()
+        if character != expected:
+            msg = f"Expected [{expected}], found [{character}]"
+            raise json.JSONDecodeError(msg, self._buffer, self._position)
+        self._position += 1
+
+    def _read_until_number_end(self) -> None:
+        """Read chunks until the number at the current position is complete.
+
+        Decoding a number cut off by the end of a chunk, such as after [1.] or
+        [1e], would otherwise decode just the part before the cut.
+        """
+        end = self._position
+        while True:
+            while end < len(self._buffer):
+                if self._buffer[end] not in _NUMBER_CHARACTERS:
+                    return
+                end += 1
+
+            unconsumed_length = end - self._position
+            if not self._read_chunk():
+                return
+            end = self._position + unconsumed_length
+
+    def consume_value(self) -> Any:  # noqa: ANN401 (values are any JSON type, as with json.load)
+        """Consume the next JSON value."""
+        self._skip_whitespace()
+        if self._buffer[self._position] in _NUMBER_START_CHARACTERS:
+            self._read_until_number_end()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # The value may be incomplete because it runs on into the next
+                # chunk
+                if self._read_chunk():
+                    continue
+                raise
+
+            self._position = end
+            return value
+
+
+def load_object_items(file: TextReader) -> Generator[tuple[str, Any], None, None]:
+    """Lazily read the key-value pairs of a JSON object from a file.
+
+    Pairs are parsed and yielded one at a time as the file is read, in the
+    order they appear in the file.
+    """
+    reader = _JSONReader(file)
+    reader.consume_character(_OBJECT_START)
+
+    if reader.peek_character() == _OBJECT_END:
+        reader.consume_character(_OBJECT_END)
+        return
+
+    while True:
+        key = reader.consume_value()
+        if not isinstance(key, str):
+            msg = f"Expected object key to be a string, found [{key!r}]"
+            raise TypeError(msg)
+        reader.consume_character(_KEY_SEPARATOR)
+        yield key, reader.consume_value()
+
+        if reader.peek_character() == _OBJECT_END:
+            reader.consume_character(_OBJECT_END)
+            return
+
+        reader.consume_character(_ITEM_SEPARATOR)
@@ -1,24 +1,34 @@
 """Local file data-layer implementation and associated exceptions."""
 
+import dataclasses
+import datetime as dt
 import enum
+import functools
+import hashlib
+import io
+import itertools
 import logging
 import os
 import pathlib
 import platform
-import shutil
 import tempfile
-from collections.abc import Callable, Iterable
-from typing import Final, override
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from typing import IO, Final, cast, override
 
 from graft import app_name, architecture, domain
 from graft.domain import tasks
 from graft.layers.data.local_files import (
     next_unused_task,
+    system_version,
     task_attributes_register,
     task_dependency_graph,
     task_hierarchy_graph,
+    versioning,
 )
 from graft.layers.data.local_files.file_schema_version import FileSchemaVersion
+from graft.layers.data.local_files.text_io import TextReader, TextWriter
+from graft.layers.data.save_errors import log_save_error
 
 _DATA_DIRECTORY_PATH_ENVIRONMENT_VARIABLE_KEY: Final = (
     f"{app_name.APP_NAME}_DATA_DIRECTORY_PATH"
@@ -28,8 +38,16 @@ _FIRST_TASK: Final = tasks.UID(1)
 
 _DEFAULT_DATA_DIRECTORY_NAME: Final = "data"
 
+_DEFAULT_CACHE_DIRECTORY_NAME: Final = "cache"
+
+_LOCK_FILENAME: Final = "lock"
+
 _ENCODED_FILE_SCHEMA_VERSION_1: Final = "1"
 
+_FILE_BUFFER_SIZE_BYTES: Final = 1024 * 1024
+
+_CONTENTS_HASH_SIZE_BYTES: Final = 16
+
 logger: Final = logging.getLogger(__name__)
 
 
@@ -51,42 +69,84 @@ def _decode_version(text: str) -> FileSchemaVersion:
     raise ValueError(msg)
 
 
-def _decode_versioned_file_contents[T](
-    contents: str, get_decoder: Callable[[FileSchemaVersion], Callable[[str], T]]
-) -> T:
-    encoded_version, encoded_object = contents.split("\n", 1)
-    version = _decode_version(encoded_version)
-    decode = get_decoder(version)
-    return decode(encoded_object)
+class _HashingWriter:
+    """Text stream that hashes everything written through it to another stream."""
+
+    def __init__(self, file: TextWriter) -> None:
+        self._file = file
+        self._hash = hashlib.blake2b(digest_size=_CONTENTS_HASH_SIZE_BYTES)
+
+    def write(self, s: str, /) -> int:
+        self._hash.update(s.encode())
+        return self._file.write(s)
+
+    def digest(self) -> bytes:
+        return self._hash.digest()
+
+
+class _HashingReader:
+    """Text stream that hashes everything read through it from another stream."""
+
+    def __init__(self, file: IO[str]) -> None:
+        self._file = file
+        self._hash = hashlib.blake2b(digest_size=_CONTENTS_HASH_SIZE_BYTES)
+
+    def read(self, size: int = -1, /) -> str:
+        text = self._file.read(size)
+        self._hash.update(text.encode())
+        return text
+
+    def readline(self) -> str:
+        text = self._file.readline()
+        self._hash.update(text.encode())
+        return text
+
+    def digest(self) -> bytes:
+        return self._hash.digest()
 
 
 def _load_from_versioned_file[T](
-    file: pathlib.Path, get_decoder: Callable[[FileSchemaVersion], Callable[[str], T]]
-) -> T:
+    file: pathlib.Path,
+    get_decoder: Callable[[FileSchemaVersion], Callable[[TextReader], T]],
+) -> tuple[T, bytes]:
     """Load data from a file according to the current schema.
 
     The file should start with the version number on the first line. This is
     used to look up the corresponding decoder. As a result, the file schema can
     change, as long as a corresponding decoder is available.
-    """
-    contents = file.read_text()
-    return _decode_versioned_file_contents(contents, get_decoder)
 
+    The decoder reads the rest of the file through a buffered stream, so the
+    file contents never need to be held in memory as a single string.
 
-def _encode_as_versioned_file_contents[T](
+    Returns the decoded object along with a hash of the file contents.
+    """
+    with file.open(buffering=_FILE_BUFFER_SIZE_BYTES) as f:
+        reader = _HashingReader(f)
+        encoded_version = reader.readline().removesuffix("\n")
+        version = _decode_version(encoded_version)
+        decode = get_decoder(version)
+        obj = decode(reader)
+        # Make sure anything after the encoded object is hashed as well
+        reader.read()
+    return obj, reader.digest()
+
+
+def _write_versioned_file_contents[T](
+    file: TextWriter,
     obj: T,
     version: FileSchemaVersion,
-    get_encoder: Callable[[FileSchemaVersion], Callable[[T], str]],
-) -> str:
-    """Encode object as versioned file content.
+    get_encoder: Callable[[FileSchemaVersion], Callable[[T, TextWriter], None]],
+) -> None:
+    """Write object to a file as versioned file content.
 
-    The version number is located on the first line. The object is encoded as a
-    string and stored on the second line onwards.
+    The version number is located on the first line. The object is encoded
+    straight into the file from the second line onwards.
     """
     encoded_version = _encode_version(version)
     encode = get_encoder(version)
-    encoded_obj = encode(obj)
-    return f"{encoded_version}\n{encoded_obj}\n"
+    file.write(f"{encoded_version}\n")
+    encode(obj, file)
+    file.write("\n")
 
 
 def _get_operating_system() -> OperatingSystem:
@@ -123,34 +183,104 @@ def _get_data_directory() -> pathlib.Path:
     return _get_default_data_directory(_get_operating_system())
 
 
+def get_cache_directory() -> pathlib.Path:
+    """Get the directory where caches are stored.
+
+    By default, it's alongside the data directory, in the app's own directory.
+    A data directory specified by the environment variable could be anywhere,
+    so the cache is kept inside it instead.
+
+    Nothing in it is needed to load the system, so it can be safely deleted.
+    """
+    if _DATA_DIRECTORY_PATH_ENVIRONMENT_VARIABLE_KEY in os.environ:
+        return _get_data_directory() / _DEFAULT_CACHE_DIRECTORY_NAME
+
+    return (
+        _get_default_data_directory(_get_operating_system()).parent
+        / _DEFAULT_CACHE_DIRECTORY_NAME
+    )
+
+
 class PartiallyInitialisedError(Exception):
     """Exception raised when a data-layer is partially initialised."""
 
 
-def _save_file_group_atomically(
-    files_with_text: Iterable[tuple[pathlib.Path, str]],
-) -> None:
-    """Write to a group of files atomically, changing no files if any fail.
+def _encode_file_contents(write: Callable[[TextWriter], None]) -> tuple[str, bytes]:
+    """Encode the contents of a file into memory, hashing them as they are written.
 
-    Will break if a file is included twice.
+    Encoding into memory rather than a file means files whose contents haven't
+    changed never touch the disk, and the contents are only ever encoded once.
+
+    Returns the contents along with their hash.
     """
-    file_pairs = list[tuple[pathlib.Path, pathlib.Path]]()
-    try:
-        for file, contents in files_with_text:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=file.suffix, dir=file.parent, delete=False
-            ) as temp_file:
-                file_pairs.append((file, pathlib.Path(temp_file.name)))
-                temp_file.write(contents)
-    except Exception:
-        for _, temp_file in file_pairs:
-            pathlib.Path(temp_file).unlink()
+    buffer = io.StringIO()
+    writer = _HashingWriter(buffer)
+    write(writer)
+    return buffer.getvalue(), writer.digest()
+
+
+def _write_temp_file(file: pathlib.Path, contents: str) -> pathlib.Path:
+    """Write contents to a temporary file beside a file, to replace it later.
+
+    The temporary file isn't synced to disk.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        buffering=_FILE_BUFFER_SIZE_BYTES,
+        suffix=file.suffix,
+        dir=file.parent,
+        delete=False,
+    ) as f:
+        temp_file = pathlib.Path(f.name)
+        try:
+            f.write(contents)
+        except Exception:
+            f.close()
+            temp_file.unlink()
+            raise
+    return temp_file
+
+
+def _replace_files_atomically(temp_files: Mapping[pathlib.Path, pathlib.Path]) -> None:
+    """Replace a group of files with the temporary files written beside them.
+
+    The temporary files are synced to disk before they replace the originals,
+    and the containing directories are synced afterwards, so the whole group is
+    durable once this returns. No files are changed if syncing fails.
+    """
+    for temp_file in temp_files.values():
+        _fsync_file(temp_file)
 
     # Replace command is an atomic operation that cannot fail, given the
     # files are in the same directory
-    for file, temp_file in file_pairs:
+    for file, temp_file in temp_files.items():
         temp_file.replace(file)
 
+    for directory in {file.parent for file in temp_files}:
+        _fsync_directory(directory)
+
+
+def _fsync_file(file: pathlib.Path) -> None:
+    """Flush the contents of a closed file to disk."""
+    # Opened for appending, as syncing needs write access on Windows
+    with file.open("ab") as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(directory: pathlib.Path) -> None:
+    """Flush the entries of a directory to disk, making renames within it durable.
+
+    Does nothing on platforms where directories can't be opened (eg: Windows).
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 def _next_task_uid(uid: tasks.UID) -> tasks.UID:
     """Get the next task UID."""
@@ -161,6 +291,29 @@ def _generate_next_unused_task(current_unused_task: tasks.UID) -> tasks.UID:
     return _next_task_uid(uid=current_unused_task)
 
 
+@dataclasses.dataclass(frozen=True)
+class _LoadedFile[T]:
+    """Decoded contents of a file, as of the system version it was written at.
+
+    The contents are shared with the systems that have been loaded, which never
+    modify them, as they are handed out copy-on-write.
+    """
+
+    file_version: int
+    obj: T
+
+
+@dataclasses.dataclass
+class _PendingSave:
+    """Save that has been requested but not yet written to disk."""
+
+    system: domain.ISystemView
+    unused_task: tasks.UID | None
+    # First of the task UIDs used by the save, if any, which must still be the
+    # next unused task on disk when it's written
+    first_used_task: tasks.UID | None = None
+
+
 class LocalFilesStatus(enum.Enum):
     """Initialisation status of the local filesystem."""
 
@@ -174,15 +327,64 @@ class LocalFilesDataLayer(architecture.DataLayer):
 
     Implementation of the data-layer interface that stores and retrieves data
     from files on the local filesystem.
+
+    If a group-commit window is given, saves are not written straight away.
+    Instead, the saved system is held in memory and written once the window has
+    elapsed since the first unwritten save. Any saves made in the meantime
+    replace the held system, so a burst of saves costs a single durable write
+    of the latest state. Loading or erasing data writes any pending save first.
+
+    Several processes can share the same data directory. Writes hold an
+    exclusive lock on the directory, and loads a shared one, so a load never
+    sees a partly written system. Each write increases the system version
+    stored alongside the data, and is only made if the version is the same as
+    when the system was last loaded or written by this data layer. Otherwise,
+    another process has changed the system in the meantime, and
+    StaleSystemError is raised rather than overwriting its changes. Task UIDs
+    are likewise only marked as used if they are still unused on disk, so two
+    processes can never use the same one. Stale saves are dropped rather than
+    retried, as they can never succeed, so the system has to be loaded again.
+
+    Failures to write pending saves once the group-commit window has elapsed
+    happen in the background, so they are passed to `on_save_error` instead of
+    being raised.
+
+    Loading the system only reads the files that have changed since they were
+    last loaded. The loaded system shares the rest with earlier loads, and is
+    copy-on-write, so nothing is copied unless it's modified.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        group_commit_window: dt.timedelta | None = None,
+        on_save_error: Callable[[Exception], None] | None = None,
+    ) -> None:
         """Initialise LocalFileDataLayer.
 
         If the filesystem has not been initialised, will do so automatically.
         """
         logger.info("Initialising %s", self.__class__.__name__)
         self._data_directory = _get_data_directory()
+        self._group_commit_window = group_commit_window
+        self._on_save_error = (
+            on_save_error if on_save_error is not None else log_save_error
+        )
+        self._pending_save: _PendingSave | None = None
+        # Save taken from pending and being written, which is still the latest
+        # saved state until the write has committed
+        self._in_flight_save: _PendingSave | None = None
+        self._pending_save_timer: threading.Timer | None = None
+        # Only the pending save lock is held while a save is requested, so
+        # callers never wait on disk writes, which are serialised by the write
+        # lock
+        self._pending_save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # Hash of the contents of each file when it was last written or loaded
+        self._file_contents_hashes = dict[pathlib.Path, bytes]()
+        # Version of the system when it was last written or loaded, if ever,
+        # which must still be current for a write to be made
+        self._system_version: versioning.SystemVersion | None = None
+        self._loaded_files = dict[pathlib.Path, _LoadedFile[object]]()
 
         match self._get_local_files_status():
             case LocalFilesStatus.NOT_PRESENT:
@@ -210,19 +412,35 @@ class LocalFilesDataLayer(architecture.DataLayer):
     def _next_unused_task_file(self) -> pathlib.Path:
         return self._data_directory / next_unused_task.FILENAME
 
+    @property
+    def _system_version_file(self) -> pathlib.Path:
+        return self._data_directory / system_version.FILENAME
+
+    @property
+    def _lock_file(self) -> pathlib.Path:
+        return self._data_directory / _LOCK_FILENAME
+
     def _get_local_files_status(self) -> LocalFilesStatus:
-        """Get the initialisation status of the local filesystem."""
-        if not self._data_directory.exists():
+        """Get the initialisation status of the local filesystem.
+
+        Only the data files count, as the data directory can also hold other
+        things, such as caches.
+        """
+        files_exist = [
+            file.exists()
+            for file in (
+                self._task_attributes_register_file,
+                self._task_hierarchy_graph_file,
+                self._task_dependency_graph_file,
+                self._next_unused_task_file,
+            )
+        ]
+        if not any(files_exist):
             return LocalFilesStatus.NOT_PRESENT
 
         return (
             LocalFilesStatus.ALL_PRESENT
-            if (
-                self._task_attributes_register_file.exists()
-                and self._task_hierarchy_graph_file.exists()
-                and self._task_dependency_graph_file.exists()
-                and self._next_unused_task_file.exists()
-            )
+            if all(files_exist)
             else LocalFilesStatus.SOME_PRESENT
         )
 
@@ -237,59 +455,206 @@ class LocalFilesDataLayer(architecture.DataLayer):
         return the same value if called multiple times. The returned value will
         only change save_system_and_indicate_task_used is called with it.
         """
-        return _load_from_versioned_file(
-            self._next_unused_task_file, next_unused_task.get_decoder
+        with self._pending_save_lock:
+            unwritten_unused_task = self._get_unwritten_unused_task()
+        if unwritten_unused_task is not None:
+            return unwritten_unused_task
+
+        with versioning.lock_file(self._lock_file, shared=True):
+            return self._load_file(
+                file=self._next_unused_task_file,
+                get_decoder=next_unused_task.get_decoder,
+            )
+
+    def _get_unwritten_unused_task(self) -> tasks.UID | None:
+        """Get the next unused task indicated by a save not yet written, if any.
+
+        Must be called while holding the pending save lock.
+        """
+        for unwritten_save in (self._pending_save, self._in_flight_save):
+            if unwritten_save is not None and unwritten_save.unused_task is not None:
+                return unwritten_save.unused_task
+        return None
+
+    @override
+    def load_next_unused_tasks(self, number: int) -> list[tasks.UID]:
+        """Load the next unused task UIDs, in the order they would be used.
+
+        Only the first UID is read from disk, as the rest follow on from it.
+        """
+        unused_tasks = list[tasks.UID]()
+        unused_task = self.load_next_unused_task()
+        for _ in range(number):
+            unused_tasks.append(unused_task)
+            unused_task = _generate_next_unused_task(current_unused_task=unused_task)
+        return unused_tasks
+
+    def _load_file[T](
+        self,
+        file: pathlib.Path,
+        get_decoder: Callable[[FileSchemaVersion], Callable[[TextReader], T]],
+    ) -> T:
+        """Load data from a file, checking it matches what was last written.
+
+        If the file has been changed by something else since it was last
+        written, a warning is logged and the new contents are accepted.
+        """
+        obj, contents_hash = _load_from_versioned_file(
+            file=file, get_decoder=get_decoder
         )
 
-    def _load_task_system(self) -> tasks.System:
-        attributes_register = self._load_task_attributes_register()
-        network_graph = self._load_task_network_graph()
+        if (
+            file in self._file_contents_hashes
+            and self._file_contents_hashes[file] != contents_hash
+        ):
+            logger.warning(
+                "File [%s] has changed on disk since it was last written", file
+            )
+        self._file_contents_hashes[file] = contents_hash
+
+        return obj
+
+    def _load_versioned_file[T](
+        self,
+        file: pathlib.Path,
+        get_decoder: Callable[[FileSchemaVersion], Callable[[TextReader], T]],
+        version: versioning.SystemVersion,
+    ) -> T:
+        """Load data from a file, unless it's unchanged since it was last loaded.
+
+        The previously loaded contents are returned as they are, rather than
+        copied, so they must never be modified.
+        """
+        file_version = version.file_versions.get(file.name)
+        loaded_file = self._loaded_files.get(file)
+        if (
+            file_version is not None
+            and loaded_file is not None
+            and loaded_file.file_version == file_version
+        ):
+            logger.debug("File [%s] unchanged since last loaded", file)
+            return cast("T", loaded_file.obj)
+
+        if (
+            self._system_version is not None
+            and self._system_version.file_versions.get(file.name) != file_version
+        ):
+            # Written by another process, so the contents are expected to differ
+            self._file_contents_hashes.pop(file, None)
+
+        obj = self._load_file(file=file, get_decoder=get_decoder)
+        if file_version is not None:
+            self._loaded_files[file] = _LoadedFile[object](
+                file_version=file_version, obj=obj
+            )
+        return obj
+
+    def _load_task_system(self, version: versioning.SystemVersion) -> tasks.System:
+        attributes_register = self._load_task_attributes_register(version)
+        network_graph = self._load_task_network_graph(version)
         return tasks.System(
             attributes_register=attributes_register,
             network_graph=network_graph,
         )
 
-    def _load_task_attributes_register(self) -> tasks.AttributesRegister:
-        return _load_from_versioned_file(
+    def _load_task_attributes_register(
+        self, version: versioning.SystemVersion
+    ) -> tasks.AttributesRegister:
+        return self._load_versioned_file(
             file=self._task_attributes_register_file,
             get_decoder=task_attributes_register.get_decoder,
+            version=version,
         )
 
-    def _load_task_hierarchy_graph(self) -> tasks.HierarchyGraph:
+    def _load_task_hierarchy_graph(
+        self, version: versioning.SystemVersion
+    ) -> tasks.HierarchyGraph:
         """Load the task hierarchy graph."""
-        return _load_from_versioned_file(
+        return self._load_versioned_file(
             file=self._task_hierarchy_graph_file,
             get_decoder=task_hierarchy_graph.get_decoder,
+            version=version,
         )
 
-    def _load_task_dependency_graph(self) -> tasks.DependencyGraph:
+    def _load_task_dependency_graph(
+        self, version: versioning.SystemVersion
+    ) -> tasks.DependencyGraph:
         """Load the task dependency graph."""
-        return _load_from_versioned_file(
+        return self._load_versioned_file(
             file=self._task_dependency_graph_file,
             get_decoder=task_dependency_graph.get_decoder,
+            version=version,
         )
 
-    def _load_task_network_graph(self) -> tasks.NetworkGraph:
+    def _load_task_network_graph(
+        self, version: versioning.SystemVersion
+    ) -> tasks.NetworkGraph:
         """Load the task network graph."""
-        dependency_graph = self._load_task_dependency_graph()
-        hierearchy_graph = self._load_task_hierarchy_graph()
+        dependency_graph = self._load_task_dependency_graph(version)
+        hierearchy_graph = self._load_task_hierarchy_graph(version)
         return tasks.NetworkGraph(
             dependency_graph=dependency_graph, hierarchy_graph=hierearchy_graph
         )
 
+    def _read_system_version(self) -> versioning.SystemVersion:
+        """Read the system version, which is initial if it's never been written."""
+        if not self._system_version_file.exists():
+            return versioning.SystemVersion.initial()
+
+        version, _ = _load_from_versioned_file(
+            file=self._system_version_file, get_decoder=system_version.get_decoder
+        )
+        return version
+
     @override
     def load_system(self) -> domain.System:
-        task_system = self._load_task_system()
-        return domain.System(task_system=task_system)
+        """Load the system, writing any pending save first.
+
+        A pending save that is stale is passed to `on_save_error` rather than
+        raised, as loading the system again is how to recover from it.
+
+        The loaded system is copy-on-write, as it shares its contents with the
+        files that have been loaded, so it's cloned before it is first modified.
+        """
+        try:
+            self.flush()
+        except architecture.StaleSystemError as e:
+            self._on_save_error(e)
+
+        with versioning.lock_file(self._lock_file, shared=True):
+            version = self._read_system_version()
+            task_system = self._load_task_system(version)
+        self._system_version = version
+        return domain.System(task_system=task_system).copy_on_write()
+
+    @override
+    def is_system_stale(self) -> bool:
+        """Check if another process has saved the system since it was last loaded.
+
+        A system that has never been loaded or saved is never stale.
+        """
+        return (
+            self._system_version is not None
+            and self._read_system_version().version != self._system_version.version
+        )
 
     def _create_new_data_files(self) -> None:
-        self._data_directory.mkdir(parents=True)
-        self._save_data(system=domain.System.empty(), unused_task=_FIRST_TASK)
+        self._data_directory.mkdir(parents=True, exist_ok=True)
+        self._write_data(system=domain.System.empty(), unused_task=_FIRST_TASK)
 
     @override
     def erase(self) -> None:
-        shutil.rmtree(self._data_directory)
-        self._create_new_data_files()
+        """Erase all data, whether or not it has changed since it was loaded.
+
+        The files are overwritten with an empty system rather than deleted, so
+        the system version keeps going up, and other processes can tell their
+        loaded systems are out of date.
+        """
+        with self._write_lock:
+            self._take_pending_save()
+            self._write_data(
+                system=domain.System.empty(), unused_task=_FIRST_TASK, force=True
+            )
 
     @override
     def save_system(self, system: domain.ISystemView) -> None:
@@ -299,55 +664,333 @@ class LocalFilesDataLayer(architecture.DataLayer):
     def save_system_and_indicate_task_used(
         self, system: domain.ISystemView, used_task: tasks.UID
     ) -> None:
-        current_unused_task = self.load_next_unused_task()
+        self.save_system_and_indicate_tasks_used(system=system, used_tasks=[used_task])
 
-        if used_task != current_unused_task:
-            # TODO: Add better Exception
-            msg = "Cannot save system with a different unused task UID"
-            raise ValueError(msg)
+    @override
+    def save_system_and_indicate_tasks_used(
+        self, system: domain.ISystemView, used_tasks: Sequence[tasks.UID]
+    ) -> None:
+        """Save the system and reserve a block of task UIDs in a single write.
+
+        The UIDs must follow on from each other. The first is checked to still
+        be the next unused task when the save is written, while holding the
+        lock on the data directory, so no other process can have used them.
+        """
+        if not used_tasks:
+            self._save_data(system=system)
+            return
+
+        for used_task, next_used_task in itertools.pairwise(used_tasks):
+            if next_used_task != _generate_next_unused_task(
+                current_unused_task=used_task
+            ):
+                # TODO: Add better Exception
+                msg = "Cannot save system with used task UIDs that aren't consecutive"
+                raise ValueError(msg)
+
+        new_unused_task = _generate_next_unused_task(current_unused_task=used_tasks[-1])
+        self._save_data(
+            system=system, unused_task=new_unused_task, first_used_task=used_tasks[0]
+        )
 
-        new_unused_task = _generate_next_unused_task(
-            current_unused_task=current_unused_task
+    def flush(self) -> None:
+        """Write any pending save to disk immediately.
+
+        If the write fails, the save is kept pending, to be retried once the
+        group-commit window has elapsed again, or by the next flush. Stale
+        saves are dropped instead, as retrying them would fail the same way.
+        """
+        with self._write_lock:
+            pending_save = self._take_pending_save(in_flight=True)
+            if pending_save is None:
+                return
+
+            try:
+                self._write_data(
+                    system=pending_save.system,
+                    unused_task=pending_save.unused_task,
+                    first_used_task=pending_save.first_used_task,
+                )
+            except architecture.StaleSystemError:
+                with self._pending_save_lock:
+                    self._in_flight_save = None
+                raise
+            except Exception:
+                self._restore_in_flight_save()
+                raise
+
+            with self._pending_save_lock:
+                self._in_flight_save = None
+
+    def _take_pending_save(self, *, in_flight: bool = False) -> _PendingSave | None:
+        """Remove and return the pending save, cancelling its timer.
+
+        If in flight, the save is still treated as the latest saved state until
+        the write has committed.
+        """
+        with self._pending_save_lock:
+            pending_save = self._pending_save
+            self._pending_save = None
+            if in_flight:
+                self._in_flight_save = pending_save
+            if self._pending_save_timer is not None:
+                self._pending_save_timer.cancel()
+                self._pending_save_timer = None
+        return pending_save
+
+    def _restore_in_flight_save(self) -> None:
+        """Make the in-flight save pending again, after its write failed."""
+        with self._pending_save_lock:
+            in_flight_save = self._in_flight_save
+            self._in_flight_save = None
+            if in_flight_save is None:
+                return
+
+            if self._pending_save is None:
+                self._pending_save = in_flight_save
+            else:
+                # The newer save still needs the task UIDs reserved by the
+                # failed one
+                if self._pending_save.unused_task is None:
+                    self._pending_save.unused_task = in_flight_save.unused_task
+                if in_flight_save.first_used_task is not None:
+                    self._pending_save.first_used_task = in_flight_save.first_used_task
+
+            if self._group_commit_window is not None:
+                self._start_pending_save_timer(self._group_commit_window)
+
+    def _start_pending_save_timer(self, group_commit_window: dt.timedelta) -> bool:
+        """Start the timer to write the pending save after the group-commit window.
+
+        Returns False if the timer couldn't be started. Must be called while
+        holding the pending save lock.
+        """
+        if self._pending_save_timer is not None:
+            return True
+
+        # Not a daemon, so that pending saves are still written if the app
+        # exits before the window has elapsed
+        timer = threading.Timer(
+            group_commit_window.total_seconds(),
+            self._flush_after_group_commit_window,
         )
-        self._save_data(system=system, unused_task=new_unused_task)
+        try:
+            timer.start()
+        except RuntimeError:
+            # New threads can't be started while the interpreter is shutting
+            # down
+            logger.warning("Failed to start group-commit timer")
+            return False
+
+        self._pending_save_timer = timer
+        return True
+
+    def _flush_after_group_commit_window(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:  # noqa: BLE001 (reported, as nothing else can catch it)
+            self._on_save_error(e)
 
     def _save_data(
-        self, system: domain.ISystemView, unused_task: tasks.UID | None = None
+        self,
+        system: domain.ISystemView,
+        unused_task: tasks.UID | None = None,
+        first_used_task: tasks.UID | None = None,
     ) -> None:
-        """Save the system and update the unused task file if necessary."""
-        # TODO: Make more efficient by comparing each savable segment (hierarchy
-        # graph, dependency graph, attributes register, etc) with a cached
-        # version from when it was last loaded. If they match, then no need to
-        # save that particular segment as it hasn't changed - skip writing that
-        # file.
-        encoded_task_hierarchy_graph = _encode_as_versioned_file_contents(
-            obj=system.task_system().network_graph().hierarchy_graph(),
-            version=task_hierarchy_graph.CURRENT_VERSION,
-            get_encoder=task_hierarchy_graph.get_encoder,
-        )
-        encoded_task_dependency_graph = _encode_as_versioned_file_contents(
-            obj=system.task_system().network_graph().dependency_graph(),
-            version=task_dependency_graph.CURRENT_VERSION,
-            get_encoder=task_dependency_graph.get_encoder,
-        )
-        encoded_task_attributes_register = _encode_as_versioned_file_contents(
-            obj=system.task_system().attributes_register(),
-            version=task_attributes_register.CURRENT_VERSION,
-            get_encoder=task_attributes_register.get_encoder,
-        )
+        """Save the system and update the unused task file if necessary.
 
-        files_with_text = [
-            (self._task_hierarchy_graph_file, encoded_task_hierarchy_graph),
-            (self._task_dependency_graph_file, encoded_task_dependency_graph),
-            (self._task_attributes_register_file, encoded_task_attributes_register),
+        Written straight away, unless a group-commit window has been set.
+        """
+        if self._group_commit_window is None:
+            with self._write_lock:
+                self._write_data(
+                    system=system,
+                    unused_task=unused_task,
+                    first_used_task=first_used_task,
+                )
+            return
+
+        with self._pending_save_lock:
+            unwritten_unused_task = self._get_unwritten_unused_task()
+            if (
+                first_used_task is not None
+                and unwritten_unused_task is not None
+                and first_used_task != unwritten_unused_task
+            ):
+                # TODO: Add better Exception
+                msg = "Cannot save system with a different unused task UID"
+                raise ValueError(msg)
+
+            if self._pending_save is not None:
+                # Task UIDs are only ever used in increasing order, so the
+                # latest unused task to be indicated is always the one to keep,
+                # and the earliest used task is the one to check
+                if unused_task is None:
+                    unused_task = self._pending_save.unused_task
+                if self._pending_save.first_used_task is not None:
+                    first_used_task = self._pending_save.first_used_task
+            self._pending_save = _PendingSave(
+                system=system, unused_task=unused_task, first_used_task=first_used_task
+            )
+
+            if self._start_pending_save_timer(self._group_commit_window):
+                return
+
+        # Fall through to writing straight away, as the save would otherwise
+        # never be written
+        self.flush()
+
+    def _write_data(
+        self,
+        system: domain.ISystemView,
+        unused_task: tasks.UID | None = None,
+        first_used_task: tasks.UID | None = None,
+        *,
+        force: bool = False,
+    ) -> None:
+        """Write the system to disk, and update the unused task file if necessary.
+
+        Each file is encoded into memory first, and files whose contents are
+        the same as when they were last written or loaded are skipped without
+        touching the disk. The rest are written to temporary files, which
+        replace the originals along with the new system version, while holding
+        the lock on the data directory.
+
+        Unless forced, raises StaleSystemError if the system has been written
+        by another process since this one last loaded or wrote it, or if the
+        first used task is no longer the next unused task.
+        """
+        files_with_writers: list[tuple[pathlib.Path, Callable[[TextWriter], None]]] = [
+            (
+                self._task_hierarchy_graph_file,
+                functools.partial(
+                    _write_versioned_file_contents,
+                    obj=system.task_system().network_graph().hierarchy_graph(),
+                    version=task_hierarchy_graph.CURRENT_VERSION,
+                    get_encoder=task_hierarchy_graph.get_encoder,
+                ),
+            ),
+            (
+                self._task_dependency_graph_file,
+                functools.partial(
+                    _write_versioned_file_contents,
+                    obj=system.task_system().network_graph().dependency_graph(),
+                    version=task_dependency_graph.CURRENT_VERSION,
+                    get_encoder=task_dependency_graph.get_encoder,
+                ),
+            ),
+            (
+                self._task_attributes_register_file,
+                functools.partial(
+                    _write_versioned_file_contents,
+                    obj=system.task_system().attributes_register(),
+                    version=task_attributes_register.CURRENT_VERSION,
+                    get_encoder=task_attributes_register.get_encoder,
+                ),
+            ),
         ]
 
         if unused_task is not None:
-            encoded_unused_task = _encode_as_versioned_file_contents(
-                unused_task,
-                next_unused_task.CURRENT_VERSION,
-                next_unused_task.get_encoder,
+            files_with_writers.append(
+                (
+                    self._next_unused_task_file,
+                    functools.partial(
+                        _write_versioned_file_contents,
+                        obj=unused_task,
+                        version=next_unused_task.CURRENT_VERSION,
+                        get_encoder=next_unused_task.get_encoder,
+                    ),
+                )
             )
-            files_with_text.append((self._next_unused_task_file, encoded_unused_task))
 
-        _save_file_group_atomically(files_with_text=files_with_text)
+        # Encoded before taking the lock, so other processes aren't held up
+        encoded_files = [
+            (file, *_encode_file_contents(write)) for file, write in files_with_writers
+        ]
+
+        with versioning.lock_file(self._lock_file, shared=False):
+            current_version = self._read_system_version()
+            if not force:
+                self._check_not_stale(current_version, first_used_task)
+
+            if force or current_version != self._system_version:
+                # Can't tell what's on disk, so write every file
+                self._file_contents_hashes.clear()
+
+            temp_files = dict[pathlib.Path, pathlib.Path]()
+            changed_file_contents_hashes = dict[pathlib.Path, bytes]()
+            try:
+                for file, contents, contents_hash in encoded_files:
+                    if self._file_contents_hashes.get(file) == contents_hash:
+                        logger.debug("File [%s] unchanged, skipping write", file)
+                        continue
+                    temp_files[file] = _write_temp_file(file, contents)
+                    changed_file_contents_hashes[file] = contents_hash
+
+                if not temp_files:
+                    return
+
+                new_version = versioning.SystemVersion(
+                    version=current_version.version + 1,
+                    file_versions={
+                        **current_version.file_versions,
+                        **{
+                            file.name: current_version.version + 1
+                            for file in temp_files
+                        },
+                    },
+                )
+                version_contents, _ = _encode_file_contents(
+                    functools.partial(
+                        _write_versioned_file_contents,
+                        obj=new_version,
+                        version=system_version.CURRENT_VERSION,
+                        get_encoder=system_version.get_encoder,
+                    )
+                )
+                temp_files[self._system_version_file] = _write_temp_file(
+                    self._system_version_file, version_contents
+                )
+
+                _replace_files_atomically(temp_files)
+            except Exception:
+                for temp_file in temp_files.values():
+                    temp_file.unlink(missing_ok=True)
+                raise
+
+            self._file_contents_hashes.update(changed_file_contents_hashes)
+            self._system_version = new_version
+
+    def _check_not_stale(
+        self,
+        current_version: versioning.SystemVersion,
+        first_used_task: tasks.UID | None,
+    ) -> None:
+        """Raise StaleSystemError if another process has written the system.
+
+        That is, if the version has changed since this process last loaded or
+        wrote the system, or the first used task is no longer the next unused
+        task. Must be called while holding the lock on the data directory.
+        """
+        if (
+            self._system_version is not None
+            and current_version.version != self._system_version.version
+        ):
+            msg = (
+                f"Cannot save system, as it has been changed from version "
+                f"[{self._system_version.version}] to "
+                f"[{current_version.version}] since it was last loaded"
+            )
+            raise architecture.StaleSystemError(msg)
+
+        if first_used_task is not None:
+            saved_unused_task = self._load_file(
+                file=self._next_unused_task_file,
+                get_decoder=next_unused_task.get_decoder,
+            )
+            if first_used_task != saved_unused_task:
+                msg = (
+                    f"Cannot use task [{first_used_task}], as the next unused "
+                    f"task has been changed to [{saved_unused_task}]"
+                )
+                raise architecture.StaleSystemError(msg)
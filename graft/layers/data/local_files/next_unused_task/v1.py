@@ -1,4 +1,5 @@
 from graft.domain import tasks
+from graft.layers.data.local_files.text_io import TextReader, TextWriter
 
 
 def _encode_uid(uid: tasks.UID) -> str:
@@ -11,9 +12,9 @@ def _decode_uid(number: str) -> tasks.UID:
     return tasks.UID(int(number))
 
 
-def encode_next_unused_task(task: tasks.UID) -> str:
-    return _encode_uid(task)
+def encode_next_unused_task(task: tasks.UID, file: TextWriter) -> None:
+    file.write(_encode_uid(task))
 
 
-def decode_next_unused_task(text: str) -> tasks.UID:
-    return _decode_uid(text)
+def decode_next_unused_task(file: TextReader) -> tasks.UID:
+    return _decode_uid(file.read())
@@ -0,0 +1,28 @@
+from typing import Final
+
+from graft.layers.data.local_files.decoder import DecodeSystemVersionFn
+from graft.layers.data.local_files.encoder import EncodeSystemVersionFn
+from graft.layers.data.local_files.file_schema_version import FileSchemaVersion
+from graft.layers.data.local_files.system_version import v1
+
+FILENAME: Final = "system_version.txt"
+
+CURRENT_VERSION: Final = FileSchemaVersion.V1
+
+
+def get_encoder(version: FileSchemaVersion) -> EncodeSystemVersionFn:
+    match version:
+        case FileSchemaVersion.V1:
+            return v1.encode_system_version
+
+    msg = f"Unsupported schema version: {version}"
+    raise ValueError(msg)
+
+
+def get_decoder(version: FileSchemaVersion) -> DecodeSystemVersionFn:
+    match version:
+        case FileSchemaVersion.V1:
+            return v1.decode_system_version
+
+    msg = f"Unsupported schema version: {version}"
+    raise ValueError(msg)
@@ -0,0 +1,29 @@
+import json
+from typing import Final
+
+from graft.layers.data.local_files.text_io import TextReader, TextWriter
+from graft.layers.data.local_files.versioning import SystemVersion
+
+_VERSION_KEY: Final = "version"
+_FILE_VERSIONS_KEY: Final = "file_versions"
+
+
+def encode_system_version(system_version: SystemVersion, file: TextWriter) -> None:
+    json.dump(
+        {
+            _VERSION_KEY: system_version.version,
+            _FILE_VERSIONS_KEY: dict(sorted(system_version.file_versions.items())),
+        },
+        file,
+    )
+
+
+def decode_system_version(file: TextReader) -> SystemVersion:
+    encoded = json.loads(file.read())
+    return SystemVersion(
+        version=int(encoded[_VERSION_KEY]),
+        file_versions={
+            filename: int(version)
+            for filename, version in encoded[_FILE_VERSIONS_KEY].items()
+        },
+    )
@@ -1,7 +1,8 @@
-import json
-from typing import Any, Final, TypedDict
+from typing import Final, TypedDict
 
 from graft.domain import tasks
+from graft.layers.data.local_files import json_stream
+from graft.layers.data.local_files.text_io import TextReader, TextWriter
 
 _ENCODED_PROGRESS_NOT_STARTED: Final = "not_started"
 _ENCODED_PROGRESS_IN_PROGRESS: Final = "in_progress"
@@ -130,44 +131,22 @@ def _convert_dict_to_attributes(d: TaskAttributesJSONDict) -> tasks.Attributes:
     )
 
 
-def _convert_attributes_register_to_dict(o: Any) -> dict[str, TaskAttributesJSONDict]:
-    """Convert attributes register to dict.
-
-    Meant to be used with json.dump.
-    """
-    # TODO: Improve this hacky function
-    if isinstance(o, (tasks.AttributesRegister, tasks.AttributesRegisterView)):
-        return {
-            _encode_uid(uid): _convert_attributes_to_dict(attributes)
-            for uid, attributes in o.items()
-        }
-
-    raise TypeError
-
-
-def _convert_dict_to_attributes_register(
-    d: dict[Any, Any],
-) -> tasks.AttributesRegister | dict[Any, Any]:
-    """Convert dict to attributes register.
-
-    This function will be called on all dictionaries. If it is not the right
-    format, return the original dictionary. Meant to be used with json.load.
-    """
-    # TODO: Improve this hacky function
-    try:
-        return tasks.AttributesRegister(
-            tasks_with_attributes=(
-                (_decode_uid(number), _convert_dict_to_attributes(attributes_dict))
-                for number, attributes_dict in d.items()
-            )
-        )
-    except ValueError:
-        return d
-
-
-def encode_attributes_register(register: tasks.IAttributesRegisterView) -> str:
-    return json.dumps(register, default=_convert_attributes_register_to_dict)
+def encode_attributes_register(
+    register: tasks.IAttributesRegisterView, file: TextWriter
+) -> None:
+    json_stream.dump_object_items(
+        (
+            (_encode_uid(uid), _convert_attributes_to_dict(attributes))
+            for uid, attributes in register.items()
+        ),
+        file,
+    )
 
 
-def decode_attributes_register(text: str) -> tasks.AttributesRegister:
-    return json.loads(text, object_hook=_convert_dict_to_attributes_register)
+def decode_attributes_register(file: TextReader) -> tasks.AttributesRegister:
+    return tasks.AttributesRegister(
+        tasks_with_attributes=(
+            (_decode_uid(number), _convert_dict_to_attributes(attributes_dict))
+            for number, attributes_dict in json_stream.load_object_items(file)
+        )
+    )
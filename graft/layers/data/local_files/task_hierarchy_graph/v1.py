@@ -1,7 +1,8 @@
-import json
 from collections.abc import Generator, Iterable
 
 from graft.domain import tasks
+from graft.layers.data.local_files import json_stream
+from graft.layers.data.local_files.text_io import TextReader, TextWriter
 
 
 def _encode_uid(uid: tasks.UID) -> str:
@@ -14,36 +15,39 @@ def _decode_uid(number: str) -> tasks.UID:
     return tasks.UID(int(number))
 
 
-def _convert_task_relationships_to_dict(
+def _encode_task_relationships(
     relationships: Iterable[tuple[tasks.UID, Iterable[tasks.UID]]],
-) -> dict[str, list[str]]:
+) -> Generator[tuple[str, list[str]], None, None]:
     """Encode relationships between task UIDs."""
-    return {
-        _encode_uid(task): [_encode_uid(related_task) for related_task in related_tasks]
-        for (task, related_tasks) in relationships
-    }
+    for task, related_tasks in relationships:
+        yield (
+            _encode_uid(task),
+            [_encode_uid(related_task) for related_task in related_tasks],
+        )
 
 
-def _convert_dict_to_task_relationships(
-    d: dict[str, list[str]],
+def _decode_task_relationships(
+    items: Iterable[tuple[str, list[str]]],
 ) -> Generator[tuple[tasks.UID, Generator[tasks.UID, None, None]], None, None]:
     """Decode relationships between task UIDs."""
-    for task, related_tasks in d.items():
+    for task, related_tasks in items:
         yield (
             _decode_uid(task),
             (_decode_uid(related_task) for related_task in related_tasks),
         )
 
 
-def encode_hierarchy_graph(graph: tasks.IHierarchyGraphView) -> str:
-    return json.dumps(
-        ((task, graph.subtasks(task)) for task in graph.tasks()),
-        default=_convert_task_relationships_to_dict,
+def encode_hierarchy_graph(graph: tasks.IHierarchyGraphView, file: TextWriter) -> None:
+    json_stream.dump_object_items(
+        _encode_task_relationships(
+            (task, graph.subtasks(task)) for task in graph.tasks()
+        ),
+        file,
     )
 
 
-def decode_hierarchy_graph(text: str) -> tasks.HierarchyGraph:
-    hierarchy_relationships = json.loads(
-        text, object_hook=_convert_dict_to_task_relationships
+def decode_hierarchy_graph(file: TextReader) -> tasks.HierarchyGraph:
+    hierarchy_relationships = _decode_task_relationships(
+        json_stream.load_object_items(file)
     )
     return tasks.HierarchyGraph(hierarchy_relationships)
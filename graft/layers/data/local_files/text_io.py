@@ -0,0 +1,17 @@
+"""Text streams that files are encoded into and decoded from.
+
+Encoders only ever write to a stream, and decoders only ever read from one, so
+they only need these narrow interfaces, rather than all of IO[str]. That lets
+simple wrappers, such as ones that hash the text passing through, be used in
+place of a file.
+"""
+
+from typing import Protocol
+
+
+class TextWriter(Protocol):
+    def write(self, s: str, /) -> int: ...
+
+
+class TextReader(Protocol):
+    def read(self, size: int = -1, /) -> str: ...
@@ -0,0 +1,66 @@
+"""Versioning and locking of the data directory, shared between processes."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Generator, Mapping
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+@dataclasses.dataclass(frozen=True)
+class SystemVersion:
+    """Version of the saved system, and of each file it's saved in.
+
+    The system version goes up by one every time the system is saved, by any
+    process. Each file version is the system version the file was last written
+    at, so readers can tell which files have changed since they last loaded
+    them.
+    """
+
+    version: int
+    file_versions: Mapping[str, int]
+
+    @classmethod
+    def initial(cls) -> SystemVersion:
+        """Get the version of a system that has never been saved with versions."""
+        return cls(version=0, file_versions={})
+
+
+@contextlib.contextmanager
+def lock_file(file: pathlib.Path, *, shared: bool) -> Generator[None, None, None]:
+    """Lock a file, waiting until no other process holds a conflicting lock.
+
+    Shared locks can be held by several processes at once, but not while another
+    process holds an exclusive lock. On Windows, all locks are exclusive.
+    """
+    with file.open("a+b") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # Locking gives up after retrying for a few seconds
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
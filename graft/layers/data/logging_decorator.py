@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from typing import Final, override
 
 from graft import architecture, domain
@@ -36,6 +37,20 @@ class LoggingDecoratorDataLayer(architecture.DataLayer):
         logger.debug("Next unused task UID [%s] loaded", next_unused_task)
         return next_unused_task
 
+    @override
+    def load_next_unused_tasks(self, number: int) -> list[tasks.UID]:
+        """Load the next unused task UIDs, in the order they would be used."""
+        logger.debug("Loading next [%s] unused task UIDs", number)
+        try:
+            next_unused_tasks = self._handler.load_next_unused_tasks(number)
+        except Exception as e:
+            logger.error(
+                "Failed to load next [%s] unused task UIDs, exception [%s]", number, e
+            )
+            raise
+        logger.debug("Next unused task UIDs %s loaded", next_unused_tasks)
+        return next_unused_tasks
+
     @override
     def load_system(self) -> domain.System:
         """Load the state of the system."""
@@ -48,6 +63,18 @@ class LoggingDecoratorDataLayer(architecture.DataLayer):
         logger.debug("System loaded")
         return system
 
+    @override
+    def is_system_stale(self) -> bool:
+        """Check if the saved system has been changed by someone else."""
+        logger.debug("Checking if system is stale")
+        try:
+            is_stale = self._handler.is_system_stale()
+        except Exception as e:
+            logger.error("Failed to check if system is stale, exception [%s]", e)
+            raise
+        logger.debug("System is stale [%s]", is_stale)
+        return is_stale
+
     @override
     def erase(self) -> None:
         """Erase all data."""
@@ -86,3 +113,24 @@ class LoggingDecoratorDataLayer(architecture.DataLayer):
             )
             raise
         logger.info("System saved and task with UID [%s] marked as used", used_task)
+
+    @override
+    def save_system_and_indicate_tasks_used(
+        self, system: domain.ISystemView, used_tasks: Sequence[tasks.UID]
+    ) -> None:
+        """Save the state of the system and indicate that new tasks have been added."""
+        logger.info(
+            "Saving system and indicating [%s] tasks with UIDs %s used",
+            len(used_tasks),
+            used_tasks,
+        )
+        try:
+            self._handler.save_system_and_indicate_tasks_used(system, used_tasks)
+        except Exception as e:
+            logger.error(
+                "Failed to save system and mark tasks %s used, exception [%s]",
+                used_tasks,
+                e,
+            )
+            raise
+        logger.info("System saved and tasks with UIDs %s marked as used", used_tasks)
@@ -0,0 +1,11 @@
+"""Handling of failures to save in the background, where they can't be raised."""
+
+import logging
+from typing import Final
+
+logger: Final = logging.getLogger(__name__)
+
+
+def log_save_error(e: Exception) -> None:
+    """Log a failure to save in the background, by default the only handling."""
+    logger.error("Failed to save system in the background, exception [%s]", e)
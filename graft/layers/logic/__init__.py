@@ -1,2 +1,3 @@
+from graft.layers.logic.caching_decorator import CachingDecoratorLogicLayer
 from graft.layers.logic.logging_decorator import LoggingDecoratorLogicLayer
 from graft.layers.logic.standard import StandardLogicLayer
@@ -0,0 +1,350 @@
+import contextlib
+import logging
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from typing import Final, override
+
+from graft import architecture, domain
+from graft.domain import changes, tasks
+
+logger: Final = logging.getLogger(__name__)
+
+type _PriorityOrder = list[
+    tuple[tasks.UID, tasks.Importance | None, tasks.Importance | None, tasks.Progress]
+]
+
+# Changes that can't affect any derived values, as they only touch names and
+# descriptions
+_CHANGES_WITHOUT_DERIVED_VALUES: Final = (
+    changes.NameChanged,
+    changes.DescriptionChanged,
+)
+
+
+class _DerivedValuesCache:
+    """Derived values of a system, such as inferred progresses and importances."""
+
+    def __init__(self) -> None:
+        self.progresses = dict[tasks.UID, tasks.Progress]()
+        self.importances = dict[tasks.UID, tasks.Importance | None]()
+        self.active_tasks = dict[tasks.UID, bool]()
+        self.priority_order: _PriorityOrder | None = None
+
+    def clear(self) -> None:
+        self.progresses.clear()
+        self.importances.clear()
+        self.active_tasks.clear()
+        self.priority_order = None
+
+    def invalidate(self, change: changes.SystemChange) -> None:
+        """Forget the values that may have been changed by a change."""
+        if isinstance(change, _CHANGES_WITHOUT_DERIVED_VALUES):
+            return
+
+        if isinstance(change, changes.SystemReplaced):
+            self.clear()
+            return
+
+        for task in change.affected_tasks:
+            self.progresses.pop(task, None)
+            self.importances.pop(task, None)
+
+        # Whether a task is active and the priority order depend on the
+        # progress and importance of tasks across the whole system
+        self.active_tasks.clear()
+        self.priority_order = None
+
+
+def _get_cached_values[K, V](
+    cache: dict[K, V],
+    keys: Iterable[K],
+    get_values: Callable[[Iterable[K]], Iterator[V]],
+) -> Generator[V, None, None]:
+    """Yield the cached value for each key, computing missing values together."""
+    keys = list(keys)
+    missing_keys = [key for key in keys if key not in cache]
+    if missing_keys:
+        cache.update(zip(missing_keys, get_values(missing_keys), strict=True))
+    for key in keys:
+        yield cache[key]
+
+
+class _CachingTaskSystemView(tasks.SystemView):
+    """View of a task system that caches its derived values."""
+
+    def __init__(self, system: tasks.SystemView, cache: _DerivedValuesCache) -> None:
+        super().__init__(system)
+        self._cache = cache
+
+    @override
+    def get_progress(self, task: tasks.UID, /) -> tasks.Progress:
+        return next(self.get_progresses([task]))
+
+    @override
+    def get_progresses(
+        self, tasks_: Iterable[tasks.UID], /
+    ) -> Generator[tasks.Progress, None, None]:
+        return _get_cached_values(
+            self._cache.progresses, tasks_, super().get_progresses
+        )
+
+    @override
+    def get_importance(self, task: tasks.UID, /) -> tasks.Importance | None:
+        return next(self.get_importances([task]))
+
+    @override
+    def get_importances(
+        self, tasks_: Iterable[tasks.UID], /
+    ) -> Generator[tasks.Importance | None, None, None]:
+        return _get_cached_values(
+            self._cache.importances, tasks_, super().get_importances
+        )
+
+    @override
+    def is_active_task(self, task: tasks.UID, /) -> bool:
+        if task not in self._cache.active_tasks:
+            self._cache.active_tasks[task] = super().is_active_task(task)
+        return self._cache.active_tasks[task]
+
+
+class CachingDecoratorLogicLayer(architecture.LogicLayer):
+    """Logic layer that caches values derived from the system.
+
+    Values such as inferred progresses, importances and the priority order are
+    computed at most once per version of the system, and shared between
+    everything that queries them. When the system changes, only the values the
+    change may have affected are forgotten.
+
+    The system version goes up by one every time the system changes.
+    """
+
+    def __init__(self, handler: architecture.LogicLayer) -> None:
+        """Initialise CachingDecoratorLogicLayer."""
+        logger.info("Initialising %s", self.__class__.__name__)
+        self._handler = handler
+        self._cache = _DerivedValuesCache()
+        self._system_version = 0
+        self._batch_depth = 0
+        self._handler.add_change_listener(self._on_changes)
+        logger.info("Initialised %s", self.__class__.__name__)
+
+    @property
+    def system_version(self) -> int:
+        """Version of the system, which goes up every time it changes."""
+        return self._system_version
+
+    def _on_changes(self, system_changes: Sequence[changes.SystemChange]) -> None:
+        self._system_version += 1
+        for change in system_changes:
+            self._cache.invalidate(change)
+
+    @contextlib.contextmanager
+    def _clearing_cache_on_error(self) -> Generator[None, None, None]:
+        """Clear the cache if an operation fails, as it may be partly applied."""
+        try:
+            yield
+        except:
+            self._cache.clear()
+            raise
+
+    @override
+    def erase(self) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.erase()
+
+    @override
+    def reload_if_stale(self) -> bool:
+        with self._clearing_cache_on_error():
+            return self._handler.reload_if_stale()
+
+    @override
+    def add_change_listener(
+        self, listener: Callable[[Sequence[changes.SystemChange]], None]
+    ) -> None:
+        self._handler.add_change_listener(listener)
+
+    @override
+    @contextlib.contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Group operations together, so they succeed or fail as one.
+
+        Changes in a batch are only reported once it ends, so nothing is
+        cached until then, and everything is forgotten if it's rolled back.
+        """
+        self._batch_depth += 1
+        try:
+            with self._clearing_cache_on_error(), self._handler.batch():
+                yield
+        finally:
+            self._batch_depth -= 1
+
+    @override
+    def create_task(
+        self,
+        name: tasks.Name | None = None,
+        description: tasks.Description | None = None,
+    ) -> tasks.UID:
+        with self._clearing_cache_on_error():
+            return self._handler.create_task(name=name, description=description)
+
+    @override
+    def create_tasks(
+        self,
+        number: int,
+        names: Sequence[tasks.Name] | None = None,
+        descriptions: Sequence[tasks.Description] | None = None,
+    ) -> list[tasks.UID]:
+        with self._clearing_cache_on_error():
+            return self._handler.create_tasks(
+                number=number, names=names, descriptions=descriptions
+            )
+
+    @override
+    def get_next_unused_task(self) -> tasks.UID:
+        return self._handler.get_next_unused_task()
+
+    @override
+    def delete_task(self, task: tasks.UID) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.delete_task(task=task)
+
+    @override
+    def update_task_name(self, task: tasks.UID, name: tasks.Name) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.update_task_name(task=task, name=name)
+
+    @override
+    def update_task_description(
+        self, task: tasks.UID, description: tasks.Description
+    ) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.update_task_description(task=task, description=description)
+
+    @override
+    def update_concrete_task_progress(
+        self, task: tasks.UID, progress: tasks.Progress
+    ) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.update_concrete_task_progress(task=task, progress=progress)
+
+    @override
+    def update_task_importance(
+        self, task: tasks.UID, importance: tasks.Importance | None = None
+    ) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.update_task_importance(task=task, importance=importance)
+
+    @override
+    def undo(self) -> bool:
+        with self._clearing_cache_on_error():
+            return self._handler.undo()
+
+    @override
+    def redo(self) -> bool:
+        with self._clearing_cache_on_error():
+            return self._handler.redo()
+
+    @override
+    def get_task_system(self) -> tasks.SystemView:
+        task_system = self._handler.get_task_system()
+        if self._batch_depth > 0:
+            return task_system
+        return _CachingTaskSystemView(task_system, self._cache)
+
+    @override
+    def get_system(self) -> domain.SystemView:
+        return self._handler.get_system()
+
+    @override
+    def get_snapshot(self) -> architecture.SystemSnapshot:
+        return self._handler.get_snapshot()
+
+    @override
+    def get_active_concrete_tasks_in_descending_priority_order(
+        self,
+    ) -> _PriorityOrder:
+        if self._batch_depth > 0:
+            return (
+                self._handler.get_active_concrete_tasks_in_descending_priority_order()
+            )
+
+        if self._cache.priority_order is None:
+            self._cache.priority_order = (
+                self._handler.get_active_concrete_tasks_in_descending_priority_order()
+            )
+        return list(self._cache.priority_order)
+
+    @override
+    def create_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.create_task_hierarchy(supertask=supertask, subtask=subtask)
+
+    @override
+    def delete_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.delete_task_hierarchy(supertask=supertask, subtask=subtask)
+
+    @override
+    def create_task_dependency(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.create_task_dependency(
+                dependee_task=dependee_task, dependent_task=dependent_task
+            )
+
+    @override
+    def delete_task_dependency(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> None:
+        with self._clearing_cache_on_error():
+            self._handler.delete_task_dependency(
+                dependee_task=dependee_task, dependent_task=dependent_task
+            )
+
+    @override
+    def check_delete_task(self, task: tasks.UID) -> architecture.Verdict:
+        return self._handler.check_delete_task(task)
+
+    @override
+    def check_update_concrete_task_progress(
+        self, task: tasks.UID, progress: tasks.Progress
+    ) -> architecture.Verdict:
+        return self._handler.check_update_concrete_task_progress(
+            task=task, progress=progress
+        )
+
+    @override
+    def check_update_task_importance(
+        self, task: tasks.UID, importance: tasks.Importance | None = None
+    ) -> architecture.Verdict:
+        return self._handler.check_update_task_importance(
+            task=task, importance=importance
+        )
+
+    @override
+    def check_create_task_hierarchy(
+        self, supertask: tasks.UID, subtask: tasks.UID
+    ) -> architecture.Verdict:
+        return self._handler.check_create_task_hierarchy(
+            supertask=supertask, subtask=subtask
+        )
+
+    @override
+    def check_create_task_hierarchies(
+        self, hierarchies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[architecture.Verdict]:
+        return self._handler.check_create_task_hierarchies(hierarchies)
+
+    @override
+    def check_create_task_dependency(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> architecture.Verdict:
+        return self._handler.check_create_task_dependency(
+            dependee_task=dependee_task, dependent_task=dependent_task
+        )
+
+    @override
+    def check_create_task_dependencies(
+        self, dependencies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[architecture.Verdict]:
+        return self._handler.check_create_task_dependencies(dependencies)
@@ -1,8 +1,10 @@
+import contextlib
 import logging
+from collections.abc import Callable, Generator, Iterable, Sequence
 from typing import Final, override
 
 from graft import architecture, domain
-from graft.domain import tasks
+from graft.domain import changes, tasks
 
 logger: Final = logging.getLogger(__name__)
 
@@ -27,6 +29,40 @@ class LoggingDecoratorLogicLayer(architecture.LogicLayer):
 
         logger.info("All data erased")
 
+    @override
+    def reload_if_stale(self) -> bool:
+        logger.info("Reloading system if stale")
+        try:
+            is_reloaded = self._handler.reload_if_stale()
+        except Exception as e:
+            logger.warning("Failed to reload system if stale, exception [%s]", e)
+            raise
+        if is_reloaded:
+            logger.info("Stale system reloaded")
+        else:
+            logger.info("System not stale")
+        return is_reloaded
+
+    @override
+    def add_change_listener(
+        self, listener: Callable[[Sequence[changes.SystemChange]], None]
+    ) -> None:
+        logger.debug("Adding change listener [%s]", listener)
+        self._handler.add_change_listener(listener)
+
+    @override
+    @contextlib.contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Group operations together, so they succeed or fail as one."""
+        logger.info("Starting batch")
+        try:
+            with self._handler.batch():
+                yield
+        except BaseException as e:
+            logger.warning("Batch rolled back, exception [%s]", e)
+            raise
+        logger.info("Batch saved")
+
     @override
     def create_task(
         self,
@@ -98,6 +134,25 @@ class LoggingDecoratorLogicLayer(architecture.LogicLayer):
 
         return new_task
 
+    @override
+    def create_tasks(
+        self,
+        number: int,
+        names: Sequence[tasks.Name] | None = None,
+        descriptions: Sequence[tasks.Description] | None = None,
+    ) -> list[tasks.UID]:
+        """Create several new tasks at once."""
+        logger.info("Creating [%s] new tasks", number)
+        try:
+            new_tasks = self._handler.create_tasks(
+                number=number, names=names, descriptions=descriptions
+            )
+        except Exception as e:
+            logger.warning("Failed to create [%s] new tasks, exception [%s]", number, e)
+            raise
+        logger.info("[%s] new tasks created, assigned UIDs %s", number, new_tasks)
+        return new_tasks
+
     @override
     def get_next_unused_task(self) -> tasks.UID:
         logger.debug("Getting next unused task UID")
@@ -221,6 +276,34 @@ class LoggingDecoratorLogicLayer(architecture.LogicLayer):
                     importance,
                 )
 
+    @override
+    def undo(self) -> bool:
+        logger.info("Undoing last operation")
+        try:
+            is_undone = self._handler.undo()
+        except Exception as e:
+            logger.warning("Failed to undo last operation, exception [%s]", e)
+            raise
+        if is_undone:
+            logger.info("Last operation undone")
+        else:
+            logger.info("No operation to undo")
+        return is_undone
+
+    @override
+    def redo(self) -> bool:
+        logger.info("Redoing last undone operation")
+        try:
+            is_redone = self._handler.redo()
+        except Exception as e:
+            logger.warning("Failed to redo last undone operation, exception [%s]", e)
+            raise
+        if is_redone:
+            logger.info("Last undone operation redone")
+        else:
+            logger.info("No undone operation to redo")
+        return is_redone
+
     @override
     def get_task_system(self) -> tasks.SystemView:
         """Return a view of the system."""
@@ -244,6 +327,41 @@ class LoggingDecoratorLogicLayer(architecture.LogicLayer):
         logger.debug("Got system")
         return system
 
+    @override
+    def get_snapshot(self) -> architecture.SystemSnapshot:
+        """Return a snapshot of the system as of the last commit."""
+        logger.debug("Getting snapshot")
+        try:
+            snapshot = self._handler.get_snapshot()
+        except Exception as e:
+            logger.warning("Failed to get snapshot, exception [%s]", e)
+            raise
+        logger.debug("Got snapshot with version [%s]", snapshot.version)
+        return snapshot
+
+    @override
+    def get_active_concrete_tasks_in_descending_priority_order(
+        self,
+    ) -> list[
+        tuple[
+            tasks.UID, tasks.Importance | None, tasks.Importance | None, tasks.Progress
+        ]
+    ]:
+        """Return the active concrete tasks in order of descending priority."""
+        logger.debug("Getting active concrete tasks in descending priority order")
+        try:
+            priority_order = (
+                self._handler.get_active_concrete_tasks_in_descending_priority_order()
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to get active concrete tasks in descending priority order, exception [%s]",
+                e,
+            )
+            raise
+        logger.debug("Got active concrete tasks in descending priority order")
+        return priority_order
+
     @override
     def create_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
         """Create a new hierarchy between the specified tasks."""
@@ -343,3 +461,169 @@ class LoggingDecoratorLogicLayer(architecture.LogicLayer):
             dependee_task,
             dependent_task,
         )
+
+    @override
+    def check_delete_task(self, task: tasks.UID) -> architecture.Verdict:
+        """Check if the specified task can be deleted, without deleting it."""
+        logger.debug("Checking deletion of task with UID [%s]", task)
+        try:
+            verdict = self._handler.check_delete_task(task)
+        except Exception as e:
+            logger.warning(
+                "Failed to check deletion of task with UID [%s], exception [%s]",
+                task,
+                e,
+            )
+            raise
+        logger.debug(
+            "Checked deletion of task with UID [%s], verdict [%s]", task, verdict
+        )
+        return verdict
+
+    @override
+    def check_update_concrete_task_progress(
+        self, task: tasks.UID, progress: tasks.Progress
+    ) -> architecture.Verdict:
+        """Check if the specified concrete task's progress can be updated."""
+        logger.debug(
+            "Checking update of progress of task with UID [%s] to [%s]", task, progress
+        )
+        try:
+            verdict = self._handler.check_update_concrete_task_progress(
+                task=task, progress=progress
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to check update of progress of task with UID [%s] to [%s], exception [%s]",
+                task,
+                progress,
+                e,
+            )
+            raise
+        logger.debug(
+            "Checked update of progress of task with UID [%s] to [%s], verdict [%s]",
+            task,
+            progress,
+            verdict,
+        )
+        return verdict
+
+    @override
+    def check_update_task_importance(
+        self, task: tasks.UID, importance: tasks.Importance | None = None
+    ) -> architecture.Verdict:
+        """Check if the specified task's importance can be updated."""
+        logger.debug(
+            "Checking update of importance of task with UID [%s] to [%s]",
+            task,
+            importance,
+        )
+        try:
+            verdict = self._handler.check_update_task_importance(
+                task=task, importance=importance
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to check update of importance of task with UID [%s] to [%s], exception [%s]",
+                task,
+                importance,
+                e,
+            )
+            raise
+        logger.debug(
+            "Checked update of importance of task with UID [%s] to [%s], verdict [%s]",
+            task,
+            importance,
+            verdict,
+        )
+        return verdict
+
+    @override
+    def check_create_task_hierarchy(
+        self, supertask: tasks.UID, subtask: tasks.UID
+    ) -> architecture.Verdict:
+        """Check if a hierarchy can be created, without creating it."""
+        logger.debug(
+            "Checking creation of hierarchy between supertask with UID [%s] and subtask with UID [%s]",
+            supertask,
+            subtask,
+        )
+        try:
+            verdict = self._handler.check_create_task_hierarchy(
+                supertask=supertask, subtask=subtask
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to check creation of hierarchy between supertask with UID [%s] and subtask with UID [%s], exception [%s]",
+                supertask,
+                subtask,
+                e,
+            )
+            raise
+        logger.debug(
+            "Checked creation of hierarchy between supertask with UID [%s] and subtask with UID [%s], verdict [%s]",
+            supertask,
+            subtask,
+            verdict,
+        )
+        return verdict
+
+    @override
+    def check_create_task_hierarchies(
+        self, hierarchies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[architecture.Verdict]:
+        """Check which of several hierarchies can be created."""
+        logger.debug("Checking creation of hierarchies")
+        try:
+            verdicts = self._handler.check_create_task_hierarchies(hierarchies)
+        except Exception as e:
+            logger.warning("Failed to check creation of hierarchies, exception [%s]", e)
+            raise
+        logger.debug("Checked creation of [%s] hierarchies", len(verdicts))
+        return verdicts
+
+    @override
+    def check_create_task_dependency(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> architecture.Verdict:
+        """Check if a dependency can be created, without creating it."""
+        logger.debug(
+            "Checking creation of dependency between dependee-task with UID [%s] and dependent-task with UID [%s]",
+            dependee_task,
+            dependent_task,
+        )
+        try:
+            verdict = self._handler.check_create_task_dependency(
+                dependee_task=dependee_task, dependent_task=dependent_task
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to check creation of dependency between dependee-task with UID [%s] and dependent-task with UID [%s], exception [%s]",
+                dependee_task,
+                dependent_task,
+                e,
+            )
+            raise
+        logger.debug(
+            "Checked creation of dependency between dependee-task with UID [%s] and dependent-task with UID [%s], verdict [%s]",
+            dependee_task,
+            dependent_task,
+            verdict,
+        )
+        return verdict
+
+    @override
+    def check_create_task_dependencies(
+        self, dependencies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[architecture.Verdict]:
+        """Check which of several dependencies can be created."""
+        logger.debug("Checking creation of dependencies")
+        try:
+            verdicts = self._handler.check_create_task_dependencies(dependencies)
+        except Exception as e:
+            logger.warning(
+                "Failed to check creation of dependencies, exception [%s]", e
+            )
+            raise
+        logger.debug("Checked creation of [%s] dependencies", len(verdicts))
+        return verdicts
@@ -0,0 +1,149 @@
+"""Log of operations made to a system, used to undo and redo them."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import functools
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Final
+
+from graft import domain
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type Step = Callable[[domain.System], None]
+
+DEFAULT_MEMORY_BUDGET_BYTES: Final = 10 * 1024 * 1024
+
+
+def step(method: Callable[..., None], /, **kwargs: object) -> Step:
+    """Create a step that calls a system method with the given arguments."""
+    return functools.partial(method, **kwargs)
+
+
+def _estimate_step_size_bytes(step: Step) -> int:
+    """Estimate the memory used by a step, including the text of its arguments."""
+    size = sys.getsizeof(step)
+    if isinstance(step, functools.partial):
+        size += sum(sys.getsizeof(str(value)) for value in step.keywords.values())
+    return size
+
+
+@dataclasses.dataclass(frozen=True)
+class Operation:
+    """Operation made to a system, along with how to revert it.
+
+    The revert steps are run in order, and leave the system as it was before
+    the apply steps were run.
+    """
+
+    apply_steps: tuple[Step, ...]
+    revert_steps: tuple[Step, ...]
+
+    @classmethod
+    def combine(cls, operations: Iterable[Operation]) -> Operation:
+        """Combine operations into one, which applies and reverts them together."""
+        operations = list(operations)
+        return cls(
+            apply_steps=tuple(
+                step for operation in operations for step in operation.apply_steps
+            ),
+            revert_steps=tuple(
+                step
+                for operation in reversed(operations)
+                for step in operation.revert_steps
+            ),
+        )
+
+    @functools.cached_property
+    def size_bytes(self) -> int:
+        """Estimated memory used by the operation."""
+        return sum(map(_estimate_step_size_bytes, self.apply_steps)) + sum(
+            map(_estimate_step_size_bytes, self.revert_steps)
+        )
+
+    def apply(self, system: domain.System) -> None:
+        """Apply the operation to a system."""
+        for apply_step in self.apply_steps:
+            apply_step(system)
+
+    def revert(self, system: domain.System) -> None:
+        """Revert the operation on a system."""
+        for revert_step in self.revert_steps:
+            revert_step(system)
+
+
+class OperationLog:
+    """Undo and redo history of the operations made to a system.
+
+    Each operation records its own inverse, so undoing or redoing costs the same
+    as the original operation, rather than copying the whole system. Once the
+    estimated memory used by the history exceeds the budget, the oldest
+    operations are forgotten.
+    """
+
+    def __init__(self, memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES) -> None:
+        """Initialise OperationLog."""
+        self._memory_budget_bytes = memory_budget_bytes
+        self._undo_operations = collections.deque[Operation]()
+        self._redo_operations = list[Operation]()
+        self._size_bytes = 0
+
+    def can_undo(self) -> bool:
+        """Return whether there are any operations to undo."""
+        return bool(self._undo_operations)
+
+    def can_redo(self) -> bool:
+        """Return whether there are any operations to redo."""
+        return bool(self._redo_operations)
+
+    def record(self, operation: Operation) -> None:
+        """Record an operation that has just been applied.
+
+        Any operations that had been undone can no longer be redone.
+        """
+        self._size_bytes -= sum(
+            redo_operation.size_bytes for redo_operation in self._redo_operations
+        )
+        self._redo_operations.clear()
+
+        self._undo_operations.append(operation)
+        self._size_bytes += operation.size_bytes
+
+        while self._size_bytes > self._memory_budget_bytes and self._undo_operations:
+            self._size_bytes -= self._undo_operations.popleft().size_bytes
+
+    def undo(self, system: domain.System) -> bool:
+        """Revert the last applied operation on a system.
+
+        Returns whether there was an operation to undo.
+        """
+        if not self._undo_operations:
+            return False
+
+        operation = self._undo_operations[-1]
+        operation.revert(system)
+        self._redo_operations.append(self._undo_operations.pop())
+        return True
+
+    def redo(self, system: domain.System) -> bool:
+        """Reapply the last undone operation on a system.
+
+        Returns whether there was an operation to redo.
+        """
+        if not self._redo_operations:
+            return False
+
+        operation = self._redo_operations[-1]
+        operation.apply(system)
+        self._undo_operations.append(self._redo_operations.pop())
+        return True
+
+    def clear(self) -> None:
+        """Forget all operations."""
+        self._undo_operations.clear()
+        self._redo_operations.clear()
+        self._size_bytes = 0
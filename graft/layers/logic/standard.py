@@ -1,25 +1,111 @@
 """Standard logic-layer implementation and associated exceptions."""
 
+import contextlib
 import logging
+from collections.abc import Callable, Generator, Iterable, Sequence
 from typing import Final, override
 
 from graft import architecture, domain
-from graft.domain import tasks
+from graft.domain import changes, tasks
 from graft.domain.tasks.description import Description
 from graft.domain.tasks.uid import UID
+from graft.layers.logic.operation_log import (
+    DEFAULT_MEMORY_BUDGET_BYTES,
+    Operation,
+    OperationLog,
+    step,
+)
 
 logger: Final = logging.getLogger(__name__)
 
 
+def _create_task_operation(
+    task: tasks.UID, name: tasks.Name, description: tasks.Description
+) -> Operation:
+    return Operation(
+        apply_steps=(
+            step(domain.System.add_task, task=task),
+            step(domain.System.set_task_name, task=task, name=name),
+            step(
+                domain.System.set_task_description, task=task, description=description
+            ),
+        ),
+        revert_steps=(step(domain.System.remove_task, task=task),),
+    )
+
+
+def _task_hierarchy_operation(
+    supertask: tasks.UID, subtask: tasks.UID, *, is_added: bool
+) -> Operation:
+    add_step = step(
+        domain.System.add_task_hierarchy, supertask=supertask, subtask=subtask
+    )
+    remove_step = step(
+        domain.System.remove_task_hierarchy, supertask=supertask, subtask=subtask
+    )
+    return (
+        Operation(apply_steps=(add_step,), revert_steps=(remove_step,))
+        if is_added
+        else Operation(apply_steps=(remove_step,), revert_steps=(add_step,))
+    )
+
+
+def _task_dependency_operation(
+    dependee_task: tasks.UID, dependent_task: tasks.UID, *, is_added: bool
+) -> Operation:
+    add_step = step(
+        domain.System.add_task_dependency,
+        dependee_task=dependee_task,
+        dependent_task=dependent_task,
+    )
+    remove_step = step(
+        domain.System.remove_task_dependency,
+        dependee_task=dependee_task,
+        dependent_task=dependent_task,
+    )
+    return (
+        Operation(apply_steps=(add_step,), revert_steps=(remove_step,))
+        if is_added
+        else Operation(apply_steps=(remove_step,), revert_steps=(add_step,))
+    )
+
+
 class StandardLogicLayer(architecture.LogicLayer):
     """Standard logic layer."""
 
-    def __init__(self, data_layer: architecture.DataLayer) -> None:
-        """Initialise StandardLogicLayer."""
+    def __init__(
+        self,
+        data_layer: architecture.DataLayer,
+        undo_memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+    ) -> None:
+        """Initialise StandardLogicLayer.
+
+        The undo memory budget limits the estimated memory used by the undo
+        and redo history.
+        """
         logger.info("Initialising %s", self.__class__.__name__)
         try:
             super().__init__(data_layer=data_layer)
             self._system = self._data_layer.load_system()
+            # State of the system at the start of the current batch, if any
+            self._batch_initial_system: domain.System | None = None
+            self._batch_depth = 0
+            # Operations made in the current batch, undone together as one
+            self._batch_operations = list[Operation]()
+            self._operation_log = OperationLog(
+                memory_budget_bytes=undo_memory_budget_bytes
+            )
+            self._change_listeners = list[
+                Callable[[Sequence[changes.SystemChange]], None]
+            ]()
+            # Changes that have been made, but not yet passed to listeners
+            self._unpublished_changes = list[changes.SystemChange]()
+            # Whether a save failed as the system is stale, so it's reloaded once
+            # the current batch ends
+            self._is_reload_needed = False
+            self._snapshot = architecture.SystemSnapshot(
+                version=0, system=domain.SystemView(self._system.copy_on_write())
+            )
         except:
             logger.error("Failed to initialise %s", self.__class__.__name__)
             raise
@@ -28,7 +114,203 @@ class StandardLogicLayer(architecture.LogicLayer):
     @override
     def erase(self) -> None:
         self._data_layer.erase()
+        self._reload_system()
+
+    @override
+    def reload_if_stale(self) -> bool:
+        """Reload the system if someone else has saved it since it was loaded.
+
+        Unsaved changes and the undo history are dropped, as they were made to
+        the stale system.
+        """
+        self._check_not_in_batch(action="reload")
+        if not self._data_layer.is_system_stale():
+            return False
+        self._reload_system()
+        return True
+
+    def _reload_system(self) -> None:
+        """Replace the system with the saved one, and publish that it changed."""
+        self._is_reload_needed = False
+        previous_tasks = set(self._system.task_system().tasks())
         self._system = self._data_layer.load_system()
+        self._operation_log.clear()
+        self._unpublished_changes.clear()
+        self._record_system_replaced(previous_tasks)
+        self._publish_changes()
+
+    @contextlib.contextmanager
+    def _reloading_if_stale(self) -> Generator[None, None, None]:
+        """Reload the system if saving fails as it's stale, then re-raise.
+
+        Otherwise every later save would fail too. In a batch, the system is
+        reloaded once the batch ends.
+        """
+        try:
+            yield
+        except architecture.StaleSystemError:
+            logger.warning("Failed to save stale system, so reloading it")
+            if self._batch_depth > 0:
+                self._is_reload_needed = True
+            else:
+                self._reload_system()
+            raise
+
+    @override
+    def add_change_listener(
+        self, listener: Callable[[Sequence[changes.SystemChange]], None]
+    ) -> None:
+        """Add a listener, which is passed the changes made by each operation.
+
+        Listeners are called once the changes have been saved, so changes made in
+        a batch are passed together when the batch ends.
+        """
+        self._change_listeners.append(listener)
+
+    @override
+    @contextlib.contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Group operations together, so they succeed or fail as one.
+
+        Operations made inside the context are applied to the system straight
+        away, but the system is only saved once the context exits. If an
+        exception is raised inside the context, every operation made inside it
+        is rolled back.
+
+        Batches can be nested, in which case the inner batch is part of the
+        outer batch.
+        """
+        if self._batch_depth > 0:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        # Copy-on-write, so the system is only cloned if the batch modifies it
+        self._batch_initial_system = self._system.copy_on_write()
+        self._batch_depth = 1
+        try:
+            yield
+        except BaseException:
+            self._system = self._batch_initial_system
+            self._unpublished_changes.clear()
+            raise
+        else:
+            with self._reloading_if_stale():
+                self._data_layer.save_system(system=self._system.copy_on_write())
+            if self._batch_operations:
+                self._operation_log.record(Operation.combine(self._batch_operations))
+        finally:
+            self._batch_initial_system = None
+            self._batch_depth = 0
+            self._batch_operations.clear()
+            if self._is_reload_needed:
+                self._reload_system()
+
+        self._publish_changes()
+
+    def _apply_operation(self, operation: Operation) -> None:
+        """Apply an operation to the system, and record it so it can be undone."""
+        operation.apply(self._system)
+        self._record_operation(operation)
+
+    def _record_operation(self, operation: Operation) -> None:
+        """Record an applied operation, deferring to the end of any batch."""
+        if self._batch_depth > 0:
+            self._batch_operations.append(operation)
+        else:
+            self._operation_log.record(operation)
+
+    def _record_change(self, change: changes.SystemChange) -> None:
+        """Record a change, to be passed to listeners once it's saved."""
+        self._unpublished_changes.append(change)
+
+    def _record_system_replaced(self, previous_tasks: set[tasks.UID]) -> None:
+        """Record that the system may have changed in any way."""
+        self._record_change(
+            changes.SystemReplaced(
+                affected_tasks=frozenset(
+                    previous_tasks.union(self._system.task_system().tasks())
+                )
+            )
+        )
+
+    def _publish_changes(self) -> None:
+        """Publish a snapshot and pass the recorded changes to listeners.
+
+        Nothing is published in a batch, until the batch ends.
+        """
+        if self._batch_depth > 0 or not self._unpublished_changes:
+            return
+
+        # Copy-on-write, so taking the snapshot doesn't clone anything. The
+        # system is cloned when it is next modified, but the saved system
+        # shares it too, so that clone is made whether or not there's a
+        # snapshot. Replacing the snapshot is atomic, so readers on other
+        # threads always see either the old or the new one
+        self._snapshot = architecture.SystemSnapshot(
+            version=self._snapshot.version + 1,
+            system=domain.SystemView(self._system.copy_on_write()),
+        )
+
+        unpublished_changes = tuple(self._unpublished_changes)
+        self._unpublished_changes.clear()
+        for listener in self._change_listeners:
+            listener(unpublished_changes)
+
+    def _get_task_attributes(self, task: tasks.UID) -> tasks.AttributesView:
+        """Get the attributes of a task, so they can be restored later."""
+        attributes_register = self._system.task_system().attributes_register()
+        if task not in attributes_register:
+            raise tasks.TaskDoesNotExistError(task=task)
+        return attributes_register[task]
+
+    def _save_system(self) -> None:
+        """Save the system, unless in a batch, where it's saved when the batch ends."""
+        if self._batch_initial_system is not None:
+            return
+
+        # Copy-on-write, as the data layer may keep hold of the saved system, so
+        # it is only cloned when this one is next modified
+        with self._reloading_if_stale():
+            self._data_layer.save_system(system=self._system.copy_on_write())
+        self._publish_changes()
+
+    def _get_system_to_save_with_used_tasks(self) -> domain.System:
+        """Get the system to save when indicating new tasks have been added.
+
+        In a batch, task UIDs have to be marked as used straight away, so they
+        aren't handed out again. To keep the batch all-or-nothing, this is done
+        by saving the system as it was at the start of the batch.
+
+        The system is copy-on-write, as the data layer may keep hold of it.
+        """
+        return (
+            self._batch_initial_system
+            if self._batch_initial_system is not None
+            else self._system
+        ).copy_on_write()
+
+    def _save_system_and_indicate_task_used(self, used_task: tasks.UID) -> None:
+        """Save the system and indicate that a new task has been added."""
+        with self._reloading_if_stale():
+            self._data_layer.save_system_and_indicate_task_used(
+                system=self._get_system_to_save_with_used_tasks(), used_task=used_task
+            )
+        self._publish_changes()
+
+    def _save_system_and_indicate_tasks_used(
+        self, used_tasks: Sequence[tasks.UID]
+    ) -> None:
+        """Save the system and indicate that new tasks have been added."""
+        with self._reloading_if_stale():
+            self._data_layer.save_system_and_indicate_tasks_used(
+                system=self._get_system_to_save_with_used_tasks(),
+                used_tasks=used_tasks,
+            )
+        self._publish_changes()
 
     @override
     def create_task(
@@ -41,14 +323,56 @@ class StandardLogicLayer(architecture.LogicLayer):
         description = description if description is not None else tasks.Description()
 
         uid = self._data_layer.load_next_unused_task()
-        self._system.add_task(uid)
-        self._system.set_task_name(uid, name)
-        self._system.set_task_description(uid, description)
-        self._data_layer.save_system_and_indicate_task_used(
-            system=self._system, used_task=uid
+        self._apply_operation(_create_task_operation(uid, name, description))
+        self._record_change(
+            changes.TaskCreated(task=uid, affected_tasks=frozenset([uid]))
         )
+        self._save_system_and_indicate_task_used(used_task=uid)
         return uid
 
+    @override
+    def create_tasks(
+        self,
+        number: int,
+        names: Sequence[tasks.Name] | None = None,
+        descriptions: Sequence[tasks.Description] | None = None,
+    ) -> list[tasks.UID]:
+        """Create several new tasks at once.
+
+        A block of task UIDs is reserved, and the tasks are added to the system
+        and saved together, rather than loading and saving once per task.
+        """
+        names = names if names is not None else [tasks.Name()] * number
+        descriptions = (
+            descriptions if descriptions is not None else [tasks.Description()] * number
+        )
+        if len(names) != number or len(descriptions) != number:
+            msg = "Number of names and descriptions must match number of tasks"
+            raise ValueError(msg)
+
+        if number == 0:
+            return []
+
+        uids = self._data_layer.load_next_unused_tasks(number)
+
+        operation = Operation.combine(
+            _create_task_operation(uid, name, description)
+            for uid, name, description in zip(uids, names, descriptions, strict=True)
+        )
+
+        # Apply to a copy, so the system is unchanged if any task can't be added
+        system = self._system.copy_on_write()
+        operation.apply(system)
+        self._system = system
+        self._record_operation(operation)
+        for uid in uids:
+            self._record_change(
+                changes.TaskCreated(task=uid, affected_tasks=frozenset([uid]))
+            )
+
+        self._save_system_and_indicate_tasks_used(used_tasks=uids)
+        return uids
+
     @override
     def get_next_unused_task(self) -> UID:
         return self._data_layer.load_next_unused_task()
@@ -56,36 +380,191 @@ class StandardLogicLayer(architecture.LogicLayer):
     @override
     def delete_task(self, task: tasks.UID) -> None:
         """Delete a task."""
-        self._system.remove_task(task)
-        self._data_layer.save_system(system=self._system)
+        attributes = self._get_task_attributes(task)
+        revert_steps = [
+            step(domain.System.add_task, task=task),
+            step(domain.System.set_task_name, task=task, name=attributes.name),
+            step(
+                domain.System.set_task_description,
+                task=task,
+                description=attributes.description,
+            ),
+            step(
+                domain.System.set_task_importance,
+                task=task,
+                importance=attributes.importance,
+            ),
+        ]
+        if attributes.progress is not None:
+            revert_steps.append(
+                step(
+                    domain.System.set_task_progress,
+                    task=task,
+                    progress=attributes.progress,
+                )
+            )
+        self._apply_operation(
+            Operation(
+                apply_steps=(step(domain.System.remove_task, task=task),),
+                revert_steps=tuple(revert_steps),
+            )
+        )
+        self._record_change(
+            changes.TaskDeleted(task=task, affected_tasks=frozenset([task]))
+        )
+        self._save_system()
 
     @override
     def update_task_name(self, task: tasks.UID, name: tasks.Name) -> None:
         """Update the specified task's name."""
-        self._system.set_task_name(task, name)
-        self._data_layer.save_system(system=self._system)
+        old_name = self._get_task_attributes(task).name
+        self._apply_operation(
+            Operation(
+                apply_steps=(step(domain.System.set_task_name, task=task, name=name),),
+                revert_steps=(
+                    step(domain.System.set_task_name, task=task, name=old_name),
+                ),
+            )
+        )
+        self._record_change(
+            changes.NameChanged(
+                task=task,
+                old=old_name,
+                new=name,
+                affected_tasks=changes.get_tasks_affected_by_name(
+                    self._system.task_system(), task
+                ),
+            )
+        )
+        self._save_system()
 
     @override
     def update_task_description(self, task: UID, description: Description) -> None:
         """Update the specified task's description."""
-        self._system.set_task_description(task, description)
-        self._data_layer.save_system(system=self._system)
+        old_description = self._get_task_attributes(task).description
+        self._apply_operation(
+            Operation(
+                apply_steps=(
+                    step(
+                        domain.System.set_task_description,
+                        task=task,
+                        description=description,
+                    ),
+                ),
+                revert_steps=(
+                    step(
+                        domain.System.set_task_description,
+                        task=task,
+                        description=old_description,
+                    ),
+                ),
+            )
+        )
+        self._record_change(
+            changes.DescriptionChanged(
+                task=task,
+                old=old_description,
+                new=description,
+                affected_tasks=frozenset([task]),
+            )
+        )
+        self._save_system()
 
     @override
     def update_concrete_task_progress(
         self, task: UID, progress: tasks.Progress
     ) -> None:
         """Update the specified concrete task's progress."""
-        self._system.set_task_progress(task, progress)
-        self._data_layer.save_system(system=self._system)
+        old_progress = self._get_task_attributes(task).progress
+        self._apply_operation(
+            Operation(
+                apply_steps=(
+                    step(domain.System.set_task_progress, task=task, progress=progress),
+                ),
+                revert_steps=(
+                    step(
+                        domain.System.set_task_progress,
+                        task=task,
+                        progress=old_progress,
+                    ),
+                ),
+            )
+        )
+        self._record_change(
+            changes.ProgressChanged(
+                task=task,
+                old=old_progress,
+                new=progress,
+                affected_tasks=changes.get_tasks_affected_by_progress(
+                    self._system.task_system(), task
+                ),
+            )
+        )
+        self._save_system()
 
     @override
     def update_task_importance(
         self, task: UID, importance: tasks.Importance | None = None
     ) -> None:
         """Update the specified task's importance."""
-        self._system.set_task_importance(task, importance)
-        self._data_layer.save_system(system=self._system)
+        old_importance = self._get_task_attributes(task).importance
+        self._apply_operation(
+            Operation(
+                apply_steps=(
+                    step(
+                        domain.System.set_task_importance,
+                        task=task,
+                        importance=importance,
+                    ),
+                ),
+                revert_steps=(
+                    step(
+                        domain.System.set_task_importance,
+                        task=task,
+                        importance=old_importance,
+                    ),
+                ),
+            )
+        )
+        self._record_change(
+            changes.ImportanceChanged(
+                task=task,
+                old=old_importance,
+                new=importance,
+                affected_tasks=changes.get_tasks_affected_by_importance(
+                    self._system.task_system(), task
+                ),
+            )
+        )
+        self._save_system()
+
+    @override
+    def undo(self) -> bool:
+        """Undo the last operation, returning whether there was one to undo."""
+        self._check_not_in_batch(action="undo")
+        previous_tasks = set(self._system.task_system().tasks())
+        if not self._operation_log.undo(self._system):
+            return False
+        self._record_system_replaced(previous_tasks)
+        self._save_system()
+        return True
+
+    @override
+    def redo(self) -> bool:
+        """Redo the last undone operation, returning whether there was one to redo."""
+        self._check_not_in_batch(action="redo")
+        previous_tasks = set(self._system.task_system().tasks())
+        if not self._operation_log.redo(self._system):
+            return False
+        self._record_system_replaced(previous_tasks)
+        self._save_system()
+        return True
+
+    def _check_not_in_batch(self, action: str) -> None:
+        if self._batch_depth > 0:
+            # TODO: Add better Exception
+            msg = f"Cannot {action} inside a batch"
+            raise RuntimeError(msg)
 
     @override
     def get_task_system(self) -> tasks.SystemView:
@@ -96,34 +575,177 @@ class StandardLogicLayer(architecture.LogicLayer):
         """Return a view of the system."""
         return domain.SystemView(self._system)
 
+    @override
+    def get_snapshot(self) -> architecture.SystemSnapshot:
+        """Return a snapshot of the system as of the last commit."""
+        return self._snapshot
+
+    @override
+    def get_active_concrete_tasks_in_descending_priority_order(
+        self,
+    ) -> list[
+        tuple[
+            tasks.UID, tasks.Importance | None, tasks.Importance | None, tasks.Progress
+        ]
+    ]:
+        """Return the active concrete tasks in order of descending priority."""
+        return domain.get_active_concrete_tasks_in_descending_priority_order(
+            self._system
+        )
+
     @override
     def create_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
         """Create a new hierarchy between the specified tasks."""
-        self._system.add_task_hierarchy(supertask=supertask, subtask=subtask)
-        self._data_layer.save_system(system=self._system)
+        self._apply_operation(
+            _task_hierarchy_operation(
+                supertask=supertask, subtask=subtask, is_added=True
+            )
+        )
+        self._record_change(
+            changes.HierarchyAdded(
+                supertask=supertask,
+                subtask=subtask,
+                affected_tasks=changes.get_tasks_affected_by_relationship(
+                    self._system.task_system(), supertask, subtask
+                ),
+            )
+        )
+        self._save_system()
 
     @override
     def delete_task_hierarchy(self, supertask: tasks.UID, subtask: tasks.UID) -> None:
         """Delete the specified hierarchy."""
-        self._system.remove_task_hierarchy(supertask=supertask, subtask=subtask)
-        self._data_layer.save_system(system=self._system)
+        self._apply_operation(
+            _task_hierarchy_operation(
+                supertask=supertask, subtask=subtask, is_added=False
+            )
+        )
+        self._record_change(
+            changes.HierarchyRemoved(
+                supertask=supertask,
+                subtask=subtask,
+                affected_tasks=changes.get_tasks_affected_by_relationship(
+                    self._system.task_system(), supertask, subtask
+                ),
+            )
+        )
+        self._save_system()
 
     @override
     def create_task_dependency(
         self, dependee_task: tasks.UID, dependent_task: tasks.UID
     ) -> None:
         """Create a new dependency between the specified tasks."""
-        self._system.add_task_dependency(
-            dependee_task=dependee_task, dependent_task=dependent_task
+        self._apply_operation(
+            _task_dependency_operation(
+                dependee_task=dependee_task,
+                dependent_task=dependent_task,
+                is_added=True,
+            )
+        )
+        self._record_change(
+            changes.DependencyAdded(
+                dependee_task=dependee_task,
+                dependent_task=dependent_task,
+                affected_tasks=changes.get_tasks_affected_by_relationship(
+                    self._system.task_system(), dependee_task, dependent_task
+                ),
+            )
         )
-        self._data_layer.save_system(system=self._system)
+        self._save_system()
 
     @override
     def delete_task_dependency(
         self, dependee_task: tasks.UID, dependent_task: tasks.UID
     ) -> None:
         """Delete the specified dependency."""
-        self._system.remove_task_dependency(
-            dependee_task=dependee_task, dependent_task=dependent_task
+        self._apply_operation(
+            _task_dependency_operation(
+                dependee_task=dependee_task,
+                dependent_task=dependent_task,
+                is_added=False,
+            )
+        )
+        self._record_change(
+            changes.DependencyRemoved(
+                dependee_task=dependee_task,
+                dependent_task=dependent_task,
+                affected_tasks=changes.get_tasks_affected_by_relationship(
+                    self._system.task_system(), dependee_task, dependent_task
+                ),
+            )
+        )
+        self._save_system()
+
+    def _check(self, validate: Callable[[], None]) -> architecture.Verdict:
+        """Run a validation, returning whether it passed rather than raising."""
+        try:
+            validate()
+        except Exception as e:  # noqa: BLE001
+            return architecture.Verdict(error=e)
+        return architecture.Verdict()
+
+    @override
+    def check_delete_task(self, task: tasks.UID) -> architecture.Verdict:
+        """Check if the specified task can be deleted, without deleting it."""
+        return self._check(lambda: self._system.validate_task_can_be_removed(task))
+
+    @override
+    def check_update_concrete_task_progress(
+        self, task: tasks.UID, progress: tasks.Progress
+    ) -> architecture.Verdict:
+        """Check if the specified concrete task's progress can be updated."""
+        return self._check(
+            lambda: self._system.validate_task_progress_can_be_set(task, progress)
+        )
+
+    @override
+    def check_update_task_importance(
+        self, task: tasks.UID, importance: tasks.Importance | None = None
+    ) -> architecture.Verdict:
+        """Check if the specified task's importance can be updated."""
+        return self._check(
+            lambda: self._system.validate_task_importance_can_be_set(task, importance)
         )
-        self._data_layer.save_system(system=self._system)
+
+    @override
+    def check_create_task_hierarchy(
+        self, supertask: tasks.UID, subtask: tasks.UID
+    ) -> architecture.Verdict:
+        """Check if a hierarchy can be created, without creating it."""
+        return self._check(
+            lambda: self._system.validate_task_hierarchy_can_be_added(
+                supertask, subtask
+            )
+        )
+
+    @override
+    def check_create_task_hierarchies(
+        self, hierarchies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[architecture.Verdict]:
+        """Check which of several hierarchies can be created."""
+        return [
+            self.check_create_task_hierarchy(supertask, subtask)
+            for supertask, subtask in hierarchies
+        ]
+
+    @override
+    def check_create_task_dependency(
+        self, dependee_task: tasks.UID, dependent_task: tasks.UID
+    ) -> architecture.Verdict:
+        """Check if a dependency can be created, without creating it."""
+        return self._check(
+            lambda: self._system.validate_task_dependency_can_be_added(
+                dependee_task, dependent_task
+            )
+        )
+
+    @override
+    def check_create_task_dependencies(
+        self, dependencies: Iterable[tuple[tasks.UID, tasks.UID]]
+    ) -> list[architecture.Verdict]:
+        """Check which of several dependencies can be created."""
+        return [
+            self.check_create_task_dependency(dependee_task, dependent_task)
+            for dependee_task, dependent_task in dependencies
+        ]
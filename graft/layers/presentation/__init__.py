@@ -1 +1,2 @@
+from graft.layers.presentation.tkinter_gui import report_save_error
 from graft.layers.presentation.tkinter_gui import run as run_gui
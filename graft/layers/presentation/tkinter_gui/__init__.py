@@ -1 +1 @@
-from graft.layers.presentation.tkinter_gui.gui import run
+from graft.layers.presentation.tkinter_gui.gui import report_save_error, run
@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import ttk
 
 from graft import architecture
-from graft.layers.presentation.tkinter_gui import event_broker
 
 
 class EraseAllConfirmationWindow(tk.Toplevel):
@@ -24,7 +23,4 @@ class EraseAllConfirmationWindow(tk.Toplevel):
 
     def _erase_all(self) -> None:
         self._logic_layer.erase()
-
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
         self.destroy()
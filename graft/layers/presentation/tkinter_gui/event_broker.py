@@ -1,9 +1,10 @@
 import abc
 import collections
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Self
 
+from graft import domain
 from graft.domain import tasks
 
 logger = logging.getLogger(__name__)
@@ -17,8 +18,20 @@ class Event(abc.ABC):
 
 
 class SystemModified(Event):
+    def __init__(self, changes: Sequence[domain.changes.SystemChange]) -> None:
+        super().__init__()
+        self._changes = tuple(changes)
+
+    @property
+    def changes(self) -> tuple[domain.changes.SystemChange, ...]:
+        return self._changes
+
+    @property
+    def affected_tasks(self) -> frozenset[tasks.UID]:
+        return frozenset().union(*(change.affected_tasks for change in self._changes))
+
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}"
+        return f"{self.__class__.__name__}({', '.join(map(str, self._changes))})"
 
 
 class TaskSelected(Event):
@@ -1,11 +1,23 @@
 import logging
+import pathlib
 import tkinter as tk
+from collections.abc import Sequence
 from types import TracebackType
 
-from graft import app_name, architecture, version
+from graft import app_name, architecture, domain, version
+from graft.layers.presentation.tkinter_gui import event_broker
 from graft.layers.presentation.tkinter_gui.erase_all_confirmation_window import (
     EraseAllConfirmationWindow,
 )
+from graft.layers.presentation.tkinter_gui.helpers import (
+    layout_cache,
+    layout_process_pool,
+    layout_worker,
+    save_error_reporter,
+)
+from graft.layers.presentation.tkinter_gui.save_failed_operation_window import (
+    SaveFailedOperationWindow,
+)
 from graft.layers.presentation.tkinter_gui.tabs.tabs import Tabs
 from graft.layers.presentation.tkinter_gui.tabs.task_panel.creation_deletion_panel.task_creation_window import (
     TaskCreationWindow,
@@ -41,6 +53,11 @@ class GUI(tk.Tk):
         self._tabs.grid(row=1, column=0)
         self._task_details.grid(row=0, column=1, rowspan=2)
 
+        self._logic_layer.add_change_listener(self._publish_system_modified)
+
+        self._save_failed_window: SaveFailedOperationWindow | None = None
+        save_error_reporter.get_singleton().poll(self, self._handle_save_error)
+
     def run(self) -> None:
         self.mainloop()
 
@@ -58,6 +75,31 @@ class GUI(tk.Tk):
         # going to live with the type mismatch and suppress the error
         UnknownExceptionOperationFailedWindow(master=self, exception=exception)
 
+    def _handle_save_error(self, exception: Exception) -> None:
+        # Stale saves are never retried, and every later save would fail too,
+        # so load what the other process saved instead
+        is_reloaded = (
+            isinstance(exception, architecture.StaleSystemError)
+            and self._logic_layer.reload_if_stale()
+        )
+
+        # Failed saves can be retried and fail again, so only show one window
+        # at a time
+        if (
+            self._save_failed_window is not None
+            and self._save_failed_window.winfo_exists()
+        ):
+            return
+        self._save_failed_window = SaveFailedOperationWindow(
+            master=self, exception=exception, is_reloaded=is_reloaded
+        )
+
+    def _publish_system_modified(
+        self, changes: Sequence[domain.changes.SystemChange]
+    ) -> None:
+        broker = event_broker.get_singleton()
+        broker.publish(event_broker.SystemModified(changes))
+
     def _burger_menu_clicked(self) -> None:
         menu = tk.Menu(self, tearoff=0)
         menu.add_command(label="Erase All", command=self._erase_all)
@@ -70,6 +112,24 @@ class GUI(tk.Tk):
         TaskCreationWindow(master=self, logic_layer=self._logic_layer)
 
 
-def run(logic_layer: architecture.LogicLayer) -> None:
+def report_save_error(e: Exception) -> None:
+    """Report a failure to save in the background, to be shown in the GUI.
+
+    Can be called from any thread.
+    """
+    save_error_reporter.get_singleton().report(e)
+
+
+def run(
+    logic_layer: architecture.LogicLayer,
+    layout_cache_file: pathlib.Path | None = None,
+) -> None:
+    if layout_cache_file is not None:
+        layout_cache.get_singleton().persist_to(layout_cache_file)
     gui = GUI(logic_layer)
-    gui.run()
+    try:
+        gui.run()
+    finally:
+        layout_worker.get_singleton().shutdown()
+        layout_process_pool.get_singleton().shutdown()
+        layout_cache.get_singleton().save()
@@ -0,0 +1,22 @@
+class GraphLevelOfDetailThresholds:
+    """Sizes above which a graph is drawn in less detail, so it draws quickly.
+
+    Each edge drawn as an arrow takes a few milliseconds to draw, so graphs with
+    more edges than the threshold have them drawn as plain lines instead. Labels
+    are similarly slow, and unreadable once there are many nodes, so graphs with
+    more nodes than the threshold aren't labelled.
+    """
+
+    def __init__(
+        self, max_nedges_drawn_as_arrows: int = 250, max_nnodes_labelled: int = 500
+    ) -> None:
+        self._max_nedges_drawn_as_arrows = max_nedges_drawn_as_arrows
+        self._max_nnodes_labelled = max_nnodes_labelled
+
+    @property
+    def max_nedges_drawn_as_arrows(self) -> int:
+        return self._max_nedges_drawn_as_arrows
+
+    @property
+    def max_nnodes_labelled(self) -> int:
+        return self._max_nnodes_labelled
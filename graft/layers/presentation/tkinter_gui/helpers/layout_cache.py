@@ -0,0 +1,144 @@
+"""Cache of graph layouts, keyed by the structure of the graph laid out.
+
+Laying out a graph depends only on its nodes and edges, and the layout
+parameters, so the layout is reused whenever a graph with the same structure is
+shown again. This avoids recalculating layouts when only the colours of nodes
+and edges change, such as when a task is selected, or when switching between
+tabs showing the same graph.
+
+The cache can optionally be persisted to a file, so layouts are reused between
+runs. The file is only written when asked, such as when the app shuts down, so
+caching a layout never waits for the whole cache to be written.
+"""
+
+import collections
+import hashlib
+import logging
+import pathlib
+import pickle
+from collections.abc import Hashable, Iterable
+from typing import Any, Final, cast
+
+logger: Final = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE: Final = 64
+
+
+def get_structure_key(
+    layout_name: str,
+    nodes: Iterable[Hashable],
+    edges: Iterable[tuple[Hashable, Hashable]],
+    parameters: Iterable[object] = (),
+) -> str:
+    """Get the key of a layout of a graph with the given structure.
+
+    The key is the same for graphs with the same nodes and edges, regardless of
+    the order they are given in. Nodes are identified by their repr, so must
+    have one that is unique and stable between runs.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in [
+        [layout_name],
+        sorted(map(repr, nodes)),
+        sorted(f"{source!r}->{target!r}" for source, target in edges),
+        list(map(repr, parameters)),
+    ]:
+        digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """Least-recently-used cache of layouts.
+
+    Layouts are shared between everything that gets them from the cache, so
+    must not be modified.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialise LayoutCache."""
+        self._max_size = max_size
+        self._layouts = collections.OrderedDict[str, object]()
+        self._file: pathlib.Path | None = None
+        # Whether the layouts have changed since they were loaded or saved
+        self._is_modified = False
+
+    def get(self, key: str) -> Any | None:
+        """Get the layout with the key, or None if it isn't cached."""
+        if key not in self._layouts:
+            return None
+
+        self._layouts.move_to_end(key)
+        return self._layouts[key]
+
+    def add(self, key: str, layout: object) -> None:
+        """Cache a layout, evicting the least recently used if full."""
+        self._layouts[key] = layout
+        self._layouts.move_to_end(key)
+        if len(self._layouts) > self._max_size:
+            self._layouts.popitem(last=False)
+        self._is_modified = True
+
+    def clear(self) -> None:
+        """Forget all cached layouts."""
+        self._layouts.clear()
+        self._is_modified = True
+
+    def persist_to(self, file: pathlib.Path) -> None:
+        """Persist the cache to a file, first loading any layouts already in it.
+
+        Layouts calculated since are kept, in preference to those loaded.
+        """
+        self._file = file
+        layouts = self._load(file)
+        for key, layout in reversed(layouts.items()):
+            if key not in self._layouts:
+                self._layouts[key] = layout
+                self._layouts.move_to_end(key, last=False)
+        while len(self._layouts) > self._max_size:
+            self._layouts.popitem(last=False)
+
+    def _load(self, file: pathlib.Path) -> dict[str, Any]:
+        if not file.exists():
+            return {}
+
+        try:
+            with file.open("rb") as f:
+                layouts = pickle.load(f)  # noqa: S301 (only ever written by graft)
+        except Exception as e:  # noqa: BLE001
+            # The cache can always be recalculated, so a missing or corrupt
+            # file isn't a problem
+            logger.warning(
+                "Failed to load layout cache from [%s], exception [%s]", file, e
+            )
+            return {}
+
+        if not isinstance(layouts, dict):
+            logger.warning("Layout cache in [%s] is invalid, ignoring", file)
+            return {}
+        return cast("dict[str, Any]", layouts)
+
+    def save(self) -> None:
+        """Save the cache to the file it's persisted to, if it has changed."""
+        if self._file is None or not self._is_modified:
+            return
+
+        # Written to a temporary file first, so a crash can't leave a partly
+        # written cache
+        temporary_file = self._file.with_suffix(self._file.suffix + ".tmp")
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            with temporary_file.open("wb") as f:
+                pickle.dump(dict(self._layouts), f)
+            temporary_file.replace(self._file)
+            self._is_modified = False
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Failed to save layout cache to [%s], exception [%s]", self._file, e
+            )
+
+
+_singleton = LayoutCache()
+
+
+def get_singleton() -> LayoutCache:
+    return _singleton
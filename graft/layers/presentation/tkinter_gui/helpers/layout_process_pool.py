@@ -0,0 +1,100 @@
+"""Pool of processes that the components of graphs are laid out in, in parallel.
+
+Laying out a graph is CPU-bound Python, so threads can't speed it up, but the
+components of a graph are laid out independently, so can be spread across
+processes instead. Starting processes is slow, so the pool is only started the
+first time a graph large enough to benefit is laid out, and is then kept for the
+rest of the run.
+"""
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from collections.abc import Callable, Sequence
+from typing import Final
+
+logger: Final = logging.getLogger(__name__)
+
+# Below this many nodes, sending the components to the processes takes longer
+# than laying them out in this one
+MIN_NNODES_TO_PARALLELISE: Final = 200
+# Components are sent to the processes in chunks, so small components aren't
+# each sent on their own, but with enough chunks per process that a slow
+# component doesn't hold up the rest
+_NCHUNKS_PER_PROCESS: Final = 4
+
+
+class LayoutProcessPool:
+    """Pool of processes that functions are mapped over, when it's worthwhile."""
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialise LayoutProcessPool."""
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+        self._is_shut_down = False
+        # Mapped from the layout worker thread, but shut down from the main one
+        self._lock = threading.Lock()
+
+    def map[A, R](
+        self, fn: Callable[[A], R], args: Sequence[A], nnodes: int
+    ) -> list[R]:
+        """Call the function with each of the args, in order.
+
+        The calls are made in parallel if there are enough nodes between the
+        args to make it worthwhile, so the function and args must be picklable.
+        If the pool can't be used, the calls are made in this process instead.
+        """
+        executor = self._get_executor(nargs=len(args), nnodes=nnodes)
+        if executor is None:
+            return list(map(fn, args))
+
+        chunksize = max(1, len(args) // (_NCHUNKS_PER_PROCESS * self._max_workers))
+        try:
+            return list(executor.map(fn, args, chunksize=chunksize))
+        except (
+            concurrent.futures.BrokenExecutor,
+            OSError,
+            pickle.PicklingError,
+        ) as e:
+            logger.warning(
+                "Failed to lay out in parallel, laying out serially, exception [%s]",
+                e,
+            )
+            return list(map(fn, args))
+
+    def shutdown(self) -> None:
+        """Stop the processes, and make any later calls in this process."""
+        with self._lock:
+            self._is_shut_down = True
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _get_executor(
+        self, nargs: int, nnodes: int
+    ) -> concurrent.futures.ProcessPoolExecutor | None:
+        if self._max_workers <= 1 or nargs <= 1 or nnodes < MIN_NNODES_TO_PARALLELISE:
+            return None
+
+        with self._lock:
+            if self._is_shut_down:
+                return None
+
+            if self._executor is None:
+                # Forking a process with threads running can deadlock, so the
+                # processes are spawned instead
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+_singleton = LayoutProcessPool()
+
+
+def get_singleton() -> LayoutProcessPool:
+    return _singleton
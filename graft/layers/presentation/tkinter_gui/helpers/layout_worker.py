@@ -0,0 +1,105 @@
+"""Calculates graph layouts in the background, so the GUI doesn't freeze.
+
+Layouts are calculated on a worker thread. Tkinter isn't thread-safe, so the
+worker never touches widgets; instead the widget that submitted a layout polls
+for it with `after`, and is given the result on the main thread.
+"""
+
+import concurrent.futures
+import logging
+import tkinter as tk
+from collections.abc import Callable
+from typing import Any, Final
+
+logger: Final = logging.getLogger(__name__)
+
+_POLL_INTERVAL_MS: Final = 20
+
+
+class LayoutJob:
+    """A layout being calculated in the background."""
+
+    def __init__(self, future: concurrent.futures.Future[Any]) -> None:
+        """Initialise LayoutJob."""
+        self._future = future
+        self._is_cancelled = False
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def cancel(self) -> None:
+        """Cancel the job, so its result is never given to the widget.
+
+        A job that has already started can't be stopped, so it runs to the end,
+        but its result is discarded.
+        """
+        self._is_cancelled = True
+        self._future.cancel()
+
+
+class LayoutWorker:
+    """Worker that calculates layouts one at a time, in order of submission."""
+
+    def __init__(self) -> None:
+        """Initialise LayoutWorker."""
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="layout"
+        )
+
+    def submit[V](
+        self,
+        master: tk.Misc,
+        calculate: Callable[[], V],
+        on_calculated: Callable[[V], None],
+        on_failed: Callable[[], None],
+    ) -> LayoutJob:
+        """Calculate a layout in the background.
+
+        `calculate` is run on the worker thread, so must not use anything that
+        can change while it runs, such as widgets or mutable graphs. Once it
+        finishes, `on_calculated` is called with the layout on the main thread,
+        or `on_failed` if it raised, unless the job has been cancelled or the
+        master destroyed.
+        """
+        future = self._executor.submit(calculate)
+        job = LayoutJob(future)
+
+        def poll() -> None:
+            if job.is_cancelled or not master.winfo_exists():
+                return
+
+            if not future.done():
+                _after(master, poll)
+                return
+
+            try:
+                layout = future.result()
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Failed to calculate layout, exception [%s]", e)
+                on_failed()
+                return
+
+            on_calculated(layout)
+
+        _after(master, poll)
+        return job
+
+    def shutdown(self) -> None:
+        """Stop the worker, cancelling any layouts not yet started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _after(master: tk.Misc, callback: Callable[[], None]) -> None:
+    try:
+        master.after(_POLL_INTERVAL_MS, callback)
+    except tk.TclError:
+        # The master has been destroyed, so nothing needs the layout
+        logger.debug("Stopped polling for layout of destroyed widget")
+
+
+_singleton = LayoutWorker()
+
+
+def get_singleton() -> LayoutWorker:
+    return _singleton
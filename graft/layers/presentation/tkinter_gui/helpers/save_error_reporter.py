@@ -0,0 +1,58 @@
+"""Reports failures to save in the background, so they can be shown in the GUI.
+
+Saves are written on background threads. Tkinter isn't thread-safe, so those
+threads never touch widgets; instead failures are queued, and the GUI polls for
+them with `after`, handling them on the main thread.
+"""
+
+import logging
+import queue
+import tkinter as tk
+from collections.abc import Callable
+from typing import Final
+
+logger: Final = logging.getLogger(__name__)
+
+_POLL_INTERVAL_MS: Final = 100
+
+
+class SaveErrorReporter:
+    """Queue of save failures, waiting to be handled by the GUI."""
+
+    def __init__(self) -> None:
+        """Initialise SaveErrorReporter."""
+        self._errors = queue.SimpleQueue[Exception]()
+
+    def report(self, e: Exception) -> None:
+        """Log a save failure and queue it to be handled.
+
+        Can be called from any thread.
+        """
+        logger.error("Failed to save system in the background, exception [%s]", e)
+        self._errors.put(e)
+
+    def poll(self, master: tk.Misc, on_error: Callable[[Exception], None]) -> None:
+        """Pass each reported failure to `on_error` on the main thread.
+
+        Polls until the master is destroyed, even if `on_error` raises.
+        """
+        try:
+            master.after(_POLL_INTERVAL_MS, self.poll, master, on_error)
+        except tk.TclError:
+            # The master has been destroyed, so there's nowhere to show failures
+            logger.debug("Stopped polling for save failures of destroyed widget")
+            return
+
+        while True:
+            try:
+                e = self._errors.get_nowait()
+            except queue.Empty:
+                break
+            on_error(e)
+
+
+_singleton = SaveErrorReporter()
+
+
+def get_singleton() -> SaveErrorReporter:
+    return _singleton
@@ -0,0 +1,79 @@
+"""Index of the bounding boxes of things drawn on the screen.
+
+Finding what's under the mouse by checking everything that's drawn is too slow
+to do on every mouse move for large graphs. Instead, the screen is divided into
+a grid of cells, and the cells that each bounding box overlaps are sorted, so
+the boxes overlapping the cell under the mouse can be found by binary search.
+
+The index only needs rebuilding when the boxes move on the screen, such as when
+the view changes.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+
+class ScreenSpaceIndex:
+    """Index for finding the bounding boxes that contain a point."""
+
+    def __init__(self, bounds: npt.NDArray[np.float64]) -> None:
+        """Initialise ScreenSpaceIndex.
+
+        The bounds are indexed by box, then min/max, then x/y.
+        """
+        self._bounds = bounds.reshape(-1, 2, 2)
+
+        # Cells the size of a typical box, so most boxes overlap few cells
+        extents = self._bounds[:, 1] - self._bounds[:, 0]
+        max_extents = extents.max(axis=1) if len(extents) else np.empty(0)
+        positive_max_extents = max_extents[max_extents > 0]
+        self._cell_size = (
+            float(np.median(positive_max_extents)) if len(positive_max_extents) else 1.0
+        )
+
+        min_cells = np.floor(self._bounds[:, 0] / self._cell_size).astype(np.int64)
+        max_cells = np.floor(self._bounds[:, 1] / self._cell_size).astype(np.int64)
+        ncells_x = max_cells[:, 0] - min_cells[:, 0] + 1
+        ncells_y = max_cells[:, 1] - min_cells[:, 1] + 1
+        ncells = ncells_x * ncells_y
+
+        # Every cell of every box, as the box and the x/y of the cell
+        box_idxs = np.repeat(np.arange(len(self._bounds)), ncells)
+        cell_numbers = np.arange(ncells.sum()) - np.repeat(
+            np.cumsum(ncells) - ncells, ncells
+        )
+        cells_x = min_cells[box_idxs, 0] + cell_numbers % ncells_x[box_idxs]
+        cells_y = min_cells[box_idxs, 1] + cell_numbers // ncells_x[box_idxs]
+
+        self._min_cell_y = int(cells_y.min()) if len(cells_y) else 0
+        self._max_cell_y = int(cells_y.max()) if len(cells_y) else -1
+        cell_keys = self._get_cell_keys(cells_x, cells_y)
+        order = np.argsort(cell_keys, kind="stable")
+        self._sorted_cell_keys = cell_keys[order]
+        self._sorted_box_idxs = box_idxs[order]
+
+    def get_boxes_containing(self, x: float, y: float) -> list[int]:
+        """Get the indexes of the boxes containing the point, in index order."""
+        cell_x = int(np.floor(x / self._cell_size))
+        cell_y = int(np.floor(y / self._cell_size))
+        if not self._min_cell_y <= cell_y <= self._max_cell_y:
+            return []
+
+        cell_key = self._get_cell_keys(np.array([cell_x]), np.array([cell_y]))[0]
+        start, stop = np.searchsorted(self._sorted_cell_keys, [cell_key, cell_key + 1])
+        candidate_box_idxs = self._sorted_box_idxs[start:stop]
+
+        candidate_bounds = self._bounds[candidate_box_idxs]
+        point = np.array([x, y])
+        is_contained = np.all(
+            (candidate_bounds[:, 0] <= point) & (point <= candidate_bounds[:, 1]),
+            axis=1,
+        )
+        return [int(idx) for idx in candidate_box_idxs[is_contained]]
+
+    def _get_cell_keys(
+        self, cells_x: npt.NDArray[np.int64], cells_y: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.int64]:
+        """Get keys that sort cells by x, then y."""
+        nrows = self._max_cell_y - self._min_cell_y + 1
+        return cells_x * nrows + (cells_y - self._min_cell_y)
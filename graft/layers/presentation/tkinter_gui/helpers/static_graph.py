@@ -1,4 +1,5 @@
 import enum
+import functools
 import tkinter as tk
 from collections.abc import (
     Callable,
@@ -10,8 +11,11 @@ from typing import Final
 
 import matplotlib as mpl
 import networkx as nx
+import numpy as np
+import numpy.typing as npt
 from matplotlib import backend_bases as mpl_backend_bases
 from matplotlib import collections as mpl_collections
+from matplotlib import colors as mpl_colors
 from matplotlib import patches
 from matplotlib import pyplot as plt
 from matplotlib import text as mpl_text
@@ -27,13 +31,26 @@ from graft.domain import tasks
 from graft.layers.presentation.tkinter_gui import (
     layered_graph_drawing,
 )
-from graft.layers.presentation.tkinter_gui.helpers import graph_conversion
+from graft.layers.presentation.tkinter_gui.helpers import (
+    graph_conversion,
+    layout_cache,
+    layout_worker,
+)
 from graft.layers.presentation.tkinter_gui.helpers.graph_edge_drawing_properties import (
     GraphEdgeDrawingProperties,
 )
+from graft.layers.presentation.tkinter_gui.helpers.graph_level_of_detail_thresholds import (
+    GraphLevelOfDetailThresholds,
+)
 from graft.layers.presentation.tkinter_gui.helpers.graph_node_drawing_properties import (
     GraphNodeDrawingProperties,
 )
+from graft.layers.presentation.tkinter_gui.helpers.screen_space_index import (
+    ScreenSpaceIndex,
+)
+from graft.layers.presentation.tkinter_gui.helpers.throttled_callback import (
+    ThrottledCallback,
+)
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.orientation import (
     GraphOrientation,
 )
@@ -43,6 +60,17 @@ _MOTION_NOTIFY_EVENT_NAME: Final = "motion_notify_event"
 _BUTTON_RELEASE_EVENT_NAME: Final = "button_release_event"
 
 _NODE_SIZE = 300
+# Mouse moves are handled at most this often, so hovering doesn't hog the CPU
+_MOTION_NOTIFY_EVENT_INTERVAL_MS: Final = 30
+
+
+def _copy_graph[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T],
+) -> graphs.DirectedAcyclicGraph[T]:
+    """Copy a graph, so it can be laid out while the original is changed."""
+    return graphs.DirectedAcyclicGraph[T](
+        (node, set(graph.successors(node))) for node in graph.nodes()
+    )
 
 
 class DefaultSentinel(enum.Enum):
@@ -67,6 +95,7 @@ class StaticGraph[T: Hashable](tk.Frame):
     - Register a callback that is called when left click on node
     - Register a callback that is called and returns the text for display in
       an annotation bubble when hover over node
+    - Draw large graphs in less detail, so they stay usable
     """
 
     def __init__(
@@ -85,6 +114,7 @@ class StaticGraph[T: Hashable](tk.Frame):
         additional_edges: Set[tuple[T, T]] | None = None,
         get_additional_edge_properties: Callable[[T, T], GraphEdgeDrawingProperties]
         | None = None,
+        level_of_detail_thresholds: GraphLevelOfDetailThresholds | None = None,
     ) -> None:
         super().__init__(master)
 
@@ -100,6 +130,9 @@ class StaticGraph[T: Hashable](tk.Frame):
 
         self._additional_edges = additional_edges
         self._get_additional_edge_properties = get_additional_edge_properties
+        self._level_of_detail_thresholds = (
+            level_of_detail_thresholds or GraphLevelOfDetailThresholds()
+        )
 
         mpl.use("Agg")
         self._fig = plt.figure()
@@ -109,12 +142,28 @@ class StaticGraph[T: Hashable](tk.Frame):
         self._canvas.get_tk_widget().grid()
         self._annotation = mpl_text.Annotation("", (0, 0))
         self._motion_notify_event_callback_id: int | None = None
+        self._throttled_on_motion_notify_event = ThrottledCallback(
+            self, self._on_motion_notify_event, _MOTION_NOTIFY_EVENT_INTERVAL_MS
+        )
         self._on_node_left_click = on_node_left_click
         self._button_release_event_callback_id: int | None = None
 
         self._nodes_in_path_order = list[T]()
         self._nodes_path_collection = mpl_collections.PathCollection([])
         self._node_positions = dict[T, tuple[float, float]]()
+        # Index of the nodes on the screen, rebuilt when the view changes
+        self._node_display_positions = np.empty((0, 2))
+        self._node_display_positions_transform: npt.NDArray[np.float64] | None = None
+        self._node_index = ScreenSpaceIndex(np.empty((0, 2, 2)))
+        # The graph last laid out, which the next layout is updated from
+        self._laid_out_graph: graphs.DirectedAcyclicGraph[T] | None = None
+        self._laid_out_graph_orientation: GraphOrientation | None = None
+        self._layout_job: layout_worker.LayoutJob | None = None
+        self._layout_job_key: str | None = None
+        # Whether the figure shows an older graph than the current one, such
+        # as while the current one is laid out. Its nodes may no longer exist,
+        # so hovering and clicking on them is ignored
+        self._is_figure_out_of_date = False
 
         self._update_figure()
 
@@ -186,6 +235,86 @@ class StaticGraph[T: Hashable](tk.Frame):
         self._update_figure()
 
     def _update_figure(self) -> None:
+        """Draw the graph, once its layout is available.
+
+        Layouts that aren't cached are calculated in the background, and the
+        current figure is left up until they're ready.
+        """
+        layout_key = layout_cache.get_structure_key(
+            "sugiyama",
+            nodes=self._graph.nodes(),
+            edges=self._graph.edges(),
+            parameters=[self._graph_orientation, _NODE_SIZE],
+        )
+        node_positions = layout_cache.get_singleton().get(layout_key)
+        if node_positions is not None:
+            self._cancel_layout_job()
+            self._draw_figure(node_positions, laid_out_graph=_copy_graph(self._graph))
+            return
+
+        if self._layout_job is not None and self._layout_job_key == layout_key:
+            # The figure is drawn with whatever is current when it's ready
+            return
+
+        self._cancel_layout_job()
+        self._mark_figure_out_of_date()
+
+        is_previous_layout_reusable = (
+            self._laid_out_graph is not None
+            and self._laid_out_graph_orientation == self._graph_orientation
+        )
+        graph = _copy_graph(self._graph)
+        self._layout_job_key = layout_key
+        self._layout_job = layout_worker.get_singleton().submit(
+            self,
+            calculate=functools.partial(
+                layered_graph_drawing.calculate_node_positions_sugiyama_method,
+                graph=graph,
+                orientation=self._graph_orientation,
+                min_intra_layer_node_seperation=3 * _NODE_SIZE,
+                min_inter_layer_node_seperation=3 * _NODE_SIZE,
+                previous_graph=self._laid_out_graph
+                if is_previous_layout_reusable
+                else None,
+                previous_node_positions=self._node_positions
+                if is_previous_layout_reusable
+                else None,
+            ),
+            on_calculated=functools.partial(
+                self._on_layout_calculated, layout_key, graph
+            ),
+            on_failed=self._cancel_layout_job,
+        )
+
+    def _cancel_layout_job(self) -> None:
+        if self._layout_job is not None:
+            self._layout_job.cancel()
+        self._layout_job = None
+        self._layout_job_key = None
+
+    def _mark_figure_out_of_date(self) -> None:
+        """Stop hovering and clicking on the figure, until it's drawn again."""
+        self._is_figure_out_of_date = True
+        if self._annotation.get_visible():
+            self._annotation.set_visible(False)
+            self._canvas.draw_idle()
+
+    def _on_layout_calculated(
+        self,
+        layout_key: str,
+        laid_out_graph: graphs.DirectedAcyclicGraph[T],
+        node_positions: dict[T, tuple[float, float]],
+    ) -> None:
+        self._layout_job = None
+        self._layout_job_key = None
+        layout_cache.get_singleton().add(layout_key, node_positions)
+        self._draw_figure(node_positions, laid_out_graph=laid_out_graph)
+
+    def _draw_figure(
+        self,
+        node_positions: dict[T, tuple[float, float]],
+        laid_out_graph: graphs.DirectedAcyclicGraph[T],
+    ) -> None:
         # https://stackoverflow.com/questions/76277152/how-can-i-create-a-custom-arrow-shaped-legend-key
         # No, I don't understand why I need this arrow handler rubbish to make this
         # work. But I do, and I don't want to spend the time to work out how to not.
@@ -221,14 +350,10 @@ class StaticGraph[T: Hashable](tk.Frame):
 
         self._nodes_in_path_order: list[T] = list(networkx_graph)
 
-        self._node_positions = (
-            layered_graph_drawing.calculate_node_positions_sugiyama_method(
-                graph=self._graph,
-                orientation=self._graph_orientation,
-                min_intra_layer_node_seperation=3 * _NODE_SIZE,
-                min_inter_layer_node_seperation=3 * _NODE_SIZE,
-            )
-        )
+        self._node_positions = node_positions
+        self._node_display_positions_transform = None
+        self._laid_out_graph = laid_out_graph
+        self._laid_out_graph_orientation = self._graph_orientation
 
         node_colours = list[str]()
         node_edge_colours = list[str]()
@@ -271,54 +396,26 @@ class StaticGraph[T: Hashable](tk.Frame):
             properties = get_edge_properties(source, target)  # pyright: ignore[reportUnknownArgumentType]
             edges_with_properties.append(((source, target), properties))  # pyright: ignore[reportUnknownArgumentType]
 
-        for connection_style, edges_with_properties_group in lazy_group_by_hashable(
-            edges_with_properties, key=lambda x: x[1].connection_style
+        if (
+            len(edges_with_properties)
+            > self._level_of_detail_thresholds.max_nedges_drawn_as_arrows
         ):
-            edges_with_properties_group_ = list(edges_with_properties_group)
-            edges = [
-                edges_with_properties[0]
-                for edges_with_properties in edges_with_properties_group_
-            ]
-            alphas = [
-                float(edges_with_properties[1].alpha)
-                for edges_with_properties in edges_with_properties_group_
-            ]
-            colours = [
-                str(edges_with_properties[1].colour)
-                for edges_with_properties in edges_with_properties_group_
-            ]
-            arrow_styles = [
-                str(edges_with_properties[1].arrow_style)
-                for edges_with_properties in edges_with_properties_group_
-            ]
-            line_styles = [
-                str(edges_with_properties[1].line_style)
-                for edges_with_properties in edges_with_properties_group_
-            ]
+            self._draw_edges_as_lines(edges_with_properties)
+        else:
+            self._draw_edges_as_arrows(networkx_graph, edges_with_properties)
 
-            # Have to do draw_networkx_edges for each connectionstyle individually as
-            # only one connectionstyle can be drawn at a time
-
-            nx.draw_networkx_edges(
+        if (
+            networkx_graph.number_of_nodes()
+            <= self._level_of_detail_thresholds.max_nnodes_labelled
+        ):
+            nx.draw_networkx_labels(
                 networkx_graph,
                 pos=self._node_positions,
-                edgelist=edges,
-                edge_color=colours,  # pyright: ignore[reportArgumentType]
+                font_color=node_label_colours,  # pyright: ignore [reportArgumentType] (font_color also accepts dict[N, str])
+                alpha=node_label_alphas,
                 ax=self._ax,
-                connectionstyle=str(connection_style),  # pyright: ignore[reportArgumentType]
-                alpha=alphas,
-                arrowstyle=arrow_styles,
-                style=line_styles,  # pyright: ignore[reportArgumentType]
             )
 
-        nx.draw_networkx_labels(
-            networkx_graph,
-            pos=self._node_positions,
-            font_color=node_label_colours,  # pyright: ignore [reportArgumentType] (font_color also accepts dict[N, str])
-            alpha=node_label_alphas,
-            ax=self._ax,
-        )
-
         if self._legend_elements is not None:
             legend_elements = list[patches.Circle | patches.FancyArrowPatch]()
             for label, element in self._legend_elements:
@@ -352,13 +449,14 @@ class StaticGraph[T: Hashable](tk.Frame):
             )
 
         self._canvas.draw()
+        self._is_figure_out_of_date = False
 
         if self._motion_notify_event_callback_id is not None:
             self._fig.canvas.mpl_disconnect(self._motion_notify_event_callback_id)
 
         if self._get_node_annotation_text is not None:
             self._motion_notify_event_callback_id = self._fig.canvas.mpl_connect(
-                _MOTION_NOTIFY_EVENT_NAME, self._on_motion_notify_event
+                _MOTION_NOTIFY_EVENT_NAME, self._throttled_on_motion_notify_event
             )
 
         if self._button_release_event_callback_id is not None:
@@ -369,6 +467,80 @@ class StaticGraph[T: Hashable](tk.Frame):
                 _BUTTON_RELEASE_EVENT_NAME, self._on_button_release_event
             )
 
+    def _draw_edges_as_arrows(
+        self,
+        networkx_graph: nx.DiGraph,
+        edges_with_properties: Sequence[
+            tuple[tuple[tasks.UID, tasks.UID], GraphEdgeDrawingProperties]
+        ],
+    ) -> None:
+        for connection_style, edges_with_properties_group in lazy_group_by_hashable(
+            edges_with_properties, key=lambda x: x[1].connection_style
+        ):
+            edges_with_properties_group_ = list(edges_with_properties_group)
+            edges = [
+                edges_with_properties[0]
+                for edges_with_properties in edges_with_properties_group_
+            ]
+            alphas = [
+                float(edges_with_properties[1].alpha)
+                for edges_with_properties in edges_with_properties_group_
+            ]
+            colours = [
+                str(edges_with_properties[1].colour)
+                for edges_with_properties in edges_with_properties_group_
+            ]
+            arrow_styles = [
+                str(edges_with_properties[1].arrow_style)
+                for edges_with_properties in edges_with_properties_group_
+            ]
+            line_styles = [
+                str(edges_with_properties[1].line_style)
+                for edges_with_properties in edges_with_properties_group_
+            ]
+
+            # Have to do draw_networkx_edges for each connectionstyle individually as
+            # only one connectionstyle can be drawn at a time
+
+            nx.draw_networkx_edges(
+                networkx_graph,
+                pos=self._node_positions,
+                edgelist=edges,
+                edge_color=colours,  # pyright: ignore[reportArgumentType]
+                ax=self._ax,
+                connectionstyle=str(connection_style),  # pyright: ignore[reportArgumentType]
+                alpha=alphas,
+                arrowstyle=arrow_styles,
+                style=line_styles,  # pyright: ignore[reportArgumentType]
+            )
+
+    def _draw_edges_as_lines(
+        self,
+        edges_with_properties: Sequence[
+            tuple[tuple[tasks.UID, tasks.UID], GraphEdgeDrawingProperties]
+        ],
+    ) -> None:
+        """Draw the edges as straight lines, all in a single collection.
+
+        Much faster than drawing them as arrows, but their direction, arrow
+        style and connection style aren't shown.
+        """
+        edge_lines = mpl_collections.LineCollection(
+            [
+                (self._node_positions[source], self._node_positions[target])  # pyright: ignore[reportArgumentType]
+                for (source, target), _ in edges_with_properties
+            ],
+            colors=[
+                mpl_colors.to_rgba(str(properties.colour), float(properties.alpha))
+                for _, properties in edges_with_properties
+            ],
+            linestyles=[
+                str(properties.line_style) for _, properties in edges_with_properties
+            ],
+            zorder=1,  # set to 1 to draw the edges behind the nodes, as networkx does
+        )
+        self._ax.add_collection(edge_lines)
+
     def _on_motion_notify_event(self, event: mpl_backend_bases.Event) -> None:
         if not isinstance(event, mpl_backend_bases.MouseEvent):
             raise TypeError
@@ -376,22 +548,15 @@ class StaticGraph[T: Hashable](tk.Frame):
         if event.name != _MOTION_NOTIFY_EVENT_NAME:
             raise ValueError
 
-        if event.inaxes != self._ax:
+        if self._is_figure_out_of_date or event.inaxes != self._ax:
             if self._annotation.get_visible():
                 self._annotation.set_visible(False)
                 self._canvas.draw_idle()
             return
 
-        # If there are no paths in the path collection, the `contains`
-        # method will throw a TypeError rather than returning a nice,
-        # sensible 'false'. This check stops it, as when there are zero
-        # tasks there will be zero paths.
-        if not self._nodes_in_path_order:
-            return
-
-        contains, details = self._nodes_path_collection.contains(event)
+        node_motion_is_over = self._get_node_under(event)
 
-        if not contains:
+        if node_motion_is_over is None:
             if self._annotation.get_visible():
                 self._annotation.set_visible(False)
                 self._canvas.draw_idle()
@@ -403,11 +568,6 @@ class StaticGraph[T: Hashable](tk.Frame):
             # TODO: Add some kind of warning log
             return
 
-        index_in_order_of_node_motion_is_over: int = details["ind"][0]
-        node_motion_is_over = self._nodes_in_path_order[
-            index_in_order_of_node_motion_is_over
-        ]
-
         annotation_text = self._get_node_annotation_text(node_motion_is_over)
 
         if annotation_text is None:
@@ -429,20 +589,18 @@ class StaticGraph[T: Hashable](tk.Frame):
         if event.name != _BUTTON_RELEASE_EVENT_NAME:
             raise ValueError
 
+        if self._is_figure_out_of_date:
+            return
+
         if (
             event.button is not mpl_backend_bases.MouseButton.LEFT
             or event.inaxes != self._ax
-            or not self._nodes_in_path_order
         ):
             return
 
-        # If there are no paths in the path collection, the `contains`
-        # method will throw a TypeError rather than returning a nice,
-        # sensible 'false'. This check stops it, as when there are zero
-        # tasks there will be zero paths.
-        contains, details = self._nodes_path_collection.contains(event)
+        node_clicked = self._get_node_under(event)
 
-        if not contains:
+        if node_clicked is None:
             return
 
         # Really shouldn't ever fail this check, as only register for motion
@@ -451,6 +609,60 @@ class StaticGraph[T: Hashable](tk.Frame):
             # TODO: Add some kind of warning log
             return
 
-        index_in_order_of_node_clicked: int = details["ind"][0]
-        node_clicked: T = self._nodes_in_path_order[index_in_order_of_node_clicked]
         self._on_node_left_click(node_clicked)
+
+    def _get_node_under(self, event: mpl_backend_bases.MouseEvent) -> T | None:
+        """Get the node under the mouse, or None if there isn't one.
+
+        If the mouse is over more than one node, the closest is returned.
+        """
+        self._update_node_index()
+        candidate_idxs = self._node_index.get_boxes_containing(event.x, event.y)
+        if not candidate_idxs:
+            return None
+
+        distances = np.hypot(
+            *(self._node_display_positions[candidate_idxs] - (event.x, event.y)).T
+        )
+        closest_idx = int(np.argmin(distances))
+        if distances[closest_idx] > self._get_node_hit_radius():
+            return None
+
+        return self._nodes_in_path_order[candidate_idxs[closest_idx]]
+
+    def _update_node_index(self) -> None:
+        """Index the nodes on the screen, if the view has changed since."""
+        transform = np.append(
+            self._ax.transData.get_affine().get_matrix().flatten(), self._fig.dpi
+        )
+        if self._node_display_positions_transform is not None and np.array_equal(
+            transform, self._node_display_positions_transform
+        ):
+            return
+
+        self._node_display_positions_transform = transform
+        self._node_display_positions = self._ax.transData.transform(
+            np.array(
+                [self._node_positions[node] for node in self._nodes_in_path_order]
+            ).reshape(-1, 2)
+        )
+        radius = self._get_node_hit_radius()
+        self._node_index = ScreenSpaceIndex(
+            np.stack(
+                [
+                    self._node_display_positions - radius,
+                    self._node_display_positions + radius,
+                ],
+                axis=1,
+            )
+        )
+
+    def _get_node_hit_radius(self) -> float:
+        """Get how close to a node, in pixels, the mouse has to be to be over it.
+
+        As with `contains`, the mouse is over a node within the pick radius of
+        its edge.
+        """
+        # Node sizes are areas in points squared
+        node_radius = float(np.sqrt(_NODE_SIZE)) / 2 * self._fig.dpi / 72
+        return node_radius + float(self._nodes_path_collection.get_pickradius())
@@ -1,4 +1,4 @@
 from .cylinder_drawing_properties import CylinderDrawingProperties
 from .cylinder_label import CylinderLabel, CylinderLabelDrawingProperties
-from .cylinder_plotting import plot_x_axis_cylinder
+from .cylinder_plotting import XAxisCylinders, plot_x_axis_cylinders
 from .cylinder_position import XAxisCylinderPosition
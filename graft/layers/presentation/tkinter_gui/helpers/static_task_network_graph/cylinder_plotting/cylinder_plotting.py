@@ -1,8 +1,24 @@
+import itertools
+from collections.abc import Sequence
+
 import numpy as np
-from matplotlib import patches
+import numpy.typing as npt
+from matplotlib import (
+    artist,
+    backend_bases,
+    collections,
+    colors,
+    font_manager,
+    path,
+    textpath,
+    transforms,
+)
 from mpl_toolkits import mplot3d
-from mpl_toolkits.mplot3d import art3d
+from mpl_toolkits.mplot3d import art3d, proj3d
 
+from graft.layers.presentation.tkinter_gui.helpers.screen_space_index import (
+    ScreenSpaceIndex,
+)
 from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.radius import (
     Radius,
 )
@@ -12,47 +28,253 @@ from .cylinder_label import CylinderLabel
 from .cylinder_position import XAxisCylinderPosition
 
 
-def plot_x_axis_cylinder(
+def _project(
+    ax: mplot3d.Axes3D, points: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Project points, with x/y/z in the last axis, to x/y on the axes."""
+    flat_points = points.reshape(-1, 3)
+    xs, ys, _ = proj3d.proj_transform(
+        flat_points[:, 0], flat_points[:, 1], flat_points[:, 2], ax.get_proj()
+    )
+    return np.stack([xs, ys], axis=-1).reshape(*points.shape[:-1], 2)
+
+
+class XAxisCylinders:
+    """Cylinders plotted together, as a single collection of faces.
+
+    Plotting them together is much faster than plotting each separately, but
+    the collection can only tell which of its faces are under the mouse, not
+    which cylinders. Instead, the faces are projected onto the axes whenever the
+    view changes, and their bounding boxes indexed, so only the cylinders whose
+    bounding boxes contain the mouse are checked face by face.
+    """
+
+    def __init__(
+        self,
+        ax: mplot3d.Axes3D,
+        collection: art3d.Poly3DCollection,
+        side_faces: npt.NDArray[np.float64],
+        end_faces: npt.NDArray[np.float64],
+    ) -> None:
+        """Initialise XAxisCylinders.
+
+        The faces are indexed by cylinder, then face, then vertex, then x/y/z.
+        """
+        self._ax = ax
+        self._collection = collection
+        self._side_faces = side_faces
+        self._end_faces = end_faces
+        self._projection: npt.NDArray[np.float64] | None = None
+        self._projected_side_faces = np.empty((0, 0, 0, 2))
+        self._projected_end_faces = np.empty((0, 0, 0, 2))
+        self._projected_bounds_index = ScreenSpaceIndex(np.empty((0, 2, 2)))
+
+    @property
+    def collection(self) -> art3d.Poly3DCollection:
+        return self._collection
+
+    def get_cylinders_under(self, event: backend_bases.MouseEvent) -> list[int]:
+        """Get the indexes of the cylinders under the mouse."""
+        if event.xdata is None or event.ydata is None:
+            return []
+
+        self._update_projection()
+        return [
+            idx
+            for idx in self._projected_bounds_index.get_boxes_containing(
+                event.xdata, event.ydata
+            )
+            if any(
+                path.Path(face).contains_point((event.xdata, event.ydata))
+                for face in itertools.chain(
+                    self._projected_side_faces[idx], self._projected_end_faces[idx]
+                )
+            )
+        ]
+
+    def _update_projection(self) -> None:
+        projection = self._ax.get_proj()
+        if self._projection is not None and np.array_equal(
+            projection, self._projection
+        ):
+            return
+
+        self._projection = projection
+        self._projected_side_faces = _project(self._ax, self._side_faces)
+        self._projected_end_faces = _project(self._ax, self._end_faces)
+        # The ends contain every vertex of the cylinder
+        projected_vertices = self._projected_end_faces.reshape(
+            len(self._projected_end_faces), -1, 2
+        )
+        self._projected_bounds_index = ScreenSpaceIndex(
+            np.stack(
+                [projected_vertices.min(axis=1), projected_vertices.max(axis=1)],
+                axis=1,
+            )
+        )
+
+
+class _XAxisCylinderLabels(artist.Artist):
+    """Labels of cylinders, drawn together as a single collection of paths.
+
+    Drawing text is slow, so the labels are converted to paths once, and drawn
+    at their projected positions. Like the text they replace, they are always
+    drawn on top of the cylinders, and stay the same size as the view changes.
+    """
+
+    def __init__(
+        self,
+        ax: mplot3d.Axes3D,
+        positions: npt.NDArray[np.float64],
+        texts: Sequence[str],
+        colours: npt.NDArray[np.float64],
+    ) -> None:
+        """Initialise _XAxisCylinderLabels.
+
+        The positions are indexed by label, then x/y/z.
+        """
+        super().__init__()
+        self.set_zorder(100)
+        self._ax = ax
+        self._positions = positions
+
+        font_properties = font_manager.FontProperties()
+        text_paths = {
+            text: textpath.TextPath((0, 0), text, prop=font_properties)
+            for text in set(texts)
+        }
+        self._collection = collections.PathCollection(
+            [text_paths[text] for text in texts],
+            facecolors=colours,
+            edgecolors="none",
+            # Text paths are in points
+            transform=transforms.Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans,
+            offset_transform=ax.transData,
+        )
+        self._collection.set_figure(ax.figure)
+        self._collection.set_clip_path(ax.patch)
+
+    @artist.allow_rasterization
+    def draw(self, renderer: backend_bases.RendererBase) -> None:
+        if not self.get_visible() or len(self._positions) == 0:
+            return
+
+        self._collection.set_offsets(_project(self._ax, self._positions))
+        self._collection.draw(renderer)
+
+
+def plot_x_axis_cylinders(
     ax: mplot3d.Axes3D,
     radius: Radius,
-    position: XAxisCylinderPosition,
-    properties: CylinderDrawingProperties,
-    label: CylinderLabel | None = None,
-) -> art3d.Poly3DCollection:
-    xs = np.array([position.x_min, position.x_max])
-    thetas = np.linspace(0, 2 * np.pi, properties.number_of_polygons)
+    positions: Sequence[XAxisCylinderPosition],
+    properties: Sequence[CylinderDrawingProperties],
+    labels: Sequence[CylinderLabel | None],
+) -> XAxisCylinders:
+    """Plot cylinders along the x-axis as a single collection of faces.
 
-    XS, THETAS = np.meshgrid(xs, thetas)
+    All the cylinders must have the same number of polygons.
+    """
+    if not len(positions) == len(properties) == len(labels):
+        msg = "Must be a position, properties and label for every cylinder."
+        raise ValueError(msg)
 
-    YS = position.y + float(radius) * np.sin(THETAS)
-    ZS = position.z + float(radius) * np.cos(THETAS)
+    numbers_of_polygons = {
+        cylinder_properties.number_of_polygons for cylinder_properties in properties
+    }
+    if len(numbers_of_polygons) > 1:
+        msg = "All cylinders must have the same number of polygons."
+        raise ValueError(msg)
 
-    collection: art3d.Poly3DCollection = ax.plot_surface(
-        XS, YS, ZS, color=str(properties.colour), alpha=float(properties.alpha)
+    number_of_polygons = numbers_of_polygons.pop() if numbers_of_polygons else 3
+    thetas = np.linspace(0, 2 * np.pi, number_of_polygons)
+
+    xs = np.array([[position.x_min, position.x_max] for position in positions])
+    ys = np.array([position.y for position in positions])
+    zs = np.array([position.z for position in positions])
+
+    # Indexed by cylinder, then end, then vertex, then x/y/z
+    ncylinders = len(positions)
+    end_faces = np.stack(
+        np.broadcast_arrays(
+            xs.reshape(ncylinders, 2, 1),
+            (ys[:, np.newaxis] + float(radius) * np.sin(thetas))[:, np.newaxis, :],
+            (zs[:, np.newaxis] + float(radius) * np.cos(thetas))[:, np.newaxis, :],
+        ),
+        axis=-1,
+    )
+    # Indexed by cylinder, then side, then vertex, then x/y/z
+    side_faces = np.stack(
+        [
+            end_faces[:, 0, :-1],
+            end_faces[:, 0, 1:],
+            end_faces[:, 1, 1:],
+            end_faces[:, 1, :-1],
+        ],
+        axis=2,
     )
 
-    if label is not None:
-        ax.text(
-            position.x_center,
-            position.y,
-            position.z,
-            label.text,
-            color=str(label.properties.colour),
-            alpha=float(label.properties.alpha),
-            zorder=100,  # set to 100 to ensure that labels are always drawn on top of the cylinders, and therefore visible
-        )
+    face_colours = np.array(
+        [
+            colors.to_rgba(
+                str(cylinder_properties.colour), float(cylinder_properties.alpha)
+            )
+            for cylinder_properties in properties
+        ]
+    ).reshape(-1, 4)
+    edge_colours = np.array(
+        [
+            colors.to_rgba(
+                str(cylinder_properties.edge_colour), float(cylinder_properties.alpha)
+            )
+            for cylinder_properties in properties
+        ]
+    ).reshape(-1, 4)
+    nsides = number_of_polygons - 1
 
-    # Plot the end-caps of the cylinder
-    for x in [position.x_min, position.x_max]:
-        circle = patches.Circle(
-            xy=(position.y, position.z),
-            radius=float(radius),
-            facecolor=str(properties.colour),
-            edgecolor=str(properties.edge_colour),
-            alpha=float(properties.alpha),
+    # The sides have edges the colour of the face, so only the ends are outlined
+    collection = art3d.Poly3DCollection(
+        [*side_faces.reshape(-1, 4, 3), *end_faces.reshape(-1, number_of_polygons, 3)],
+        facecolors=np.concatenate(
+            [
+                np.repeat(face_colours, nsides, axis=0),
+                np.repeat(face_colours, 2, axis=0),
+            ]
+        ),
+        edgecolors=np.concatenate(
+            [
+                np.repeat(face_colours, nsides, axis=0),
+                np.repeat(edge_colours, 2, axis=0),
+            ]
+        ),
+    )
+    ax.add_collection3d(collection)
+
+    labelled_positions = [
+        (position, label)
+        for position, label in zip(positions, labels, strict=True)
+        if label is not None
+    ]
+    ax.add_artist(
+        _XAxisCylinderLabels(
+            ax=ax,
+            positions=np.array(
+                [
+                    [position.x_center, position.y, position.z]
+                    for position, _ in labelled_positions
+                ]
+            ).reshape(-1, 3),
+            texts=[label.text for _, label in labelled_positions],
+            colours=np.array(
+                [
+                    colors.to_rgba(
+                        str(label.properties.colour), float(label.properties.alpha)
+                    )
+                    for _, label in labelled_positions
+                ]
+            ).reshape(-1, 4),
         )
-        ax.add_patch(circle)
-        # This method actually handles float values for z just fine, hence the type ignore
-        art3d.pathpatch_2d_to_3d(circle, z=x, zdir="x")  # type: ignore[reportArgumentType]
+    )
 
-    return collection
+    return XAxisCylinders(
+        ax=ax, collection=collection, side_faces=side_faces, end_faces=end_faces
+    )
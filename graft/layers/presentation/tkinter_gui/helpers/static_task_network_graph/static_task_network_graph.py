@@ -1,6 +1,8 @@
 import enum
+import functools
+import itertools
 import tkinter as tk
-from collections.abc import Callable, Sequence, Set
+from collections.abc import Callable, Mapping, Sequence, Set
 from typing import TYPE_CHECKING, Final
 
 import matplotlib as mpl
@@ -12,12 +14,13 @@ from matplotlib.legend import Legend
 from matplotlib.legend_handler import HandlerBase
 from matplotlib.patches import ArrowStyle, FancyArrowPatch, Patch
 from matplotlib.transforms import Transform
-from mpl_toolkits.mplot3d import art3d, axis3d, proj3d
+from mpl_toolkits.mplot3d import axis3d, proj3d
 
 from graft.domain import tasks
 from graft.layers.presentation.tkinter_gui import (
     task_network_graph_drawing,
 )
+from graft.layers.presentation.tkinter_gui.helpers import layout_cache, layout_worker
 from graft.layers.presentation.tkinter_gui.helpers.colour import (
     BLACK,
 )
@@ -29,7 +32,7 @@ from graft.layers.presentation.tkinter_gui.helpers.static_task_network_graph.cyl
     CylinderLabel,
     CylinderLabelDrawingProperties,
     XAxisCylinderPosition,
-    plot_x_axis_cylinder,
+    plot_x_axis_cylinders,
 )
 from graft.layers.presentation.tkinter_gui.helpers.static_task_network_graph.network_task_drawing_properties import (
     NetworkTaskDrawingProperties,
@@ -37,6 +40,9 @@ from graft.layers.presentation.tkinter_gui.helpers.static_task_network_graph.net
 from graft.layers.presentation.tkinter_gui.helpers.static_task_network_graph.relationship_drawing_properties import (
     NetworkRelationshipDrawingProperties,
 )
+from graft.layers.presentation.tkinter_gui.helpers.throttled_callback import (
+    ThrottledCallback,
+)
 from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.radius import (
     Radius,
 )
@@ -44,6 +50,10 @@ from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.radius imp
 if TYPE_CHECKING:
     from mpl_toolkits import mplot3d
 
+    from graft.layers.presentation.tkinter_gui.helpers.static_task_network_graph.cylinder_plotting import (
+        XAxisCylinders,
+    )
+
 _AXIS_ARROW_COLOUR: Final = BLACK
 
 _TASK_CYLINDER_RADIUS: Final = Radius(0.25)
@@ -51,6 +61,8 @@ _TASK_CYLINDER_NUMBER_OF_POLYGONS: Final = 10
 
 _MOTION_NOTIFY_EVENT_NAME: Final = "motion_notify_event"
 _BUTTON_RELEASE_EVENT_NAME: Final = "button_release_event"
+# Mouse moves are handled at most this often, so hovering doesn't hog the CPU
+_MOTION_NOTIFY_EVENT_INTERVAL_MS: Final = 30
 
 
 def _remove_axis(axis: axis3d.Axis) -> None:
@@ -127,6 +139,18 @@ class StaticTaskNetworkGraph(tk.Frame):
 
         self._graph = graph
         self._task_positions: dict[tasks.UID, XAxisCylinderPosition] | None = None
+        # The graph last laid out and its layout, which the next layout is
+        # updated from
+        self._laid_out_graph: tasks.IUnconstrainedNetworkGraphView | None = None
+        self._laid_out_task_positions: (
+            Mapping[tasks.UID, task_network_graph_drawing.TaskCylinderPosition] | None
+        ) = None
+        self._layout_job: layout_worker.LayoutJob | None = None
+        self._layout_job_key: str | None = None
+        # Whether the figure shows an older graph than the current one, such
+        # as while the current one is laid out. Its nodes may no longer exist,
+        # so hovering and clicking on them is ignored
+        self._is_figure_out_of_date = False
         self._get_task_annotation_text = get_task_annotation_text
         self._get_task_properties = get_task_properties
         self._get_hierarchy_properties = get_hierarchy_properties
@@ -171,9 +195,14 @@ class StaticTaskNetworkGraph(tk.Frame):
         self._canvas.get_tk_widget().grid()
         self._annotation = text.Annotation("", (0, 0))
         self._motion_notify_event_callback_id: int | None = None
+        self._throttled_on_motion_notify_event = ThrottledCallback(
+            self, self._on_motion_notify_event, _MOTION_NOTIFY_EVENT_INTERVAL_MS
+        )
         self._button_release_event_callback_id: int | None = None
 
-        self._task_collections = list[tuple[tasks.UID, art3d.Poly3DCollection]]()
+        self._task_cylinders: XAxisCylinders | None = None
+        # The task of each cylinder, in the order they were plotted
+        self._cylinder_tasks = list[tasks.UID]()
 
         self._update_figure()
 
@@ -256,6 +285,90 @@ class StaticTaskNetworkGraph(tk.Frame):
         self._update_figure()
 
     def _update_figure(self) -> None:
+        """Draw the graph, once its layout is available.
+
+        Layouts that aren't cached are calculated in the background, and the
+        current figure is left up until they're ready.
+        """
+        layout_key = layout_cache.get_structure_key(
+            "task_network",
+            nodes=self._graph.tasks(),
+            edges=itertools.chain(
+                self._graph.hierarchy_graph().hierarchies(),
+                # Dependencies are distinguished from hierarchies by being
+                # reversed and marked
+                (
+                    (("dependent", dependent_task), dependee_task)
+                    for dependee_task, dependent_task in (
+                        self._graph.dependency_graph().dependencies()
+                    )
+                ),
+            ),
+            parameters=[float(_TASK_CYLINDER_RADIUS)],
+        )
+        task_positions = layout_cache.get_singleton().get(layout_key)
+        if task_positions is not None:
+            self._cancel_layout_job()
+            self._draw_figure(task_positions, laid_out_graph=self._graph.clone())
+            return
+
+        if self._layout_job is not None and self._layout_job_key == layout_key:
+            # The figure is drawn with whatever is current when it's ready
+            return
+
+        self._cancel_layout_job()
+        self._mark_figure_out_of_date()
+
+        graph = self._graph.clone()
+        self._layout_job_key = layout_key
+        self._layout_job = layout_worker.get_singleton().submit(
+            self,
+            calculate=functools.partial(
+                task_network_graph_drawing.calculate_task_positions_unnamed_method,
+                graph=graph,
+                task_cylinder_radius=_TASK_CYLINDER_RADIUS,
+                previous_graph=self._laid_out_graph,
+                previous_task_positions=self._laid_out_task_positions,
+            ),
+            on_calculated=functools.partial(
+                self._on_layout_calculated, layout_key, graph
+            ),
+            on_failed=self._cancel_layout_job,
+        )
+
+    def _cancel_layout_job(self) -> None:
+        if self._layout_job is not None:
+            self._layout_job.cancel()
+        self._layout_job = None
+        self._layout_job_key = None
+
+    def _mark_figure_out_of_date(self) -> None:
+        """Stop hovering and clicking on the figure, until it's drawn again."""
+        self._is_figure_out_of_date = True
+        if self._annotation.get_visible():
+            self._annotation.set_visible(False)
+            self._canvas.draw_idle()
+
+    def _on_layout_calculated(
+        self,
+        layout_key: str,
+        laid_out_graph: tasks.IUnconstrainedNetworkGraphView,
+        task_positions: Mapping[
+            tasks.UID, task_network_graph_drawing.TaskCylinderPosition
+        ],
+    ) -> None:
+        self._layout_job = None
+        self._layout_job_key = None
+        layout_cache.get_singleton().add(layout_key, task_positions)
+        self._draw_figure(task_positions, laid_out_graph=laid_out_graph)
+
+    def _draw_figure(
+        self,
+        task_positions: Mapping[
+            tasks.UID, task_network_graph_drawing.TaskCylinderPosition
+        ],
+        laid_out_graph: tasks.IUnconstrainedNetworkGraphView,
+    ) -> None:
         # TODO: Consider keeping the current viewing perspective when updating
         # the figure; if you are zoomed in then click on a task to highlight it,
         # the whole view will zoom back out to the start, which is quite
@@ -273,14 +386,8 @@ class StaticTaskNetworkGraph(tk.Frame):
         )
         self._annotation.set_visible(False)
 
-        self._task_collections.clear()
-
-        task_positions = (
-            task_network_graph_drawing.calculate_task_positions_unnamed_method(
-                graph=self._graph,
-                task_cylinder_radius=_TASK_CYLINDER_RADIUS,
-            )
-        )
+        self._laid_out_graph = laid_out_graph
+        self._laid_out_task_positions = task_positions
         self._task_positions = {
             task: XAxisCylinderPosition(
                 x_min=position.min_dependency,
@@ -304,12 +411,13 @@ class StaticTaskNetworkGraph(tk.Frame):
         self._ax.set_aspect("equal")
 
         self._canvas.draw()
+        self._is_figure_out_of_date = False
 
         if self._motion_notify_event_callback_id is not None:
             self._fig.canvas.mpl_disconnect(self._motion_notify_event_callback_id)
 
         self._motion_notify_event_callback_id = self._fig.canvas.mpl_connect(
-            _MOTION_NOTIFY_EVENT_NAME, self._on_motion_notify_event
+            _MOTION_NOTIFY_EVENT_NAME, self._throttled_on_motion_notify_event
         )
 
         if self._button_release_event_callback_id is not None:
@@ -329,23 +437,24 @@ class StaticTaskNetworkGraph(tk.Frame):
         if event.name != _MOTION_NOTIFY_EVENT_NAME:
             raise ValueError
 
-        if event.inaxes != self._ax:
+        if self._is_figure_out_of_date or event.inaxes != self._ax:
             if self._annotation.get_visible():
                 self._annotation.set_visible(False)
                 self._canvas.draw_idle()
             return
 
-        task_under_mouse = None
-        for task, collection in self._task_collections:
-            does_contain, _ = collection.contains(mouseevent=event)
+        assert self._task_cylinders is not None
+        tasks_under_mouse = [
+            self._cylinder_tasks[idx]
+            for idx in self._task_cylinders.get_cylinders_under(event)
+        ]
 
-            if does_contain:
-                # Check if there is more than one task cylinder under the mouse; if
-                # so, don't do anything
-                if task_under_mouse is not None:
-                    return
+        # Check if there is more than one task cylinder under the mouse; if so,
+        # don't do anything
+        if len(tasks_under_mouse) > 1:
+            return
 
-                task_under_mouse = task
+        task_under_mouse = tasks_under_mouse[0] if tasks_under_mouse else None
 
         if task_under_mouse is None:
             if self._annotation.get_visible():
@@ -383,23 +492,27 @@ class StaticTaskNetworkGraph(tk.Frame):
         if event.name != _BUTTON_RELEASE_EVENT_NAME:
             raise ValueError
 
+        if self._is_figure_out_of_date:
+            return
+
         if (
             event.button is not backend_bases.MouseButton.LEFT
             or event.inaxes != self._ax
         ):
             return
 
-        task_under_mouse = None
-        for task, collection in self._task_collections:
-            does_contain, _ = collection.contains(mouseevent=event)
+        assert self._task_cylinders is not None
+        tasks_under_mouse = [
+            self._cylinder_tasks[idx]
+            for idx in self._task_cylinders.get_cylinders_under(event)
+        ]
 
-            if does_contain:
-                # Check if there is more than one task cylinder under the mouse; if
-                # so, don't do anything
-                if task_under_mouse is not None:
-                    return
+        # Check if there is more than one task cylinder under the mouse; if so,
+        # don't do anything
+        if len(tasks_under_mouse) > 1:
+            return
 
-                task_under_mouse = task
+        task_under_mouse = tasks_under_mouse[0] if tasks_under_mouse else None
 
         if task_under_mouse is None:
             return
@@ -414,14 +527,20 @@ class StaticTaskNetworkGraph(tk.Frame):
     def _update_task_cylinders(self) -> None:
         assert self._task_positions is not None
 
-        for task, position in self._task_positions.items():
+        self._cylinder_tasks = list(self._task_positions)
+
+        task_cylinder_properties = list[CylinderDrawingProperties]()
+        labels = list[CylinderLabel | None]()
+        for task in self._cylinder_tasks:
             properties = self._get_task_properties(task)
 
-            task_cylinder_properties = CylinderDrawingProperties(
-                colour=properties.colour,
-                edge_colour=properties.edge_colour,
-                number_of_polygons=_TASK_CYLINDER_NUMBER_OF_POLYGONS,
-                alpha=properties.alpha,
+            task_cylinder_properties.append(
+                CylinderDrawingProperties(
+                    colour=properties.colour,
+                    edge_colour=properties.edge_colour,
+                    number_of_polygons=_TASK_CYLINDER_NUMBER_OF_POLYGONS,
+                    alpha=properties.alpha,
+                )
             )
 
             label_text = str(task)
@@ -430,15 +549,15 @@ class StaticTaskNetworkGraph(tk.Frame):
                 colour=properties.label_colour, alpha=properties.label_alpha
             )
 
-            collection = plot_x_axis_cylinder(
-                ax=self._ax,
-                radius=_TASK_CYLINDER_RADIUS,
-                position=position,
-                properties=task_cylinder_properties,
-                label=CylinderLabel(text=label_text, properties=label_properties),
-            )
+            labels.append(CylinderLabel(text=label_text, properties=label_properties))
 
-            self._task_collections.append((task, collection))
+        self._task_cylinders = plot_x_axis_cylinders(
+            ax=self._ax,
+            radius=_TASK_CYLINDER_RADIUS,
+            positions=[self._task_positions[task] for task in self._cylinder_tasks],
+            properties=task_cylinder_properties,
+            labels=labels,
+        )
 
     def _update_hierarchy_arrows(self) -> None:
         assert self._task_positions is not None
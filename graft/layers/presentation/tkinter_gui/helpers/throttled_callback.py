@@ -0,0 +1,49 @@
+"""Callbacks that are called at most once an interval.
+
+Some events, such as the mouse moving, fire far more often than their handlers
+can usefully run. Throttling the handler means only the latest event of each
+interval is handled, and the rest are dropped.
+"""
+
+import logging
+import tkinter as tk
+from collections.abc import Callable
+from typing import Final
+
+logger: Final = logging.getLogger(__name__)
+
+
+class ThrottledCallback[A]:
+    """Callback that calls a function with the latest argument, once an interval.
+
+    The function is called at the end of the interval that starts with the first
+    call, so it always ends up being called with the latest argument.
+    """
+
+    def __init__(
+        self, master: tk.Misc, fn: Callable[[A], None], interval_ms: int
+    ) -> None:
+        """Initialise ThrottledCallback."""
+        self._master = master
+        self._fn = fn
+        self._interval_ms = interval_ms
+        self._latest_arg: A | None = None
+        self._after_id: str | None = None
+
+    def __call__(self, arg: A) -> None:
+        self._latest_arg = arg
+        if self._after_id is not None:
+            return
+
+        try:
+            self._after_id = self._master.after(self._interval_ms, self._call)
+        except tk.TclError:
+            # The master has been destroyed, so there's nothing to update
+            logger.debug("Stopped throttled callback of destroyed widget")
+
+    def _call(self) -> None:
+        arg = self._latest_arg
+        self._after_id = None
+        self._latest_arg = None
+        if arg is not None:
+            self._fn(arg)
@@ -0,0 +1,280 @@
+"""Laying out the components of a graph separately, in parallel.
+
+Components are only positioned relative to one another once they've been laid
+out, when they're separated, so each is laid out on its own in a pool of
+processes. Components that haven't changed since the previous layout keep their
+previous positions.
+
+Positions here are unplaced, as intra-level and level positions.
+"""
+
+import dataclasses
+import functools
+import statistics
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Protocol
+
+from graft import graphs
+from graft.layers.presentation.tkinter_gui.helpers import layout_process_pool
+from graft.layers.presentation.tkinter_gui.layered_graph_drawing.node_positions.components import (
+    get_node_positions_inter_component_adjustment,
+)
+
+
+class CalculateComponentNodePositionsFn(Protocol):
+    def __call__(
+        self,
+        graph: graphs.DirectedAcyclicGraph[int],
+        previous_graph: graphs.DirectedAcyclicGraph[int] | None = None,
+        previous_node_positions: Mapping[int, tuple[float, float]] | None = None,
+    ) -> dict[int, tuple[float, float]]: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class _EncodedComponent:
+    """A component with its nodes replaced by indexes, so it's cheap to pickle.
+
+    The previous graph contains the previous components of the nodes in the
+    component, which may also contain nodes that have since moved to another
+    component. They are given the indexes after those of the component.
+    """
+
+    successors: Sequence[Sequence[int]]
+    previous_successors: Mapping[int, Sequence[int]] | None
+    previous_node_positions: Mapping[int, tuple[float, float]] | None
+
+
+def _encode_component[T: Hashable](
+    component: graphs.DirectedAcyclicGraph[T],
+    previous_components: Sequence[graphs.DirectedAcyclicGraph[T]] | None,
+    previous_node_positions: Mapping[T, tuple[float, float]] | None,
+) -> tuple[list[T], _EncodedComponent]:
+    """Encode a component, returning its nodes in the order of their indexes."""
+    nodes = list(component.nodes())
+    if previous_components is not None:
+        nodes.extend(
+            node
+            for previous_component in previous_components
+            for node in previous_component.nodes()
+            if node not in component.nodes()
+        )
+    node_idxs = {node: idx for idx, node in enumerate(nodes)}
+
+    previous_successors = None
+    encoded_previous_node_positions = None
+    if previous_components is not None and previous_node_positions is not None:
+        previous_successors = {
+            node_idxs[node]: [
+                node_idxs[successor]
+                for successor in previous_component.successors(node)
+            ]
+            for previous_component in previous_components
+            for node in previous_component.nodes()
+        }
+        encoded_previous_node_positions = {
+            node_idxs[node]: previous_node_positions[node]
+            for previous_component in previous_components
+            for node in previous_component.nodes()
+        }
+
+    encoded_component = _EncodedComponent(
+        successors=[
+            [node_idxs[successor] for successor in component.successors(node)]
+            for node in component.nodes()
+        ],
+        previous_successors=previous_successors,
+        previous_node_positions=encoded_previous_node_positions,
+    )
+    return nodes[: len(component.nodes())], encoded_component
+
+
+def _calculate_encoded_component_node_positions(
+    calculate_component_node_positions: CalculateComponentNodePositionsFn,
+    component: _EncodedComponent,
+) -> list[tuple[float, float]]:
+    """Calculate the positions of the nodes of a component, in index order.
+
+    Run in the pool of processes, so must be picklable.
+    """
+    graph = graphs.DirectedAcyclicGraph[int](enumerate(component.successors))
+    previous_graph = (
+        None
+        if component.previous_successors is None
+        else graphs.DirectedAcyclicGraph[int](component.previous_successors.items())
+    )
+    node_positions = calculate_component_node_positions(
+        graph=graph,
+        previous_graph=previous_graph,
+        previous_node_positions=component.previous_node_positions,
+    )
+    return [node_positions[idx] for idx in range(len(component.successors))]
+
+
+def _is_component_unchanged[T: Hashable](
+    component: graphs.DirectedAcyclicGraph[T],
+    previous_components: Sequence[graphs.DirectedAcyclicGraph[T]],
+) -> bool:
+    """Check if a component was also a component of the previous graph."""
+    return list(previous_components) == [component]
+
+
+def _move_to_previous_intra_level_positions[T: Hashable](
+    node_positions: Mapping[T, tuple[float, float]],
+    previous_node_positions: Mapping[T, tuple[float, float]],
+) -> dict[T, tuple[float, float]] | None:
+    """Move a component to where most of its nodes were previously.
+
+    Returns None if none of the nodes were in the previous layout.
+    """
+    offsets = [
+        previous_node_positions[node][0] - intra_level_position
+        for node, (intra_level_position, _) in node_positions.items()
+        if node in previous_node_positions
+    ]
+    if not offsets:
+        return None
+
+    offset = statistics.median(offsets)
+    return {
+        node: (intra_level_position + offset, level_position)
+        for node, (intra_level_position, level_position) in node_positions.items()
+    }
+
+
+def _move_after[T: Hashable](
+    node_positions: Mapping[T, tuple[float, float]], intra_level_position: float
+) -> dict[T, tuple[float, float]]:
+    """Move a component so it starts after the intra-level position."""
+    offset = intra_level_position - min(
+        component_intra_level_position
+        for component_intra_level_position, _ in node_positions.values()
+    )
+    return {
+        node: (component_intra_level_position + offset, level_position)
+        for node, (
+            component_intra_level_position,
+            level_position,
+        ) in node_positions.items()
+    }
+
+
+def calculate_node_positions_by_component[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T],
+    calculate_component_node_positions: CalculateComponentNodePositionsFn,
+    component_separation_distance: float,
+    previous_graph: graphs.DirectedAcyclicGraph[T] | None = None,
+    previous_node_positions: Mapping[T, tuple[float, float]] | None = None,
+) -> dict[T, tuple[float, float]]:
+    """Calculate the positions of the nodes of a graph, one component at a time.
+
+    The components are laid out in parallel, so the function to calculate the
+    positions of the nodes of a component must be picklable.
+
+    Components laid out again are moved to where their nodes were previously,
+    and new components after the rest, before the components are separated.
+    """
+    if (previous_graph is None) ^ (previous_node_positions is None):
+        msg = "previous_graph and previous_node_positions must be given together"
+        raise ValueError(msg)
+
+    previous_node_components = dict[T, graphs.DirectedAcyclicGraph[T]]()
+    if previous_graph is not None:
+        for previous_component in previous_graph.component_subgraphs():
+            previous_node_components.update(
+                (node, previous_component) for node in previous_component.nodes()
+            )
+
+    node_positions = dict[T, tuple[float, float]]()
+    components_nodes = list[list[T]]()
+    encoded_components = list[_EncodedComponent]()
+    for component in graph.component_subgraphs():
+        # Components whose nodes are all new are laid out from scratch
+        previous_components = (
+            list(
+                {
+                    id(previous_component): previous_component
+                    for node in component.nodes()
+                    if (previous_component := previous_node_components.get(node))
+                    is not None
+                }.values()
+            )
+            or None
+        )
+
+        if (
+            previous_components is not None
+            and previous_node_positions is not None
+            and _is_component_unchanged(component, previous_components)
+        ):
+            node_positions.update(
+                (node, previous_node_positions[node]) for node in component.nodes()
+            )
+            continue
+
+        component_nodes, encoded_component = _encode_component(
+            component,
+            previous_components=previous_components,
+            previous_node_positions=previous_node_positions,
+        )
+        components_nodes.append(component_nodes)
+        encoded_components.append(encoded_component)
+
+    calculated_components_node_positions = layout_process_pool.get_singleton().map(
+        functools.partial(
+            _calculate_encoded_component_node_positions,
+            calculate_component_node_positions,
+        ),
+        encoded_components,
+        nnodes=sum(map(len, components_nodes)),
+    )
+
+    new_components_node_positions = list[dict[T, tuple[float, float]]]()
+    for component_nodes, component_node_positions in zip(
+        components_nodes, calculated_components_node_positions, strict=True
+    ):
+        component_node_positions_by_node = dict(
+            zip(component_nodes, component_node_positions, strict=True)
+        )
+        moved_component_node_positions = (
+            None
+            if previous_node_positions is None
+            else _move_to_previous_intra_level_positions(
+                component_node_positions_by_node, previous_node_positions
+            )
+        )
+        if moved_component_node_positions is None:
+            new_components_node_positions.append(component_node_positions_by_node)
+        else:
+            node_positions.update(moved_component_node_positions)
+
+    # New components go after the rest, in the order they were found
+    max_intra_level_position = max(
+        (intra_level_position for intra_level_position, _ in node_positions.values()),
+        default=0,
+    )
+    for component_node_positions in new_components_node_positions:
+        moved_component_node_positions = _move_after(
+            component_node_positions,
+            max_intra_level_position + component_separation_distance,
+        )
+        node_positions.update(moved_component_node_positions)
+        max_intra_level_position = max(
+            intra_level_position
+            for intra_level_position, _ in moved_component_node_positions.values()
+        )
+
+    if not node_positions:
+        return {}
+
+    adjusted_intra_level_positions = get_node_positions_inter_component_adjustment(
+        graph=graph,
+        node_positions={
+            node: intra_level_position
+            for node, (intra_level_position, _) in node_positions.items()
+        },
+        component_separation_distance=component_separation_distance,
+    )
+    return {
+        node: (adjusted_intra_level_positions[node], level_position)
+        for node, (_, level_position) in node_positions.items()
+    }
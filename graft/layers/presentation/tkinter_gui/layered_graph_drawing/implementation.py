@@ -1,4 +1,4 @@
-from collections.abc import Hashable
+from collections.abc import Hashable, Mapping
 
 from graft import graphs
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing import (
@@ -21,13 +21,18 @@ def calculate_node_positions_sugiyama_method[T: Hashable](
     orientation: GraphOrientation,
     min_intra_layer_node_seperation: float,
     min_inter_layer_node_seperation: float,
+    previous_graph: graphs.DirectedAcyclicGraph[T] | None = None,
+    previous_node_positions: Mapping[T, tuple[float, float]] | None = None,
 ) -> dict[T, tuple[float, float]]:
     return calculate_node_positions(
         graph=graph,
         get_layers_fn=get_layers_topological_grouping_method,
         get_layer_orders_fn=layer_ordering.get_layer_orders_median_with_transpose_method,
+        update_layer_orders_fn=layer_ordering.update_layer_orders_least_intersecting_edges_method,
         get_node_positions_fn=node_positions.get_node_positions_best_method,
         orientation=orientation,
         min_intra_layer_node_seperation=min_intra_layer_node_seperation,
         min_inter_layer_node_seperation=min_inter_layer_node_seperation,
+        previous_graph=previous_graph,
+        previous_node_positions=previous_node_positions,
     )
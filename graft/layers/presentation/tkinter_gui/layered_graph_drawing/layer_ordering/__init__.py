@@ -1,6 +1,8 @@
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_ordering.median_with_transpose import (
     get_layer_orders_median_with_transpose_method,
+    update_layer_orders_least_intersecting_edges_method,
 )
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_ordering.protocol import (
     GetLayerOrdersFn,
+    UpdateLayerOrdersFn,
 )
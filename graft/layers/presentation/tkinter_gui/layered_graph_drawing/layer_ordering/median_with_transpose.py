@@ -1,8 +1,6 @@
-import copy
+import bisect
 import itertools
-import statistics
 from collections.abc import (
-    Callable,
     Collection,
     Hashable,
     Iterable,
@@ -10,112 +8,264 @@ from collections.abc import (
     Sequence,
 )
 
+import numpy as np
+import numpy.typing as npt
+
 from graft import graphs
-from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_ordering.utils import (
-    calculate_nintersecting_edges_between_layers,
-    get_edges_between_layers,
-)
 
 NITERATIONS = 30
+# Nodes are moved when updating until no move reduces the intersecting edges,
+# or this many passes are made over them
+NITERATIONS_WHEN_UPDATING = 4
 
 
-def _get_initial_layer_orders[T](layers: Sequence[Collection[T]]) -> list[list[T]]:
-    return [list(layer) for layer in layers]
+class _NeighbourArrays:
+    """Neighbours of every node, as arrays so they can be processed with NumPy.
 
+    The neighbours of the node with ID i are flat[offsets[i]:offsets[i] + degrees[i]].
+    """
 
-def _calc_median_idx_of_neighbours[T](
-    node: T,
-    neighbours_layer: Sequence[T],
-    get_neighbours_fn: Callable[[T], Iterable[T]],
-) -> float:
-    neighbour_idxs = (
-        neighbours_layer.index(neighbour) for neighbour in get_neighbours_fn(node)
-    )
-    return statistics.median(neighbour_idxs)
+    def __init__(self, neighbours: Sequence[Sequence[int]]) -> None:
+        self.degrees = np.array(
+            [len(node_neighbours) for node_neighbours in neighbours]
+        )
+        self.offsets = np.cumsum(self.degrees) - self.degrees
+        self.flat = np.fromiter(
+            itertools.chain.from_iterable(neighbours), dtype=np.int64
+        )
 
 
-def calc_median_idx_of_predecesors[T](
-    node: T,
-    predecessors_layer: Sequence[T],
-    graph: graphs.DirectedAcyclicGraph[T],
-) -> float:
-    """Get median index of predecessors."""
-    return _calc_median_idx_of_neighbours(
-        node=node,
-        neighbours_layer=predecessors_layer,
-        get_neighbours_fn=graph.predecessors,
-    )
+def _calc_median_positions_of_neighbours(
+    layer: npt.NDArray[np.int64],
+    neighbours: _NeighbourArrays,
+    positions: npt.NDArray[np.int64],
+) -> npt.NDArray[np.float64]:
+    """Calculate the median position of the neighbours of each node in a layer.
 
+    Nodes without neighbours keep their own position in the layer.
+    """
+    degrees = neighbours.degrees[layer]
+    # Where each node's neighbours start, once gathered together
+    starts = np.cumsum(degrees) - degrees
+    neighbour_positions = positions[
+        neighbours.flat[
+            np.repeat(neighbours.offsets[layer] - starts, degrees)
+            + np.arange(degrees.sum())
+        ]
+    ]
+    node_idxs = np.repeat(np.arange(len(layer)), degrees)
+    sorted_neighbour_positions = neighbour_positions[
+        np.lexsort((neighbour_positions, node_idxs))
+    ]
 
-def calc_median_idx_of_successors[T](
-    node: T,
-    successors_layer: Sequence[T],
-    graph: graphs.DirectedAcyclicGraph[T],
-) -> float:
-    """Get median index of successors, rounding down."""
-    return _calc_median_idx_of_neighbours(
-        node=node, neighbours_layer=successors_layer, get_neighbours_fn=graph.successors
-    )
+    medians = np.arange(len(layer), dtype=np.float64)
+    has_neighbours = degrees > 0
+    starts = starts[has_neighbours]
+    degrees = degrees[has_neighbours]
+    medians[has_neighbours] = (
+        sorted_neighbour_positions[starts + (degrees - 1) // 2]
+        + sorted_neighbour_positions[starts + degrees // 2]
+    ) / 2
+    return medians
 
 
-def _get_nintersecting_edges_with_adjacent_layers[T](
-    layer_idx: int,
-    layers: Sequence[MutableSequence[T]],
-    graph: graphs.DirectedAcyclicGraph[T],
+def _calc_nintersecting_edges_change_if_swapped(
+    positions1: Iterable[int], sorted_positions2: Sequence[int]
 ) -> int:
-    nintersecting_edges = 0
-    if layer_idx - 1 >= 0:
-        previous_layer = layers[layer_idx - 1]
-        edges = get_edges_between_layers(
-            graph=graph, source_layer=previous_layer, target_layer=layers[layer_idx]
-        )
-        nintersecting_edges += calculate_nintersecting_edges_between_layers(
-            source_layer=previous_layer, target_layer=layers[layer_idx], edges=edges
-        )
-    if layer_idx + 1 < len(layers):
-        next_layer = layers[layer_idx + 1]
-        edges = get_edges_between_layers(
-            graph=graph, source_layer=layers[layer_idx], target_layer=next_layer
+    """Calculate the change in intersecting edges if two adjacent nodes are swapped.
+
+    The first node is before the second in its layer, and the positions are of
+    their neighbours in an adjacent layer. An edge to each node intersects if
+    the first node's neighbour is after the second's, until they are swapped.
+    Edges that share a neighbour never intersect.
+    """
+    return sum(
+        len(sorted_positions2)
+        - bisect.bisect_right(sorted_positions2, position)
+        - bisect.bisect_left(sorted_positions2, position)
+        for position in positions1
+    )
+
+
+class _LayerEdgeIndex[T: Hashable]:
+    """Edges between adjacent layers, and the position of each node in its layer.
+
+    The edges are found once up front, as the nodes in each layer don't change,
+    only their order. Nodes are numbered, so hashing them isn't repeated.
+    """
+
+    def __init__(
+        self, graph: graphs.DirectedAcyclicGraph[T], layers: Sequence[Collection[T]]
+    ) -> None:
+        self._ids = {
+            node: node_id
+            for node_id, node in enumerate(itertools.chain.from_iterable(layers))
+        }
+        self._nodes = list(self._ids)
+        self._positions = [0] * len(self._nodes)
+
+        layer_idxs = {
+            node: layer_idx for layer_idx, layer in enumerate(layers) for node in layer
+        }
+        # Neighbours in the previous and next layer of each node, by ID
+        self._predecessors = [
+            [
+                self._ids[predecessor]
+                for predecessor in graph.predecessors(node)
+                if layer_idxs.get(predecessor) == layer_idxs[node] - 1
+            ]
+            for node in self._nodes
+        ]
+        self._successors = [
+            [
+                self._ids[successor]
+                for successor in graph.successors(node)
+                if layer_idxs.get(successor) == layer_idxs[node] + 1
+            ]
+            for node in self._nodes
+        ]
+        self._predecessor_arrays = _NeighbourArrays(self._predecessors)
+        self._successor_arrays = _NeighbourArrays(self._successors)
+
+    def sort_layers_by_median_position_of_predecessors(
+        self, layers: MutableSequence[npt.NDArray[np.int64]]
+    ) -> None:
+        """Sort each layer in turn, from the first, by the median of predecessors.
+
+        Sorting is stable, so nodes with the same median keep their order.
+        """
+        self._sort_layers_by_median_position_of_neighbours(
+            layers, range(len(layers)), self._predecessor_arrays
         )
-        nintersecting_edges += calculate_nintersecting_edges_between_layers(
-            source_layer=layers[layer_idx], target_layer=next_layer, edges=edges
+
+    def sort_layers_by_median_position_of_successors(
+        self, layers: MutableSequence[npt.NDArray[np.int64]]
+    ) -> None:
+        """Sort each layer in turn, from the last, by the median of successors.
+
+        Sorting is stable, so nodes with the same median keep their order.
+        """
+        self._sort_layers_by_median_position_of_neighbours(
+            layers, reversed(range(len(layers))), self._successor_arrays
         )
-    return nintersecting_edges
 
+    def _sort_layers_by_median_position_of_neighbours(
+        self,
+        layers: MutableSequence[npt.NDArray[np.int64]],
+        layer_idxs: Iterable[int],
+        neighbours: _NeighbourArrays,
+    ) -> None:
+        # Neighbours are always in the previously sorted layer, so only its
+        # positions are needed
+        positions = np.zeros(len(self._nodes), dtype=np.int64)
+        layer_idxs = iter(layer_idxs)
+        first_layer = layers[next(layer_idxs)]
+        positions[first_layer] = np.arange(len(first_layer))
+        for layer_idx in layer_idxs:
+            layer = layers[layer_idx]
+            medians = _calc_median_positions_of_neighbours(layer, neighbours, positions)
+            layer = layer[np.argsort(medians, kind="stable")]
+            positions[layer] = np.arange(len(layer))
+            layers[layer_idx] = layer
+
+    def to_ids(self, layer: Iterable[T]) -> list[int]:
+        return [self._ids[node] for node in layer]
+
+    def to_nodes(self, layer: Iterable[int]) -> list[T]:
+        return [self._nodes[node_id] for node_id in layer]
+
+    def set_positions(self, layer: Sequence[int]) -> None:
+        for idx, node_id in enumerate(layer):
+            self._positions[node_id] = idx
+
+    def swap(self, layer: MutableSequence[int], idx1: int, idx2: int) -> None:
+        layer[idx1], layer[idx2] = layer[idx2], layer[idx1]
+        self._positions[layer[idx1]] = idx1
+        self._positions[layer[idx2]] = idx2
+
+    def calc_nintersecting_edges_change_if_swapped(
+        self, node_id1: int, node_id2: int
+    ) -> int:
+        """Calculate the change in intersecting edges if adjacent nodes are swapped.
+
+        Node 1 must be immediately before node 2 in their layer. Only the edges
+        of the two nodes can start or stop intersecting, and only with each other.
+        """
+        change = 0
+        for neighbours in [self._predecessors, self._successors]:
+            neighbours1 = neighbours[node_id1]
+            neighbours2 = neighbours[node_id2]
+            if not neighbours1 or not neighbours2:
+                continue
 
-def _transpose[T](
-    layers: Sequence[MutableSequence[T]], graph: graphs.DirectedAcyclicGraph[T]
+            # Most nodes, such as dummy nodes, have a single neighbour each side
+            if len(neighbours1) == 1 and len(neighbours2) == 1:
+                position1 = self._positions[neighbours1[0]]
+                position2 = self._positions[neighbours2[0]]
+                change += (position1 < position2) - (position1 > position2)
+                continue
+
+            change += _calc_nintersecting_edges_change_if_swapped(
+                (self._positions[node] for node in neighbours1),
+                sorted(self._positions[node] for node in neighbours2),
+            )
+        return change
+
+
+def _transpose[T: Hashable](
+    layers: MutableSequence[npt.NDArray[np.int64]], edge_index: _LayerEdgeIndex[T]
 ) -> None:
+    # Nodes are swapped one pair at a time, which is faster with lists
+    list_layers = [layer.tolist() for layer in layers]
+    for layer in list_layers:
+        edge_index.set_positions(layer)
+
     is_improved = True
     while is_improved:
         is_improved = False
-        for layer_idx in range(len(layers)):
-            layer = layers[layer_idx]
-
-            nintersecting_edges = _get_nintersecting_edges_with_adjacent_layers(
-                layer_idx=layer_idx, layers=layers, graph=graph
-            )
-
+        for layer in list_layers:
             for idx1, idx2 in itertools.pairwise(range(len(layer))):
-                layers_copy = list(layers)
-                layer_copy = copy.copy(layer)
-                layer_copy[idx1], layer_copy[idx2] = layer_copy[idx2], layer_copy[idx1]
-                layers_copy[layer_idx] = layer_copy
-
-                nintersecting_edges_when_nodes_transposed = (
-                    _get_nintersecting_edges_with_adjacent_layers(
-                        layer_idx=layer_idx, layers=layers_copy, graph=graph
+                if (
+                    edge_index.calc_nintersecting_edges_change_if_swapped(
+                        layer[idx1], layer[idx2]
                     )
-                )
-
-                if nintersecting_edges_when_nodes_transposed >= nintersecting_edges:
+                    >= 0
+                ):
                     continue
 
-                layer[idx1], layer[idx2] = layer[idx2], layer[idx1]
-                nintersecting_edges = nintersecting_edges_when_nodes_transposed
-
+                edge_index.swap(layer, idx1, idx2)
                 is_improved = True
 
+    layers[:] = [np.array(layer, dtype=np.int64) for layer in list_layers]
+
+
+def _move_to_least_intersecting_edges_idx[T: Hashable](
+    layer: MutableSequence[int], idx: int, edge_index: _LayerEdgeIndex[T]
+) -> bool:
+    """Move a node to where its edges intersect the fewest others in its layer.
+
+    Returns whether the node moved. If several places are as good, the node
+    moves to the closest.
+    """
+    node_id = layer.pop(idx)
+    # The change in intersecting edges from moving the node past each other
+    nintersecting_edges_changes = [
+        0,
+        *itertools.accumulate(
+            edge_index.calc_nintersecting_edges_change_if_swapped(
+                node_id, other_node_id
+            )
+            for other_node_id in layer
+        ),
+    ]
+    new_idx = min(
+        range(len(nintersecting_edges_changes)),
+        key=lambda new_idx: (nintersecting_edges_changes[new_idx], abs(new_idx - idx)),
+    )
+    layer.insert(new_idx, node_id)
+    edge_index.set_positions(layer)
+    return new_idx != idx
+
 
 def get_layer_orders_median_with_transpose_method[T: Hashable](
     graph: graphs.DirectedAcyclicGraph[T],
@@ -124,42 +274,55 @@ def get_layer_orders_median_with_transpose_method[T: Hashable](
     if len(layers) == 0:
         return []
 
-    best_layer_orders = _get_initial_layer_orders(layers=layers)
+    edge_index = _LayerEdgeIndex(graph=graph, layers=layers)
+    # Layers are ordered by node ID, so positions can be looked up in arrays
+    layer_orders = [
+        np.array(edge_index.to_ids(layer), dtype=np.int64) for layer in layers
+    ]
 
     for _ in range(NITERATIONS):
-        layer_orders = [list(best_layer_orders[0])]
-        for layer in itertools.islice(best_layer_orders, 1, None):
-            node_median_idx_of_predecessors_map = {
-                node: calc_median_idx_of_predecesors(
-                    node=node, predecessors_layer=layer_orders[-1], graph=graph
-                )
-                for node in layer
-            }
-            sorted_layer = sorted(
-                layer, key=lambda node: node_median_idx_of_predecessors_map[node]
-            )
-            layer_orders.append(sorted_layer)
-        best_layer_orders = layer_orders
-
-        layer_orders_reversed = [list(best_layer_orders[-1])]
-        for layer in itertools.islice(reversed(best_layer_orders), 1, None):
-            node_median_idx_of_successors_map = dict[T, float]()
-            for idx, node in enumerate(layer):
-                if not graph.successors(node):
-                    node_median_idx_of_successors_map[node] = idx
-                    continue
-                node_median_idx_of_successors_map[node] = calc_median_idx_of_successors(
-                    node=node, successors_layer=layer_orders_reversed[-1], graph=graph
-                )
-            sorted_layer = sorted(
-                layer, key=lambda node: node_median_idx_of_successors_map[node]
-            )
-            layer_orders_reversed.append(sorted_layer)
-        best_layer_orders = list(reversed(layer_orders_reversed))
+        edge_index.sort_layers_by_median_position_of_predecessors(layer_orders)
+        edge_index.sort_layers_by_median_position_of_successors(layer_orders)
+        _transpose(layers=layer_orders, edge_index=edge_index)
+
+    return [edge_index.to_nodes(layer) for layer in layer_orders]
+
+
+def update_layer_orders_least_intersecting_edges_method[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T],
+    layer_orders: Sequence[Sequence[T]],
+    nodes_to_update: Collection[T],
+) -> list[list[T]]:
+    """Update layer orders by moving only some nodes.
+
+    Each node is moved to where its edges intersect the fewest others, with
+    every other node left in order. The work done scales with the number of
+    nodes moved, rather than the size of the graph.
+    """
+    edge_index = _LayerEdgeIndex(graph=graph, layers=layer_orders)
+    list_layers = [edge_index.to_ids(layer) for layer in layer_orders]
+    for layer in list_layers:
+        edge_index.set_positions(layer)
+
+    node_ids_to_update = set(edge_index.to_ids(nodes_to_update))
+    layers_to_update = [
+        layer
+        for layer in list_layers
+        if not node_ids_to_update.isdisjoint(layer)
+    ]
+
+    for _ in range(NITERATIONS_WHEN_UPDATING):
+        is_improved = False
+        for layer in layers_to_update:
+            for node_id in [
+                node_id for node_id in layer if node_id in node_ids_to_update
+            ]:
+                if _move_to_least_intersecting_edges_idx(
+                    layer, layer.index(node_id), edge_index
+                ):
+                    is_improved = True
 
-        # TODO: A lot of the work in `transpose`` is repeated each time it is
-        # called (eg: working out which edges belong between which layers).
-        # Could do this all once up front and pass around a dict.
-        _transpose(layers=best_layer_orders, graph=graph)
+        if not is_improved:
+            break
 
-    return best_layer_orders
+    return [edge_index.to_nodes(layer) for layer in list_layers]
@@ -8,3 +8,12 @@ class GetLayerOrdersFn[T: Hashable](Protocol):
     def __call__(
         self, graph: graphs.DirectedAcyclicGraph[T], layers: Sequence[Collection[T]]
     ) -> Sequence[Sequence[T]]: ...
+
+
+class UpdateLayerOrdersFn[T: Hashable](Protocol):
+    def __call__(
+        self,
+        graph: graphs.DirectedAcyclicGraph[T],
+        layer_orders: Sequence[Sequence[T]],
+        nodes_to_update: Collection[T],
+    ) -> Sequence[Sequence[T]]: ...
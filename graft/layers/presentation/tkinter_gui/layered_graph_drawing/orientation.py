@@ -32,6 +32,24 @@ def _place_nodes_in_horizontal_orientation[T: Hashable](
     }
 
 
+def _unplace_nodes_in_vertical_orientation[T: Hashable](
+    node_positions: Mapping[T, tuple[float, float]],
+) -> dict[T, tuple[float, float]]:
+    return {
+        node: (x_position, -y_position)
+        for node, (x_position, y_position) in node_positions.items()
+    }
+
+
+def _unplace_nodes_in_horizontal_orientation[T: Hashable](
+    node_positions: Mapping[T, tuple[float, float]],
+) -> dict[T, tuple[float, float]]:
+    return {
+        node: (-y_position, x_position)
+        for node, (x_position, y_position) in node_positions.items()
+    }
+
+
 def get_place_nodes_fn(orientation: GraphOrientation) -> PlaceNodesFn:
     match orientation:
         case GraphOrientation.VERTICAL:
@@ -40,3 +58,14 @@ def get_place_nodes_fn(orientation: GraphOrientation) -> PlaceNodesFn:
             return _place_nodes_in_horizontal_orientation
 
     raise ValueError
+
+
+def get_unplace_nodes_fn(orientation: GraphOrientation) -> PlaceNodesFn:
+    """Get the function that undoes placing nodes, for their level positions."""
+    match orientation:
+        case GraphOrientation.VERTICAL:
+            return _unplace_nodes_in_vertical_orientation
+        case GraphOrientation.HORIZONTAL:
+            return _unplace_nodes_in_horizontal_orientation
+
+    raise ValueError
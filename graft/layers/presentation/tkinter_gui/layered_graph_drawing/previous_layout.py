@@ -0,0 +1,122 @@
+"""Starting a layout from the layout of a previous version of the graph.
+
+Layers are first ordered by where their nodes were in the previous layout. Only
+the nodes affected by the change to the graph are then moved, so the rest of the
+graph stays where it was, and the work done scales with the change.
+"""
+
+import itertools
+import statistics
+from collections.abc import Collection, Hashable, Iterable, Mapping, Sequence
+
+from graft import graphs
+from graft.layers.presentation.tkinter_gui.layered_graph_drawing.dummy_node import (
+    DummyNode,
+)
+
+
+def get_changed_nodes[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T],
+    layers: Sequence[Iterable[T]],
+    previous_graph: graphs.DirectedAcyclicGraph[T],
+    previous_layers: Sequence[Iterable[T]],
+) -> set[T]:
+    """Get the nodes that are new, or whose layer or neighbours have changed."""
+    previous_layer_idxs = {
+        node: layer_idx
+        for layer_idx, layer in enumerate(previous_layers)
+        for node in layer
+    }
+    return {
+        node
+        for layer_idx, layer in enumerate(layers)
+        for node in layer
+        if previous_layer_idxs.get(node) != layer_idx
+        or set(graph.predecessors(node)) != set(previous_graph.predecessors(node))
+        or set(graph.successors(node)) != set(previous_graph.successors(node))
+    }
+
+
+def _get_dummy_chain[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T | DummyNode], first_dummy_node: DummyNode
+) -> tuple[list[DummyNode], T]:
+    """Get the dummy nodes replacing an edge, and the target of the edge."""
+    dummy_nodes = [first_dummy_node]
+    while True:
+        (successor,) = graph.successors(dummy_nodes[-1])
+        if not isinstance(successor, DummyNode):
+            return dummy_nodes, successor
+        dummy_nodes.append(successor)
+
+
+def get_initial_layer_orders[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T | DummyNode],
+    layers: Sequence[Collection[T | DummyNode]],
+    previous_intra_level_positions: Mapping[T, float],
+) -> list[list[T | DummyNode]]:
+    """Order each layer by the positions of its nodes in the previous layout.
+
+    New nodes are positioned at the median of their neighbours, and dummy nodes
+    evenly between the ends of the edge they replace. Nodes that still can't be
+    positioned go at the end of their layer.
+    """
+    positions = dict[T | DummyNode, float](previous_intra_level_positions.items())
+
+    for node in itertools.chain.from_iterable(layers):
+        if isinstance(node, DummyNode) or node in positions:
+            continue
+
+        neighbour_positions = [
+            positions[neighbour]
+            for neighbour in itertools.chain(
+                graph.predecessors(node), graph.successors(node)
+            )
+            if neighbour in positions
+        ]
+        if neighbour_positions:
+            positions[node] = statistics.median(neighbour_positions)
+
+    for source in itertools.chain.from_iterable(layers):
+        if isinstance(source, DummyNode) or source not in positions:
+            continue
+
+        for successor in graph.successors(source):
+            if not isinstance(successor, DummyNode):
+                continue
+
+            dummy_nodes, target = _get_dummy_chain(graph, successor)
+            if target not in positions:
+                continue
+
+            step = (positions[target] - positions[source]) / (len(dummy_nodes) + 1)
+            for nsteps, dummy_node in enumerate(dummy_nodes, start=1):
+                positions[dummy_node] = positions[source] + nsteps * step
+
+    return [
+        sorted(layer, key=lambda node: (node not in positions, positions.get(node, 0)))
+        for layer in layers
+    ]
+
+
+def get_nodes_to_update[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T | DummyNode], changed_nodes: Collection[T]
+) -> set[T | DummyNode]:
+    """Get the changed nodes, and the dummy nodes on their edges."""
+    nodes_to_update = set[T | DummyNode](changed_nodes)
+    for node in changed_nodes:
+        for get_neighbours in [graph.predecessors, graph.successors]:
+            dummy_nodes = [
+                neighbour
+                for neighbour in get_neighbours(node)
+                if isinstance(neighbour, DummyNode)
+            ]
+            while dummy_nodes:
+                dummy_node = dummy_nodes.pop()
+                nodes_to_update.add(dummy_node)
+                dummy_nodes.extend(
+                    neighbour
+                    for neighbour in get_neighbours(dummy_node)
+                    if isinstance(neighbour, DummyNode)
+                )
+
+    return nodes_to_update
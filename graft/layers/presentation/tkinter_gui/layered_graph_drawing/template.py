@@ -1,9 +1,14 @@
+import functools
 from collections.abc import (
     Hashable,
     Mapping,
 )
 
 from graft import graphs
+from graft.layers.presentation.tkinter_gui.layered_graph_drawing import (
+    component_layout,
+    previous_layout,
+)
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.dummy_node import (
     DummyNode,
     substitute_dummy_nodes_and_edges,
@@ -13,6 +18,7 @@ from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_assignmen
 )
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_ordering import (
     GetLayerOrdersFn,
+    UpdateLayerOrdersFn,
 )
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.node_positions import (
     GetNodePositionsFn,
@@ -20,6 +26,7 @@ from graft.layers.presentation.tkinter_gui.layered_graph_drawing.node_positions
 from graft.layers.presentation.tkinter_gui.layered_graph_drawing.orientation import (
     GraphOrientation,
     get_place_nodes_fn,
+    get_unplace_nodes_fn,
 )
 
 
@@ -33,14 +40,16 @@ def _remove_dummy_nodes[T: Hashable, V](
     }
 
 
-def calculate_node_positions[T: Hashable](
+def _calculate_unplaced_node_positions[T: Hashable](
     graph: graphs.DirectedAcyclicGraph[T],
     get_layers_fn: GetLayersFn[T],
     get_layer_orders_fn: GetLayerOrdersFn[T | DummyNode],
+    update_layer_orders_fn: UpdateLayerOrdersFn[T | DummyNode],
     get_node_positions_fn: GetNodePositionsFn[T | DummyNode],
-    orientation: GraphOrientation,
     min_intra_layer_node_seperation: float,
     min_inter_layer_node_seperation: float,
+    previous_graph: graphs.DirectedAcyclicGraph[T] | None = None,
+    previous_node_positions: Mapping[T, tuple[float, float]] | None = None,
 ) -> dict[T, tuple[float, float]]:
     layers = get_layers_fn(graph=graph)
 
@@ -49,10 +58,37 @@ def calculate_node_positions[T: Hashable](
         layers_with_dummies,
     ) = substitute_dummy_nodes_and_edges(graph=graph, layers=layers)
 
-    layer_orders_with_dummies = get_layer_orders_fn(
-        graph=graph_with_dummies, layers=layers_with_dummies
-    )
+    if previous_graph is None or previous_node_positions is None:
+        layer_orders_with_dummies = get_layer_orders_fn(
+            graph=graph_with_dummies, layers=layers_with_dummies
+        )
+    else:
+        changed_nodes = previous_layout.get_changed_nodes(
+            graph=graph,
+            layers=layers,
+            previous_graph=previous_graph,
+            previous_layers=get_layers_fn(graph=previous_graph),
+        )
+        layer_orders_with_dummies = update_layer_orders_fn(
+            graph=graph_with_dummies,
+            layer_orders=previous_layout.get_initial_layer_orders(
+                graph=graph_with_dummies,
+                layers=layers_with_dummies,
+                previous_intra_level_positions={
+                    node: intra_level_position
+                    for node, (
+                        intra_level_position,
+                        _,
+                    ) in previous_node_positions.items()
+                },
+            ),
+            nodes_to_update=previous_layout.get_nodes_to_update(
+                graph=graph_with_dummies, changed_nodes=changed_nodes
+            ),
+        )
 
+    # Only the layer orders are updated incrementally - the coordinates are
+    # always recomputed from them in full
     node_positions_with_dummies = get_node_positions_fn(
         graph=graph_with_dummies,
         ordered_layers=layer_orders_with_dummies,
@@ -60,7 +96,57 @@ def calculate_node_positions[T: Hashable](
         min_inter_layer_node_seperation=min_inter_layer_node_seperation,
     )
 
-    node_positions = _remove_dummy_nodes(node_positions=node_positions_with_dummies)
+    return _remove_dummy_nodes(node_positions=node_positions_with_dummies)
+
+
+def calculate_node_positions[T: Hashable](
+    graph: graphs.DirectedAcyclicGraph[T],
+    get_layers_fn: GetLayersFn[int],
+    get_layer_orders_fn: GetLayerOrdersFn[int | DummyNode],
+    update_layer_orders_fn: UpdateLayerOrdersFn[int | DummyNode],
+    get_node_positions_fn: GetNodePositionsFn[int | DummyNode],
+    orientation: GraphOrientation,
+    min_intra_layer_node_seperation: float,
+    min_inter_layer_node_seperation: float,
+    previous_graph: graphs.DirectedAcyclicGraph[T] | None = None,
+    previous_node_positions: Mapping[T, tuple[float, float]] | None = None,
+) -> dict[T, tuple[float, float]]:
+    """Calculate the positions of the nodes of a graph.
+
+    Each component of the graph is laid out separately, in parallel, and then
+    the components are separated. The components are laid out in other
+    processes with their nodes replaced by indexes, so the functions given
+    must be picklable, and are only given graphs of indexes.
+
+    If the previous version of the graph and its node positions are given,
+    components that haven't changed keep their previous positions. In the rest,
+    layer orders start from the previous positions, and only the nodes affected
+    by the change are reordered. The node coordinates of those components are
+    still recomputed in full from their layer orders.
+    """
+    if (previous_graph is None) ^ (previous_node_positions is None):
+        msg = "previous_graph and previous_node_positions must be given together"
+        raise ValueError(msg)
+
+    unplace_nodes_fn = get_unplace_nodes_fn(orientation=orientation)
+
+    node_positions = component_layout.calculate_node_positions_by_component(
+        graph=graph,
+        calculate_component_node_positions=functools.partial(
+            _calculate_unplaced_node_positions,
+            get_layers_fn=get_layers_fn,
+            get_layer_orders_fn=get_layer_orders_fn,
+            update_layer_orders_fn=update_layer_orders_fn,
+            get_node_positions_fn=get_node_positions_fn,
+            min_intra_layer_node_seperation=min_intra_layer_node_seperation,
+            min_inter_layer_node_seperation=min_inter_layer_node_seperation,
+        ),
+        component_separation_distance=min_intra_layer_node_seperation,
+        previous_graph=previous_graph,
+        previous_node_positions=None
+        if previous_node_positions is None
+        else unplace_nodes_fn(node_positions=previous_node_positions),
+    )
 
     place_nodes_fn = get_place_nodes_fn(orientation=orientation)
 
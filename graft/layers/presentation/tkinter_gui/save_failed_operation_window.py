@@ -0,0 +1,26 @@
+import tkinter as tk
+from tkinter import ttk
+
+from graft.layers.presentation.tkinter_gui.helpers import failed_operation_window
+
+
+class SaveFailedOperationWindow(failed_operation_window.OperationFailedWindow):
+    def __init__(
+        self, master: tk.Misc, exception: Exception, *, is_reloaded: bool = False
+    ) -> None:
+        super().__init__(master=master)
+        self._description = ttk.Label(
+            self,
+            text=(
+                "Failed to save changes, as the data was changed elsewhere, so the "
+                "latest data has been loaded instead"
+                if is_reloaded
+                else "Failed to save changes, so they may be lost"
+            ),
+        )
+        self._exception_type = ttk.Label(self, text=str(type(exception)))
+        self._exception = ttk.Label(self, text=str(exception))
+
+        self._description.grid(row=0, column=0)
+        self._exception_type.grid(row=1, column=0)
+        self._exception.grid(row=2, column=0)
@@ -4,7 +4,6 @@ from collections.abc import Callable
 from tkinter import ttk
 
 from graft.domain import tasks
-from graft.layers.presentation.tkinter_gui import event_broker
 from graft.layers.presentation.tkinter_gui.helpers.delete_task_error_windows import (
     convert_delete_task_exceptions_to_error_windows,
 )
@@ -50,6 +49,4 @@ class TaskDeletionConfirmationWindow(tk.Toplevel):
         ):
             return
 
-        broker = event_broker.get_singleton()
-        broker.publish(event=event_broker.SystemModified())
         self.destroy()
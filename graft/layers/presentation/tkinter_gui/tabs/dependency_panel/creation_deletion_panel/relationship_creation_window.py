@@ -5,9 +5,6 @@ from tkinter import ttk
 from typing import Final
 
 from graft.domain import tasks
-from graft.layers.presentation.tkinter_gui import (
-    event_broker,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -182,8 +179,6 @@ class RelationshipCreationWindow(tk.Toplevel):
         if not self._create_relationship(source, target):
             return
 
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
         self.destroy()
 
     def _get_selected_source(self) -> tasks.UID | None:
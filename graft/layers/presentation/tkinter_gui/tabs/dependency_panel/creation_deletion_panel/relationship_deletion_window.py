@@ -5,7 +5,6 @@ from tkinter import ttk
 from typing import Final
 
 from graft.domain import tasks
-from graft.layers.presentation.tkinter_gui import event_broker
 
 _NO_TASK_MENU_OPTION: Final = ""
 
@@ -119,8 +118,6 @@ class RelationshipDeletionWindow(tk.Toplevel):
         if not self._delete_relationship(dependee_task, dependent_task):
             return
 
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
         self.destroy()
 
     def _update_confirm_button_state(self) -> None:
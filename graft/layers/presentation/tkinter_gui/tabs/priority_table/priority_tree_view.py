@@ -3,9 +3,6 @@ from tkinter import ttk
 
 from graft import architecture
 from graft.domain import tasks
-from graft.domain.priority_order import (
-    get_active_concrete_tasks_in_descending_priority_order,
-)
 from graft.layers.presentation.tkinter_gui import domain_visual_language, event_broker
 from graft.layers.presentation.tkinter_gui.helpers import (
     importance_display,
@@ -95,9 +92,7 @@ class PriorityTreeView(ttk.Treeview):
         self.delete(*self.get_children())
 
         for rank, (uid, downstream_importance, importance, progress) in enumerate(
-            get_active_concrete_tasks_in_descending_priority_order(
-                self._logic_layer.get_system()
-            ),
+            self._logic_layer.get_active_concrete_tasks_in_descending_priority_order(),
             start=1,
         ):
             name = self._logic_layer.get_task_system().attributes_register()[uid].name
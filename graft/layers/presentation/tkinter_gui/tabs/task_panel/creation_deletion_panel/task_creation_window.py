@@ -81,6 +81,5 @@ class TaskCreationWindow(tk.Toplevel):
         created_task = self._logic_layer.create_task(name=name, description=description)
 
         broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
         broker.publish(event_broker.TaskSelected(created_task))
         self.destroy()
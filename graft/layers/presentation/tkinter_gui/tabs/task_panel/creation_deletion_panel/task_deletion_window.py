@@ -6,9 +6,6 @@ from tkinter import ttk
 
 from graft import architecture
 from graft.domain import tasks
-from graft.layers.presentation.tkinter_gui import (
-    event_broker,
-)
 from graft.layers.presentation.tkinter_gui.helpers.delete_task_error_windows import (
     convert_delete_task_exceptions_to_error_windows,
 )
@@ -85,6 +82,4 @@ class TaskDeletionWindow(tk.Toplevel):
         ):
             return
 
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
         self.destroy()
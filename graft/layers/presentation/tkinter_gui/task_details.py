@@ -515,6 +515,12 @@ class TaskDetails(tk.Frame):
             return
 
         if isinstance(event, event_broker.SystemModified) and self._task:
+            # Changes to other tasks don't affect what's shown. Renaming a
+            # related task affects this one too, as the related task's name is
+            # shown
+            if self._task not in event.affected_tasks:
+                return
+
             if self._task not in self._logic_layer.get_task_system().tasks():
                 self._task = None
                 self._update_with_no_task()
@@ -534,9 +540,6 @@ class TaskDetails(tk.Frame):
 
         self._logic_layer.update_task_name(task=self._task, name=name)
 
-        broker = event_broker.get_singleton()
-        broker.publish(event=event_broker.SystemModified())
-
     def _save_current_description(self: Self) -> None:
         assert self._task
 
@@ -545,9 +548,6 @@ class TaskDetails(tk.Frame):
 
         self._logic_layer.update_task_description(self._task, description)
 
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
-
     def _on_importance_selected_from_option_button(self, selection: str) -> None:
         logger.info("Importance [%s] selected from option menu", selection)
         self._save_current_importance()
@@ -577,9 +577,6 @@ class TaskDetails(tk.Frame):
         # Operation succeeded, so update the backup
         self._selected_importance_backup = importance
 
-        broker = event_broker.get_singleton()
-        broker.publish(event=event_broker.SystemModified())
-
     def _on_increment_progress_button_clicked(self) -> None:
         logger.info("Increment progress button clicked")
         self._save_incremented_progress()
@@ -590,7 +587,7 @@ class TaskDetails(tk.Frame):
         current_progress = self._logic_layer.get_task_system().get_progress(self._task)
         incremented_progress = _get_progress_increment(current_progress)
 
-        if not convert_update_task_progress_exceptions_to_error_windows(
+        convert_update_task_progress_exceptions_to_error_windows(
             functools.partial(
                 self._logic_layer.update_concrete_task_progress,
                 self._task,
@@ -600,11 +597,7 @@ class TaskDetails(tk.Frame):
             .attributes_register()[task]
             .name,
             master=self,
-        ):
-            return
-
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
+        )
 
     def _on_decrement_progress_button_clicked(self) -> None:
         logger.info("Decrement progress button clicked")
@@ -616,7 +609,7 @@ class TaskDetails(tk.Frame):
         current_progress = self._logic_layer.get_task_system().get_progress(self._task)
         decremented_progress = _get_progress_decrement(current_progress)
 
-        if not convert_update_task_progress_exceptions_to_error_windows(
+        convert_update_task_progress_exceptions_to_error_windows(
             functools.partial(
                 self._logic_layer.update_concrete_task_progress,
                 self._task,
@@ -626,11 +619,7 @@ class TaskDetails(tk.Frame):
             .attributes_register()[task]
             .name,
             master=self,
-        ):
-            return
-
-        broker = event_broker.get_singleton()
-        broker.publish(event_broker.SystemModified())
+        )
 
     def _open_supertask_hierarchy_creation_window(self) -> None:
         assert self._task is not None
@@ -3,6 +3,9 @@ import math
 from collections.abc import Generator, Iterable, Sequence
 
 from graft.domain import tasks
+from graft.layers.presentation.tkinter_gui.layered_graph_drawing.layer_ordering.utils import (
+    count_crossings,
+)
 from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.depth_position_assignment.implementation.depth_graph import (
     get_constrained_depth_graph,
 )
@@ -35,19 +38,23 @@ class Hierarchy:
         return self._subtask_index
 
 
-def _do_hierarchies_intersect(hierarchy1: Hierarchy, hierarchy2: Hierarchy, /) -> bool:
-    return math.isclose(
-        hierarchy1.dependency_position, hierarchy2.dependency_position
-    ) and (
-        (
-            (hierarchy1.supertask_depth_index < hierarchy2.supertask_depth_index)
-            and (hierarchy1.subtask_depth_index > hierarchy2.subtask_depth_index)
-        )
-        or (
-            (hierarchy1.supertask_depth_index > hierarchy2.supertask_depth_index)
-            and (hierarchy1.subtask_depth_index < hierarchy2.subtask_depth_index)
-        )
-    )
+def _group_hierarchies_by_dependency_position(
+    hierarchies: Iterable[Hierarchy],
+) -> Generator[list[Hierarchy], None, None]:
+    """Group hierarchies with close dependency positions, as only they can intersect."""
+    group = list[Hierarchy]()
+    for hierarchy in sorted(
+        hierarchies, key=lambda hierarchy: hierarchy.dependency_position
+    ):
+        if group and not math.isclose(
+            group[-1].dependency_position, hierarchy.dependency_position
+        ):
+            yield group
+            group = []
+        group.append(hierarchy)
+
+    if group:
+        yield group
 
 
 def _get_hierarchies(
@@ -80,9 +87,11 @@ def _get_number_of_intersecting_hierarchies_between_layers(
         supertask_layer=supertask_layer, subtask_layer=subtask_layer, graph=graph
     )
     return sum(
-        1
-        for hierarchy1, hierarchy2 in itertools.combinations(hierarchies, 2)
-        if _do_hierarchies_intersect(hierarchy1, hierarchy2)
+        count_crossings(
+            (hierarchy.supertask_depth_index, hierarchy.subtask_depth_index)
+            for hierarchy in group
+        )
+        for group in _group_hierarchies_by_dependency_position(hierarchies)
     )
 
 
@@ -1,6 +1,10 @@
-from collections.abc import Mapping
+import dataclasses
+import functools
+import statistics
+from collections.abc import Mapping, Sequence
 
 from graft.domain import tasks
+from graft.layers.presentation.tkinter_gui.helpers import layout_process_pool
 from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.depth_position_assignment.implementation.component_separation import (
     get_depth_positions_with_component_adjustment,
 )
@@ -22,51 +26,205 @@ from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.radius imp
 )
 
 
+def _is_component_unchanged(
+    component: tasks.IUnconstrainedNetworkGraphView,
+    previous_graph: tasks.IUnconstrainedNetworkGraphView,
+) -> bool:
+    """Check if a component of the graph was also a component of the previous graph.
+
+    Components contain all the tasks related to their tasks, so a component is
+    unchanged if the relationships of all its tasks are.
+    """
+    return all(
+        task in previous_graph.tasks()
+        and component.hierarchy_graph().supertasks(task)
+        == previous_graph.hierarchy_graph().supertasks(task)
+        and component.hierarchy_graph().subtasks(task)
+        == previous_graph.hierarchy_graph().subtasks(task)
+        and component.dependency_graph().dependee_tasks(task)
+        == previous_graph.dependency_graph().dependee_tasks(task)
+        and component.dependency_graph().dependent_tasks(task)
+        == previous_graph.dependency_graph().dependent_tasks(task)
+        for task in component.tasks()
+    )
+
+
+def _move_to_previous_depth_positions(
+    task_to_depth_position_map: Mapping[tasks.UID, float],
+    previous_depth_positions: Mapping[tasks.UID, float],
+) -> dict[tasks.UID, float]:
+    """Move a component to where most of its tasks were previously.
+
+    This keeps the component in the same place relative to other components
+    when they're separated.
+    """
+    offsets = [
+        previous_depth_positions[task] - position
+        for task, position in task_to_depth_position_map.items()
+        if task in previous_depth_positions
+    ]
+    offset = statistics.median(offsets) if offsets else 0
+    return {
+        task: position + offset for task, position in task_to_depth_position_map.items()
+    }
+
+
+@dataclasses.dataclass(frozen=True)
+class _EncodedComponent:
+    """A component with its tasks replaced by indexes, so it's cheap to pickle."""
+
+    subtasks: Sequence[Sequence[int]]
+    dependent_tasks: Sequence[Sequence[int]]
+    relation_layers: Sequence[TaskRelationLayers]
+
+
+def _encode_component(
+    component: tasks.IUnconstrainedNetworkGraphView,
+    task_to_relation_layers_map: Mapping[tasks.UID, TaskRelationLayers],
+) -> tuple[list[tasks.UID], _EncodedComponent]:
+    """Encode a component, returning its tasks in the order of their indexes."""
+    component_tasks = list(component.tasks())
+    task_idxs = {task: idx for idx, task in enumerate(component_tasks)}
+    encoded_component = _EncodedComponent(
+        subtasks=[
+            [
+                task_idxs[subtask]
+                for subtask in component.hierarchy_graph().subtasks(task)
+            ]
+            for task in component_tasks
+        ],
+        dependent_tasks=[
+            [
+                task_idxs[dependent_task]
+                for dependent_task in component.dependency_graph().dependent_tasks(task)
+            ]
+            for task in component_tasks
+        ],
+        relation_layers=[task_to_relation_layers_map[task] for task in component_tasks],
+    )
+    return component_tasks, encoded_component
+
+
+def _calculate_component_depth_positions(
+    component: tasks.IUnconstrainedNetworkGraphView,
+    task_to_relation_layers_map: Mapping[tasks.UID, TaskRelationLayers],
+    task_cylinder_radius: Radius,
+) -> dict[tasks.UID, float]:
+    (
+        graph_with_dummies,
+        task_or_dummy_to_relation_layers_map,
+    ) = generate_graph_with_dummy_tasks(component, task_to_relation_layers_map)
+    task_or_dummy_to_depth_index_map = (
+        get_depth_indexes_neighbour_median_and_transpose_method(
+            graph_with_dummies, task_or_dummy_to_relation_layers_map
+        )
+    )
+    task_or_dummy_to_depth_position_map = get_depth_positions_priority_method(
+        graph=graph_with_dummies,
+        task_to_relation_layers_map=task_or_dummy_to_relation_layers_map,
+        task_to_depth_index_map=task_or_dummy_to_depth_index_map,
+        # TODO: These separation values were pulled out of thin air - more investigation required
+        starting_separation_distance=20 * float(task_cylinder_radius),
+        min_separation_distance=4 * float(task_cylinder_radius),
+    )
+    return {
+        task: position
+        for task, position in task_or_dummy_to_depth_position_map.items()
+        if not isinstance(task, DummyUID)
+    }
+
+
+def _calculate_encoded_component_depth_positions(
+    task_cylinder_radius: Radius, component: _EncodedComponent
+) -> list[float]:
+    """Calculate the depth positions of the tasks of a component, in index order.
+
+    Run in the pool of processes, so must be picklable.
+    """
+    component_tasks = [tasks.UID(idx) for idx in range(len(component.subtasks))]
+    graph = tasks.UnconstrainedNetworkGraph(
+        dependency_graph=tasks.DependencyGraph(
+            (task, [component_tasks[idx] for idx in dependent_task_idxs])
+            for task, dependent_task_idxs in zip(
+                component_tasks, component.dependent_tasks, strict=True
+            )
+        ),
+        hierarchy_graph=tasks.HierarchyGraph(
+            (task, [component_tasks[idx] for idx in subtask_idxs])
+            for task, subtask_idxs in zip(
+                component_tasks, component.subtasks, strict=True
+            )
+        ),
+    )
+    task_to_depth_position_map = _calculate_component_depth_positions(
+        graph,
+        dict(zip(component_tasks, component.relation_layers, strict=True)),
+        task_cylinder_radius=task_cylinder_radius,
+    )
+    return [task_to_depth_position_map[task] for task in component_tasks]
+
+
 def get_depth_positions_unnamed_method(
     graph: tasks.IUnconstrainedNetworkGraphView,
     task_to_relation_layers_map: Mapping[tasks.UID, TaskRelationLayers],
     task_cylinder_radius: Radius,
+    previous_graph: tasks.IUnconstrainedNetworkGraphView | None = None,
+    previous_depth_positions: Mapping[tasks.UID, float] | None = None,
 ) -> dict[tasks.UID, float]:
+    """Get the depth positions of tasks.
+
+    If the previous version of the graph and its depth positions are given,
+    components that haven't changed keep their previous positions, so only the
+    changed components are laid out again.
+    """
     task_to_depth_position_map = dict[tasks.UID, float]()
+    components_tasks = list[list[tasks.UID]]()
+    encoded_components = list[_EncodedComponent]()
 
     # Evaluating each component separately, as their just going to be separated
     # depth-wise later. Avoids the issue where components would originally be located in
     # the same space (leading to some long task relationship lines), and then they'd be
-    # separated, leaving things looking odd
+    # separated, leaving things looking odd. Being separate, they are evaluated in
+    # parallel
     for component in graph.component_subgraphs():
-        component_task_to_relation_layers_map = {
-            task: relation_layers
-            for task, relation_layers in task_to_relation_layers_map.items()
-            if task in component.tasks()
-        }
-        (
-            graph_with_dummies,
-            task_or_dummy_to_relation_layers_map,
-        ) = generate_graph_with_dummy_tasks(
-            component, component_task_to_relation_layers_map
-        )
-        task_or_dummy_to_depth_index_map = (
-            get_depth_indexes_neighbour_median_and_transpose_method(
-                graph_with_dummies, task_or_dummy_to_relation_layers_map
+        if (
+            previous_graph is not None
+            and previous_depth_positions is not None
+            and _is_component_unchanged(component, previous_graph)
+        ):
+            task_to_depth_position_map.update(
+                (task, previous_depth_positions[task]) for task in component.tasks()
             )
+            continue
+
+        component_tasks, encoded_component = _encode_component(
+            component, task_to_relation_layers_map
         )
-        tmp_task_to_depth_position_map = get_depth_positions_priority_method(
-            graph=graph_with_dummies,
-            task_to_relation_layers_map=task_or_dummy_to_relation_layers_map,
-            task_to_depth_index_map=task_or_dummy_to_depth_index_map,
-            # TODO: These separation values were pulled out of thin air - more investigation required
-            starting_separation_distance=20 * float(task_cylinder_radius),
-            min_separation_distance=4 * float(task_cylinder_radius),
-        )
-        tmp_task_to_depth_position_map_without_dummies = {
-            task: position
-            for task, position in tmp_task_to_depth_position_map.items()
-            if not isinstance(task, DummyUID)
-        }
-        task_to_depth_position_map.update(
-            tmp_task_to_depth_position_map_without_dummies
+        components_tasks.append(component_tasks)
+        encoded_components.append(encoded_component)
+
+    components_depth_positions = layout_process_pool.get_singleton().map(
+        functools.partial(
+            _calculate_encoded_component_depth_positions, task_cylinder_radius
+        ),
+        encoded_components,
+        nnodes=sum(map(len, components_tasks)),
+    )
+
+    for component_tasks, component_depth_positions in zip(
+        components_tasks, components_depth_positions, strict=True
+    ):
+        component_task_to_depth_position_map = dict(
+            zip(component_tasks, component_depth_positions, strict=True)
         )
 
+        if previous_depth_positions is not None:
+            component_task_to_depth_position_map = _move_to_previous_depth_positions(
+                component_task_to_depth_position_map, previous_depth_positions
+            )
+
+        task_to_depth_position_map.update(component_task_to_depth_position_map)
+
     return get_depth_positions_with_component_adjustment(
         graph=graph,
         task_to_position_map=task_to_depth_position_map,
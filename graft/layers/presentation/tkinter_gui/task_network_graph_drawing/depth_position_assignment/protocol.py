@@ -16,4 +16,6 @@ class GetDepthPositions(Protocol):
         graph: tasks.IUnconstrainedNetworkGraphView,
         task_to_relation_layers_map: Mapping[tasks.UID, TaskRelationLayers],
         task_cylinder_radius: Radius,
+        previous_graph: tasks.IUnconstrainedNetworkGraphView | None = None,
+        previous_depth_positions: Mapping[tasks.UID, float] | None = None,
     ) -> Mapping[tasks.UID, float]: ...
@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+
 from graft.domain import tasks
 from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.cylinder_position import (
     TaskCylinderPosition,
@@ -21,7 +23,10 @@ from graft.layers.presentation.tkinter_gui.task_network_graph_drawing.template i
 
 
 def calculate_task_positions_unnamed_method(
-    graph: tasks.IUnconstrainedNetworkGraphView, task_cylinder_radius: Radius
+    graph: tasks.IUnconstrainedNetworkGraphView,
+    task_cylinder_radius: Radius,
+    previous_graph: tasks.IUnconstrainedNetworkGraphView | None = None,
+    previous_task_positions: Mapping[tasks.UID, TaskCylinderPosition] | None = None,
 ) -> dict[tasks.UID, TaskCylinderPosition]:
     return calculate_task_positions(
         graph=graph,
@@ -30,4 +35,6 @@ def calculate_task_positions_unnamed_method(
         get_hierarchy_layers=get_hierarchy_layers_topologically_sorted_groups_method,
         get_hierarchy_positions=get_hierarchy_positions_even_spacing_method,
         get_depth_positions=get_depth_positions_unnamed_method,
+        previous_graph=previous_graph,
+        previous_task_positions=previous_task_positions,
     )
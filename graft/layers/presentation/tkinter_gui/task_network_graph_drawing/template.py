@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import Final
 
 from graft.domain import tasks
@@ -33,7 +34,19 @@ def calculate_task_positions(
     get_hierarchy_positions: GetHierarchyPositions,
     get_dependency_positions: GetDependencyPositions,
     get_depth_positions: GetDepthPositions,
+    previous_graph: tasks.IUnconstrainedNetworkGraphView | None = None,
+    previous_task_positions: Mapping[tasks.UID, TaskCylinderPosition] | None = None,
 ) -> dict[tasks.UID, TaskCylinderPosition]:
+    """Calculate the positions of the task cylinders of a network graph.
+
+    If the previous version of the graph and its task positions are given, the
+    layout is updated from them rather than calculated from scratch. Only the
+    depth positions are expensive to calculate, so only they are updated.
+    """
+    if (previous_graph is None) ^ (previous_task_positions is None):
+        msg = "previous_graph and previous_task_positions must be given together"
+        raise ValueError(msg)
+
     dependency_positions = get_dependency_positions(graph=graph)
 
     hierarchy_layers = get_hierarchy_layers(graph=graph)
@@ -55,6 +68,12 @@ def calculate_task_positions(
         graph=graph,
         task_to_relation_layers_map=task_to_relation_layers_map,
         task_cylinder_radius=task_cylinder_radius,
+        previous_graph=previous_graph,
+        previous_depth_positions=None
+        if previous_task_positions is None
+        else {
+            task: position.depth for task, position in previous_task_positions.items()
+        },
     )
 
     return {
@@ -0,0 +1,390 @@
+"""Local HTTP/JSON server, so several tools can share one system.
+
+Writes are queued and applied one at a time by a single writer. Reads are
+served from an immutable snapshot of the system, taken after each write that
+changes it, so any number of them can be handled at once without waiting on
+writes. Responses are computed at most once per snapshot.
+
+Endpoints:
+    GET /tasks                      describe every task
+    GET /tasks/<task>               describe a task
+    GET /tasks/<task>/<subgraph>    describe the tasks in a subgraph of a task,
+                                    one of component, inferior, superior,
+                                    upstream or downstream
+    GET /priority                   active concrete tasks by priority
+    POST /commands                  run a command, or a list of commands
+                                    together, as accepted by the CLI
+
+Every response has an ETag of the system version. GET requests with a matching
+If-None-Match header get 304 Not Modified, and POST requests with an If-Match
+header that doesn't match get 412 Precondition Failed, so clients don't
+overwrite changes they haven't seen.
+
+Invalid commands get 400 Bad Request, and commands that conflict with the
+current state of the system, such as ones that would introduce a cycle, get
+409 Conflict. Any other error is a bug, so gets 500 Internal Server Error.
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import http
+import json
+import logging
+import urllib.parse
+from collections.abc import Callable, Mapping, Sequence
+from typing import Final
+
+from graft import architecture, domain, json_api
+from graft.domain import tasks
+
+logger: Final = logging.getLogger(__name__)
+
+_MAX_BODY_BYTES: Final = 16 * 1024 * 1024
+
+# Raised when a command has missing or invalid fields
+_INVALID_COMMAND_ERRORS: Final = (
+    KeyError,
+    TypeError,
+    ValueError,
+    tasks.InvalidUIDNumberError,
+)
+
+_SUBGRAPHS: Final[
+    Mapping[str, Callable[[tasks.UID, tasks.NetworkGraphView], tasks.NetworkGraph]]
+] = {
+    "component": lambda task, graph: graph.component_subgraph(task),
+    "inferior": tasks.get_inferior_subgraph,
+    "superior": tasks.get_superior_subgraph,
+    "upstream": lambda task, graph: graph.upstream_subgraph([task]),
+    "downstream": lambda task, graph: graph.downstream_subgraph([task]),
+}
+
+
+class _HTTPError(Exception):
+    """Request can't be handled, and should get an error response."""
+
+    def __init__(self, status: http.HTTPStatus, message: str) -> None:
+        self.status = status
+        super().__init__(message)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Request:
+    method: str
+    path: str
+    headers: Mapping[str, str]
+    body: bytes
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "").lower() != "close"
+
+
+@dataclasses.dataclass(frozen=True)
+class _Response:
+    status: http.HTTPStatus
+    body: bytes = b""
+    etag: str | None = None
+
+    def encode(self, *, keep_alive: bool) -> bytes:
+        lines = [f"HTTP/1.1 {self.status.value} {self.status.phrase}"]
+        if self.status is not http.HTTPStatus.NOT_MODIFIED:
+            lines.append("Content-Type: application/json")
+            lines.append(f"Content-Length: {len(self.body)}")
+        if self.etag is not None:
+            lines.append(f"ETag: {self.etag}")
+        if not keep_alive:
+            lines.append("Connection: close")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + self.body
+
+
+def _error_response(status: http.HTTPStatus, e: Exception) -> _Response:
+    # Errors are described as by the CLI, except HTTP errors, which are
+    # described by their status
+    error = status.phrase if isinstance(e, _HTTPError) else e.__class__.__name__
+    return _Response(
+        status=status, body=json.dumps({"error": error, "message": str(e)}).encode()
+    )
+
+
+def _get_error_status(e: Exception) -> http.HTTPStatus:
+    """Get the status of the error response for an exception raised by a request."""
+    if isinstance(e, _HTTPError):
+        return e.status
+
+    if isinstance(e, _INVALID_COMMAND_ERRORS):
+        return http.HTTPStatus.BAD_REQUEST
+
+    if isinstance(e, architecture.StaleSystemError) or type(e).__module__.startswith(
+        f"{domain.__name__}."
+    ):
+        return http.HTTPStatus.CONFLICT
+
+    return http.HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+async def _read_request(reader: asyncio.StreamReader) -> _Request | None:
+    """Read a request, or return None if the connection was closed."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+
+    try:
+        method, target, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise _HTTPError(
+            http.HTTPStatus.BAD_REQUEST, "Malformed request line"
+        ) from None
+
+    headers = dict[str, str]()
+    while (line := await reader.readline()) not in {b"\r\n", b"\n", b""}:
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        content_length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise _HTTPError(
+            http.HTTPStatus.BAD_REQUEST, "Malformed Content-Length"
+        ) from None
+    if not 0 <= content_length <= _MAX_BODY_BYTES:
+        raise _HTTPError(
+            http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body is too large"
+        )
+
+    return _Request(
+        method=method,
+        path=urllib.parse.urlsplit(target).path,
+        headers=headers,
+        body=await reader.readexactly(content_length),
+    )
+
+
+def _parse_task(text: str, system: tasks.SystemView) -> tasks.UID:
+    try:
+        task = tasks.UID(int(text))
+    except ValueError:
+        raise _HTTPError(http.HTTPStatus.NOT_FOUND, f"Invalid task [{text}]") from None
+
+    if task not in system.tasks():
+        raise _HTTPError(http.HTTPStatus.NOT_FOUND, f"Task [{task}] does not exist")
+
+    return task
+
+
+def _parse_commands(body: bytes) -> Sequence[json_api.Command]:
+    try:
+        commands = json.loads(body)
+    except ValueError as e:
+        raise _HTTPError(http.HTTPStatus.BAD_REQUEST, str(e)) from e
+
+    if isinstance(commands, dict):
+        commands = [commands]
+    if not isinstance(commands, list) or not all(
+        isinstance(command, dict) for command in commands
+    ):
+        raise _HTTPError(
+            http.HTTPStatus.BAD_REQUEST, "Expected a command or list of commands"
+        )
+
+    return commands
+
+
+class _Snapshot:
+    """Immutable snapshot of a system, and the responses computed from it."""
+
+    def __init__(self, snapshot: architecture.SystemSnapshot) -> None:
+        self.system = snapshot.system
+        self.version = snapshot.version
+        self.etag = f'"{snapshot.version}"'
+        self._bodies = dict[str, bytes]()
+
+    def get_body(self, path: str) -> bytes:
+        """Get the body of the response to a GET request for a path.
+
+        Each body is computed at most once, as the snapshot never changes.
+        Concurrent requests may both compute a body, but will get the same one.
+        """
+        if path not in self._bodies:
+            self._bodies[path] = json.dumps(self._get_result(path)).encode()
+        return self._bodies[path]
+
+    def _get_result(self, path: str) -> object:
+        task_system = self.system.task_system()
+        match path.strip("/").split("/"):
+            case ["tasks"]:
+                return json_api.describe_tasks(task_system)
+            case ["tasks", task]:
+                return json_api.describe_task(
+                    task_system, _parse_task(task, task_system)
+                )
+            case ["tasks", task, subgraph] if subgraph in _SUBGRAPHS:
+                graph = _SUBGRAPHS[subgraph](
+                    _parse_task(task, task_system), task_system.network_graph()
+                )
+                return json_api.describe_tasks(task_system, sorted(graph.tasks()))
+            case ["priority"]:
+                return json_api.get_priority_order(self.system)
+            case _:
+                raise _HTTPError(http.HTTPStatus.NOT_FOUND, f"Unknown path [{path}]")
+
+
+@dataclasses.dataclass(frozen=True)
+class _Write:
+    commands: Sequence[json_api.Command]
+    expected_etag: str | None
+    result: asyncio.Future[tuple[list[json_api.Result], _Snapshot]]
+
+
+class Server:
+    """HTTP/JSON server for a logic layer.
+
+    Only the writer uses the logic layer, so it doesn't need to be thread-safe.
+    Readers only use the snapshots it publishes.
+    """
+
+    def __init__(self, logic_layer: architecture.LogicLayer) -> None:
+        """Initialise Server."""
+        self._logic_layer = logic_layer
+        self._snapshot = _Snapshot(self._logic_layer.get_snapshot())
+        self._writes = asyncio.Queue[_Write]()
+
+    def _apply_write(
+        self, commands: Sequence[json_api.Command], expected_etag: str | None
+    ) -> tuple[list[json_api.Result], _Snapshot]:
+        """Apply a write, returning its results and the snapshot after it."""
+        if expected_etag is not None and expected_etag != self._snapshot.etag:
+            raise _HTTPError(
+                http.HTTPStatus.PRECONDITION_FAILED, "System has been modified"
+            )
+
+        if len(commands) == 1:
+            results = json_api.run_command(self._logic_layer, commands[0])
+        else:
+            with self._logic_layer.batch():
+                results = list(json_api.run_commands(self._logic_layer, commands))
+
+        snapshot = self._logic_layer.get_snapshot()
+        if snapshot.version != self._snapshot.version:
+            self._snapshot = _Snapshot(snapshot)
+        return results, self._snapshot
+
+    async def _write_forever(self) -> None:
+        """Apply queued writes one at a time."""
+        while True:
+            write = await self._writes.get()
+            if write.result.cancelled():
+                continue
+
+            try:
+                result = await asyncio.to_thread(
+                    self._apply_write, write.commands, write.expected_etag
+                )
+            except Exception as e:  # noqa: BLE001
+                if not write.result.cancelled():
+                    write.result.set_exception(e)
+            else:
+                if not write.result.cancelled():
+                    write.result.set_result(result)
+
+    async def _read(self, request: _Request) -> _Response:
+        snapshot = self._snapshot
+        if request.headers.get("if-none-match") == snapshot.etag:
+            return _Response(status=http.HTTPStatus.NOT_MODIFIED, etag=snapshot.etag)
+
+        body = await asyncio.to_thread(snapshot.get_body, request.path)
+        return _Response(status=http.HTTPStatus.OK, body=body, etag=snapshot.etag)
+
+    async def _write(self, request: _Request) -> _Response:
+        commands = _parse_commands(request.body)
+        result = asyncio.get_running_loop().create_future()
+        await self._writes.put(
+            _Write(
+                commands=commands,
+                expected_etag=request.headers.get("if-match"),
+                result=result,
+            )
+        )
+        results, snapshot = await result
+        return _Response(
+            status=http.HTTPStatus.OK,
+            body=json.dumps(results).encode(),
+            etag=snapshot.etag,
+        )
+
+    async def _route(self, request: _Request) -> _Response:
+        match request.method, request.path.rstrip("/"):
+            case "GET", _:
+                return await self._read(request)
+            case "POST", "/commands":
+                return await self._write(request)
+            case method, path:
+                msg = f"Method [{method}] is not allowed for path [{path}]"
+                raise _HTTPError(http.HTTPStatus.METHOD_NOT_ALLOWED, msg)
+
+    async def _handle_request(self, request: _Request) -> _Response:
+        try:
+            return await self._route(request)
+        except Exception as e:
+            status = _get_error_status(e)
+            if status is http.HTTPStatus.INTERNAL_SERVER_ERROR:
+                logger.exception(
+                    "Failed to handle request [%s %s]", request.method, request.path
+                )
+            else:
+                logger.info(
+                    "Failed to handle request [%s %s], exception [%s]",
+                    request.method,
+                    request.path,
+                    e,
+                )
+            return _error_response(status, e)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except _HTTPError as e:
+                    # Can't tell where the next request starts, so give up on
+                    # the connection
+                    writer.write(_error_response(e.status, e).encode(keep_alive=False))
+                    await writer.drain()
+                    break
+
+                if request is None:
+                    break
+
+                response = await self._handle_request(request)
+                writer.write(response.encode(keep_alive=request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            # Client went away or sent something unreadable, such as a header
+            # line that's too long
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        """Serve requests until cancelled."""
+        writer_task = asyncio.create_task(self._write_forever())
+        try:
+            server = await asyncio.start_server(self._handle_connection, host, port)
+            logger.info("Serving on [%s:%s]", host, port)
+            async with server:
+                await server.serve_forever()
+        finally:
+            writer_task.cancel()
+
+
+def serve(logic_layer: architecture.LogicLayer, host: str, port: int) -> None:
+    """Serve requests for a logic layer until interrupted."""
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(Server(logic_layer).serve_forever(host=host, port=port))
@@ -1,5 +1,10 @@
+import multiprocessing
+
 import graft
 
 if __name__ == "__main__":
+    # Layouts are calculated in spawned processes, which re-run this frozen
+    # executable, so they must be handled before anything else
+    multiprocessing.freeze_support()
     graft.configure_logging()
     graft.run_gui()
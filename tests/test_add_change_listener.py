@@ -0,0 +1,112 @@
+"""Unit tests for logic.add_change_listener."""
+
+from unittest import mock
+
+import pytest
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_add_change_listener_progress_changed(data_layer_mock: mock.MagicMock) -> None:
+    """Test listeners are told which tasks are affected by a progress change."""
+    supertask = tasks.UID(0)
+    subtask = tasks.UID(1)
+    unrelated_task = tasks.UID(2)
+
+    system = domain.System.empty()
+    system.add_task(supertask)
+    system.add_task(subtask)
+    system.add_task(unrelated_task)
+    system.add_task_hierarchy(supertask=supertask, subtask=subtask)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+    listener = mock.MagicMock()
+    logic_layer.add_change_listener(listener)
+
+    logic_layer.update_concrete_task_progress(
+        task=subtask, progress=tasks.Progress.IN_PROGRESS
+    )
+
+    listener.assert_called_once_with(
+        (
+            domain.changes.ProgressChanged(
+                task=subtask,
+                old=tasks.Progress.NOT_STARTED,
+                new=tasks.Progress.IN_PROGRESS,
+                affected_tasks=frozenset([supertask, subtask]),
+            ),
+        )
+    )
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_add_change_listener_batch(data_layer_mock: mock.MagicMock) -> None:
+    """Test listeners are passed the changes in a batch together once it ends."""
+    dependee_task = tasks.UID(0)
+    dependent_task = tasks.UID(1)
+    name = tasks.Name("Hello world")
+
+    system = domain.System.empty()
+    system.add_task(dependee_task)
+    system.add_task(dependent_task)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+    listener = mock.MagicMock()
+    logic_layer.add_change_listener(listener)
+
+    with logic_layer.batch():
+        logic_layer.update_task_name(task=dependee_task, name=name)
+        logic_layer.create_task_dependency(
+            dependee_task=dependee_task, dependent_task=dependent_task
+        )
+        listener.assert_not_called()
+
+    listener.assert_called_once_with(
+        (
+            domain.changes.NameChanged(
+                task=dependee_task,
+                old=tasks.Name(),
+                new=name,
+                affected_tasks=frozenset([dependee_task]),
+            ),
+            domain.changes.DependencyAdded(
+                dependee_task=dependee_task,
+                dependent_task=dependent_task,
+                affected_tasks=frozenset([dependee_task, dependent_task]),
+            ),
+        )
+    )
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_add_change_listener_batch_rolled_back(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test listeners aren't called for changes in a batch that is rolled back."""
+    task = tasks.UID(0)
+
+    system = domain.System.empty()
+    system.add_task(task)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+    listener = mock.MagicMock()
+    logic_layer.add_change_listener(listener)
+
+    def rename_tasks() -> None:
+        with logic_layer.batch():
+            logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+            logic_layer.update_task_name(task=tasks.UID(1), name=tasks.Name())
+
+    with pytest.raises(tasks.TaskDoesNotExistError):
+        rename_tasks()
+
+    listener.assert_not_called()
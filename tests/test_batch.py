@@ -0,0 +1,98 @@
+"""Unit tests for logic.batch."""
+
+import copy
+from unittest import mock
+
+import pytest
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_batch_success_saves_once(data_layer_mock: mock.MagicMock) -> None:
+    """Test the batch method only saves the system once, at the end."""
+    supertask = tasks.UID(0)
+    subtask = tasks.UID(1)
+    name = tasks.Name("Hello world")
+
+    system = domain.System.empty()
+    system.add_task(supertask)
+    system.add_task(subtask)
+
+    updated_system = copy.deepcopy(system)
+    updated_system.set_task_name(supertask, name)
+    updated_system.add_task_hierarchy(supertask=supertask, subtask=subtask)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    with logic_layer.batch():
+        logic_layer.update_task_name(task=supertask, name=name)
+        logic_layer.create_task_hierarchy(supertask=supertask, subtask=subtask)
+        data_layer_mock.save_system.assert_not_called()
+
+    data_layer_mock.save_system.assert_called_once_with(system=updated_system)
+    assert logic_layer.get_system() == domain.SystemView(updated_system)
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_batch_failure_rolls_back(data_layer_mock: mock.MagicMock) -> None:
+    """Test the batch method rolls back every operation if one fails."""
+    task = tasks.UID(0)
+    missing_task = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(task)
+
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    def rename_tasks() -> None:
+        with logic_layer.batch():
+            logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+            logic_layer.update_task_name(task=missing_task, name=tasks.Name("Goodbye"))
+
+    with pytest.raises(tasks.TaskDoesNotExistError):
+        rename_tasks()
+
+    data_layer_mock.save_system.assert_not_called()
+    assert logic_layer.get_system() == domain.SystemView(original_system)
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_batch_create_task_does_not_save_partial_batch(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test creating a task in a batch marks its UID used without saving the batch."""
+    existing_task = tasks.UID(0)
+    new_task = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(existing_task)
+
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+    data_layer_mock.load_next_unused_task.return_value = new_task
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    def create_and_delete_tasks() -> None:
+        with logic_layer.batch():
+            assert logic_layer.create_task() == new_task
+            data_layer_mock.save_system_and_indicate_task_used.assert_called_once_with(
+                system=original_system, used_task=new_task
+            )
+            logic_layer.delete_task(tasks.UID(2))
+
+    with pytest.raises(tasks.TaskDoesNotExistError):
+        create_and_delete_tasks()
+
+    data_layer_mock.save_system.assert_not_called()
+    assert logic_layer.get_system() == domain.SystemView(original_system)
@@ -0,0 +1,108 @@
+"""Unit tests for `LogicLayer.check_create_task_dependency`."""
+
+import copy
+from unittest import mock
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_check_create_dependency_allowed(data_layer_mock: mock.MagicMock) -> None:
+    """Test the check_create_dependency method allows a valid dependency."""
+    dependee_task = tasks.UID(0)
+    dependent_task = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(dependee_task)
+    system.add_task(dependent_task)
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    verdict = logic_layer.check_create_task_dependency(
+        dependee_task=dependee_task, dependent_task=dependent_task
+    )
+
+    assert verdict
+    assert verdict.error is None
+    assert logic_layer.get_system() == domain.SystemView(original_system)
+    assert data_layer_mock.save_system.called is False
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_check_create_dependency_not_allowed_task_not_exist(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the check_create_dependency method reports a missing task."""
+    dependee_task = tasks.UID(0)
+    absent_dependent_task = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(dependee_task)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    verdict = logic_layer.check_create_task_dependency(
+        dependee_task=dependee_task, dependent_task=absent_dependent_task
+    )
+
+    assert not verdict
+    assert isinstance(verdict.error, tasks.TaskDoesNotExistError)
+    assert verdict.error.task == absent_dependent_task
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_check_create_dependency_not_allowed_dependee_incomplete(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the check_create_dependency method catches a started dependent task."""
+    dependee_task = tasks.UID(0)
+    dependent_task = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(dependee_task)
+    system.add_task(dependent_task)
+    system.set_task_progress(dependent_task, tasks.Progress.IN_PROGRESS)
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    verdict = logic_layer.check_create_task_dependency(
+        dependee_task=dependee_task, dependent_task=dependent_task
+    )
+
+    assert not verdict
+    assert isinstance(verdict.error, tasks.DependeeIncompleteDependentStartedError)
+    assert logic_layer.get_system() == domain.SystemView(original_system)
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_check_create_dependencies(data_layer_mock: mock.MagicMock) -> None:
+    """Test the check_create_dependencies method checks each candidate."""
+    task0 = tasks.UID(0)
+    task1 = tasks.UID(1)
+    task2 = tasks.UID(2)
+
+    system = domain.System.empty()
+    for task in [task0, task1, task2]:
+        system.add_task(task)
+    system.add_task_dependency(dependee_task=task0, dependent_task=task1)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    verdicts = logic_layer.check_create_task_dependencies(
+        [(task1, task2), (task1, task0), (task0, task1), (task0, task0)]
+    )
+
+    assert [verdict.is_allowed for verdict in verdicts] == [True, False, False, False]
+    assert data_layer_mock.save_system.called is False
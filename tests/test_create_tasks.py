@@ -0,0 +1,58 @@
+"""Unit tests for logic.create_tasks."""
+
+import copy
+from unittest import mock
+
+import pytest
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_create_tasks_success(data_layer_mock: mock.MagicMock) -> None:
+    """Test the create_tasks method reserves UIDs and saves once."""
+    new_tasks = [tasks.UID(0), tasks.UID(1)]
+    names = [tasks.Name("Hello"), tasks.Name("World")]
+
+    empty_system = domain.System.empty()
+
+    system_with_two_tasks = copy.deepcopy(empty_system)
+    for task, name in zip(new_tasks, names, strict=True):
+        system_with_two_tasks.add_task(task)
+        system_with_two_tasks.set_task_name(task, name)
+
+    data_layer_mock.load_system.return_value = empty_system
+    data_layer_mock.load_next_unused_tasks.return_value = new_tasks
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    assert logic_layer.create_tasks(number=2, names=names) == new_tasks
+
+    data_layer_mock.load_next_unused_tasks.assert_called_once_with(2)
+    data_layer_mock.load_next_unused_task.assert_not_called()
+    data_layer_mock.save_system_and_indicate_tasks_used.assert_called_once_with(
+        system=system_with_two_tasks, used_tasks=new_tasks
+    )
+    data_layer_mock.save_system_and_indicate_task_used.assert_not_called()
+    assert logic_layer.get_system() == domain.SystemView(system_with_two_tasks)
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_create_tasks_failure_mismatched_names(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the create_tasks method fails when given the wrong number of names."""
+    empty_system = domain.System.empty()
+
+    data_layer_mock.load_system.return_value = empty_system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    with pytest.raises(ValueError, match="Number of names"):
+        logic_layer.create_tasks(number=2, names=[tasks.Name("Hello")])
+
+    data_layer_mock.load_next_unused_tasks.assert_not_called()
+    data_layer_mock.save_system_and_indicate_tasks_used.assert_not_called()
+    assert logic_layer.get_system() == domain.SystemView(empty_system)
@@ -0,0 +1,81 @@
+"""Unit tests for logic.get_active_concrete_tasks_in_descending_priority_order."""
+
+from unittest import mock
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_active_concrete_tasks_in_descending_priority_order_success(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the method returns the active tasks with the highest priority first."""
+    low_task = tasks.UID(0)
+    high_task = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(low_task)
+    system.set_task_importance(low_task, tasks.Importance.LOW)
+    system.add_task(high_task)
+    system.set_task_importance(high_task, tasks.Importance.HIGH)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    assert logic_layer.get_active_concrete_tasks_in_descending_priority_order() == [
+        (
+            high_task,
+            tasks.Importance.HIGH,
+            tasks.Importance.HIGH,
+            tasks.Progress.NOT_STARTED,
+        ),
+        (
+            low_task,
+            tasks.Importance.LOW,
+            tasks.Importance.LOW,
+            tasks.Progress.NOT_STARTED,
+        ),
+    ]
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_active_concrete_tasks_in_descending_priority_order_cached(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the caching decorator only recomputes the order when it may change."""
+    task = tasks.UID(0)
+
+    system = domain.System.empty()
+    system.add_task(task)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.CachingDecoratorLogicLayer(
+        handler=logic.StandardLogicLayer(data_layer=data_layer_mock)
+    )
+
+    with mock.patch(
+        "graft.domain.get_active_concrete_tasks_in_descending_priority_order",
+        wraps=domain.get_active_concrete_tasks_in_descending_priority_order,
+    ) as get_priority_order_spy:
+        logic_layer.get_active_concrete_tasks_in_descending_priority_order()
+        logic_layer.get_active_concrete_tasks_in_descending_priority_order()
+        assert get_priority_order_spy.call_count == 1
+
+        logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+        logic_layer.get_active_concrete_tasks_in_descending_priority_order()
+        assert get_priority_order_spy.call_count == 1
+
+        call_count_before_progress_change = get_priority_order_spy.call_count
+        logic_layer.update_concrete_task_progress(
+            task=task, progress=tasks.Progress.IN_PROGRESS
+        )
+        assert logic_layer.get_active_concrete_tasks_in_descending_priority_order() == [
+            (task, None, None, tasks.Progress.IN_PROGRESS)
+        ]
+        assert (
+            get_priority_order_spy.call_count == call_count_before_progress_change + 1
+        )
@@ -0,0 +1,144 @@
+"""Unit tests for `System.get_snapshot`."""
+
+import copy
+import threading
+from unittest import mock
+
+import pytest
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_snapshot_unchanged_by_later_operations(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the get_snapshot method returns a snapshot later operations don't change."""
+    task = tasks.UID(0)
+
+    system = domain.System.empty()
+    system.add_task(task)
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    snapshot = logic_layer.get_snapshot()
+    logic_layer.update_task_name(task=task, name=tasks.Name("foo"))
+
+    assert snapshot.version == 0
+    assert snapshot.system == domain.SystemView(original_system)
+    assert logic_layer.get_snapshot().version == 1
+    assert logic_layer.get_snapshot().system == logic_layer.get_system()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_snapshot_not_published_for_failed_operation(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the get_snapshot method ignores operations that fail."""
+    data_layer_mock.load_system.return_value = domain.System.empty()
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    snapshot = logic_layer.get_snapshot()
+    with pytest.raises(tasks.TaskDoesNotExistError):
+        logic_layer.delete_task(tasks.UID(0))
+
+    assert logic_layer.get_snapshot() is snapshot
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_snapshot_published_once_per_batch(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the get_snapshot method only shows a batch once it ends."""
+    task0 = tasks.UID(0)
+    task1 = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(task0)
+    system.add_task(task1)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    with logic_layer.batch():
+        logic_layer.create_task_hierarchy(supertask=task0, subtask=task1)
+        logic_layer.update_task_name(task=task0, name=tasks.Name("foo"))
+        assert logic_layer.get_snapshot().version == 0
+
+    snapshot = logic_layer.get_snapshot()
+    assert snapshot.version == 1
+    assert (
+        task1
+        in snapshot.system.task_system()
+        .network_graph()
+        .hierarchy_graph()
+        .subtasks(task0)
+    )
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_snapshot_read_from_other_thread(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test snapshots can be read from another thread while the system changes."""
+    data_layer_mock.load_system.return_value = domain.System.empty()
+    data_layer_mock.load_next_unused_task.side_effect = map(tasks.UID, range(100))
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    is_done = threading.Event()
+    task_counts = list[tuple[int, int]]()
+
+    def read() -> None:
+        while not is_done.is_set():
+            snapshot = logic_layer.get_snapshot()
+            task_counts.append(
+                (snapshot.version, len(snapshot.system.task_system().tasks()))
+            )
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for _ in range(100):
+            logic_layer.create_task()
+    finally:
+        is_done.set()
+        reader.join()
+
+    # Each task is created by its own operation, so each snapshot has as many
+    # tasks as its version
+    assert all(version == count for version, count in task_counts)
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_get_snapshot_adds_no_clones(data_layer_mock: mock.MagicMock) -> None:
+    """Test snapshots don't make operations clone the system any more often.
+
+    The saved system shares the system too, so each operation clones it once
+    whether or not snapshots are taken.
+    """
+    task = tasks.UID(0)
+
+    def count_clones(*, is_snapshot_taken: bool) -> int:
+        system = domain.System.empty()
+        system.add_task(task)
+        data_layer_mock.load_system.return_value = system
+        logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+        with mock.patch.object(
+            tasks.System, "clone", autospec=True, side_effect=tasks.System.clone
+        ) as clone_mock:
+            for name in ("foo", "bar", "baz"):
+                logic_layer.update_task_name(task=task, name=tasks.Name(name))
+                if is_snapshot_taken:
+                    logic_layer.get_snapshot()
+        return clone_mock.call_count
+
+    assert count_clones(is_snapshot_taken=True) == count_clones(is_snapshot_taken=False)
@@ -0,0 +1,48 @@
+"""Unit tests for `json_stream`, the incremental JSON object reader and writer."""
+
+import io
+import json
+
+import pytest
+
+from graft.layers.data.local_files import json_stream
+
+_ITEMS = [
+    ("1", {"name": "Hello world", "progress": None, "importance": "high"}),
+    ("23", [-12345.678e-9, 1e100, 0, -0.5, 987654321]),
+    ("456", {"nested": {"deeper": [1, [2, [3.25]]], "empty": {}}}),
+    ('key with "quotes" and \\ slashes', "value with unicode é and \n lines"),
+    ("7890", 1234567890123456789),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+def test_object_items_round_trip_across_chunk_boundaries(
+    chunk_size: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test items read back are unchanged when values straddle chunk boundaries."""
+    monkeypatch.setattr(json_stream, "_READ_CHUNK_SIZE_CHARACTERS", chunk_size)
+
+    file = io.StringIO()
+    json_stream.dump_object_items(_ITEMS, file)
+    file.seek(0)
+
+    assert list(json_stream.load_object_items(file)) == _ITEMS
+
+
+def test_dump_object_items_matches_json_dumps() -> None:
+    """Test the text written is the same as json.dumps writes for a dictionary."""
+    file = io.StringIO()
+    json_stream.dump_object_items(_ITEMS, file)
+
+    assert file.getvalue() == json.dumps(dict(_ITEMS))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 64])
+def test_load_object_items_reads_empty_object(
+    chunk_size: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an empty object, with surrounding whitespace, has no items."""
+    monkeypatch.setattr(json_stream, "_READ_CHUNK_SIZE_CHARACTERS", chunk_size)
+
+    assert list(json_stream.load_object_items(io.StringIO(" { \n } "))) == []
@@ -0,0 +1,90 @@
+"""Unit tests for logic.reload_if_stale, and reloading after stale saves."""
+
+import copy
+from unittest import mock
+
+import pytest
+
+from graft import architecture, domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_reload_if_stale_reloads_stale_system(data_layer_mock: mock.MagicMock) -> None:
+    """Test reload_if_stale loads the saved system and drops the undo history."""
+    task = tasks.UID(0)
+    system = domain.System.empty()
+    system.add_task(task)
+    saved_system = copy.deepcopy(system)
+    saved_system.set_task_name(task, tasks.Name("Saved elsewhere"))
+
+    data_layer_mock.load_system.side_effect = [system, saved_system]
+    data_layer_mock.is_system_stale.return_value = True
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+    logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+
+    assert logic_layer.reload_if_stale()
+    assert logic_layer.get_system() == domain.SystemView(saved_system)
+    assert not logic_layer.undo()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_reload_if_stale_does_nothing_if_not_stale(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test reload_if_stale doesn't load the system if it isn't stale."""
+    data_layer_mock.load_system.return_value = domain.System.empty()
+    data_layer_mock.is_system_stale.return_value = False
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    assert not logic_layer.reload_if_stale()
+    data_layer_mock.load_system.assert_called_once()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_stale_save_reloads_system(data_layer_mock: mock.MagicMock) -> None:
+    """Test a save that fails as the system is stale reloads the system."""
+    task = tasks.UID(0)
+    system = domain.System.empty()
+    system.add_task(task)
+    saved_system = copy.deepcopy(system)
+    saved_system.set_task_name(task, tasks.Name("Saved elsewhere"))
+
+    data_layer_mock.load_system.side_effect = [system, saved_system]
+    data_layer_mock.save_system.side_effect = architecture.StaleSystemError
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+    listener = mock.Mock()
+    logic_layer.add_change_listener(listener)
+
+    with pytest.raises(architecture.StaleSystemError):
+        logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+
+    assert logic_layer.get_system() == domain.SystemView(saved_system)
+    assert not logic_layer.undo()
+    listener.assert_called_once()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_stale_save_in_batch_reloads_system_after_batch(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test a stale save at the end of a batch reloads once the batch has ended."""
+    task = tasks.UID(0)
+    system = domain.System.empty()
+    system.add_task(task)
+    saved_system = copy.deepcopy(system)
+    saved_system.set_task_name(task, tasks.Name("Saved elsewhere"))
+
+    data_layer_mock.load_system.side_effect = [system, saved_system]
+    data_layer_mock.save_system.side_effect = architecture.StaleSystemError
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    with pytest.raises(architecture.StaleSystemError), logic_layer.batch():
+        logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+
+    assert logic_layer.get_system() == domain.SystemView(saved_system)
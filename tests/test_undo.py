@@ -0,0 +1,107 @@
+"""Unit tests for logic.undo and logic.redo."""
+
+import copy
+from unittest import mock
+
+from graft import domain
+from graft.domain import tasks
+from graft.layers import logic
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_undo_and_redo_update_task_name(data_layer_mock: mock.MagicMock) -> None:
+    """Test the undo and redo methods revert and reapply a name update."""
+    task = tasks.UID(0)
+    name = tasks.Name("Hello world")
+
+    system = domain.System.empty()
+    system.add_task(task)
+
+    original_system = copy.deepcopy(system)
+    named_system = copy.deepcopy(system)
+    named_system.set_task_name(task, name)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    logic_layer.update_task_name(task=task, name=name)
+
+    assert logic_layer.undo()
+    data_layer_mock.save_system.assert_called_with(system=original_system)
+    assert logic_layer.get_system() == domain.SystemView(original_system)
+    assert not logic_layer.undo()
+
+    assert logic_layer.redo()
+    data_layer_mock.save_system.assert_called_with(system=named_system)
+    assert logic_layer.get_system() == domain.SystemView(named_system)
+    assert not logic_layer.redo()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_undo_delete_task_restores_attributes(data_layer_mock: mock.MagicMock) -> None:
+    """Test the undo method restores a deleted task along with its attributes."""
+    task = tasks.UID(0)
+
+    system = domain.System.empty()
+    system.add_task(task)
+    system.set_task_name(task, tasks.Name("Hello world"))
+    system.set_task_progress(task, tasks.Progress.COMPLETED)
+    system.set_task_importance(task, tasks.Importance.HIGH)
+
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    logic_layer.delete_task(task)
+
+    assert logic_layer.undo()
+    assert logic_layer.get_system() == domain.SystemView(original_system)
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_undo_batch_reverts_all_operations(data_layer_mock: mock.MagicMock) -> None:
+    """Test the undo method reverts every operation in a batch at once."""
+    supertask = tasks.UID(0)
+    subtask = tasks.UID(1)
+
+    system = domain.System.empty()
+    system.add_task(supertask)
+    system.add_task(subtask)
+
+    original_system = copy.deepcopy(system)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+
+    with logic_layer.batch():
+        logic_layer.update_task_name(task=supertask, name=tasks.Name("Hello world"))
+        logic_layer.create_task_hierarchy(supertask=supertask, subtask=subtask)
+
+    assert logic_layer.undo()
+    assert logic_layer.get_system() == domain.SystemView(original_system)
+    assert not logic_layer.undo()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_undo_forgets_operations_over_memory_budget(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the oldest operations can't be undone once over the memory budget."""
+    task = tasks.UID(0)
+
+    system = domain.System.empty()
+    system.add_task(task)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(
+        data_layer=data_layer_mock, undo_memory_budget_bytes=0
+    )
+
+    logic_layer.update_task_name(task=task, name=tasks.Name("Hello world"))
+
+    assert not logic_layer.undo()
@@ -72,3 +72,50 @@ def test_update_task_name_failure_task_does_not_exist(
 
     data_layer_mock.load_system.assert_called_once_with()
     data_layer_mock.save_system.assert_not_called()
+
+
+@mock.patch("graft.architecture.data.DataLayer", autospec=True)
+def test_update_task_name_affects_related_tasks(
+    data_layer_mock: mock.MagicMock,
+) -> None:
+    """Test the tasks related to a renamed task are affected, as they show its name."""
+    task = tasks.UID(0)
+    subtask = tasks.UID(1)
+    supertask = tasks.UID(2)
+    dependee_task = tasks.UID(3)
+    dependent_task = tasks.UID(4)
+    unrelated_task = tasks.UID(5)
+    name = tasks.Name("Hello world")
+
+    system = domain.System.empty()
+    system.add_task(task)
+    system.add_task(subtask)
+    system.add_task(supertask)
+    system.add_task(dependee_task)
+    system.add_task(dependent_task)
+    system.add_task(unrelated_task)
+    system.add_task_hierarchy(supertask=task, subtask=subtask)
+    system.add_task_hierarchy(supertask=supertask, subtask=task)
+    system.add_task_dependency(dependee_task=dependee_task, dependent_task=task)
+    system.add_task_dependency(dependee_task=task, dependent_task=dependent_task)
+
+    data_layer_mock.load_system.return_value = system
+
+    logic_layer = logic.StandardLogicLayer(data_layer=data_layer_mock)
+    listener = mock.MagicMock()
+    logic_layer.add_change_listener(listener)
+
+    logic_layer.update_task_name(task=task, name=name)
+
+    listener.assert_called_once_with(
+        (
+            domain.changes.NameChanged(
+                task=task,
+                old=tasks.Name(),
+                new=name,
+                affected_tasks=frozenset(
+                    [task, subtask, supertask, dependee_task, dependent_task]
+                ),
+            ),
+        )
+    )